@@ -0,0 +1,61 @@
+import os
+from dataclasses import asdict, dataclass
+
+from sqlalchemy.orm import sessionmaker
+
+from config.data_generator import DEFAULT_SEED, GenerationSpec
+from config.data_loader import DataLoader
+from config.database import Base, create_db_engine
+
+# Меняется вместе с правилами генерации и схемой: старые файлы данных не переиспользуются
+DATASET_VERSION = 4
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    books: int
+    seed: int = DEFAULT_SEED
+
+    def generation(self) -> GenerationSpec:
+        # Объёмы остальных таблиц — по умолчанию генератора, от числа книг
+        return GenerationSpec(books=self.books, seed=self.seed)
+
+    def counts(self) -> dict:
+        return self.generation().counts()
+
+    def filename(self) -> str:
+        return f"library-v{DATASET_VERSION}-{self.books}-{self.seed}.sqlite"
+
+
+def populate(engine, spec: DatasetSpec) -> dict:
+    """Создаёт схему и заполняет пустую базу строками spec генератором DataLoader; возвращает их количество."""
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        DataLoader(db).generate(spec.generation(), resume=False)
+    finally:
+        db.close()
+    return spec.counts()
+
+
+def build_dataset(spec: DatasetSpec, data_dir: str = DEFAULT_DATA_DIR, rebuild: bool = False) -> str:
+    """Путь к файлу SQLite с набором spec; файл собирается один раз и потом переиспользуется."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, spec.filename())
+    if os.path.exists(path) and not rebuild:
+        return path
+    partial = path + ".partial"
+    if os.path.exists(partial):
+        os.remove(partial)
+    engine = create_db_engine(f"sqlite:///{partial}")
+    try:
+        populate(engine, spec)
+    finally:
+        engine.dispose()
+    os.replace(partial, path)
+    return path
+
+
+def describe(spec: DatasetSpec) -> dict:
+    return {**asdict(spec), "version": DATASET_VERSION, "rows": spec.counts()}
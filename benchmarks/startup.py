@@ -0,0 +1,90 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, Optional
+from urllib.error import URLError
+from urllib.request import urlopen
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Бюджет холодного старта: от запуска процесса до первого обслуженного запроса
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5"))
+DEFAULT_RUNS = 3
+PROBE_PATH = "/health"
+
+_IMPORT_SCRIPT = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _environ(overrides: Optional[Dict[str, str]]) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update(overrides or {})
+    return env
+
+
+def measure_import(env: Optional[Dict[str, str]] = None) -> float:
+    """Время `import main` в новом процессе: доля старта до lifespan."""
+    output = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], cwd=ROOT, env=_environ(env),
+                            capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_response(env: Optional[Dict[str, str]] = None, timeout: float = 30.0) -> float:
+    """Секунды от запуска uvicorn до первого ответа 200 на /health.
+
+    Сюда входят запуск интерпретатора, импорт приложения и весь lifespan:
+    подготовка схемы, тестовые данные, прогрев кэшей.
+    """
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}{PROBE_PATH}"
+    command = [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+               "--log-level", "warning"]
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, env=_environ(env), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    try:
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited with code {process.returncode}: {process.stderr.read().decode()[-2000:]}")
+            try:
+                with urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (URLError, OSError):
+                pass
+            if time.perf_counter() - started > timeout:
+                raise TimeoutError(f"no response from {url} within {timeout:g}s")
+            time.sleep(0.01)
+    finally:
+        process.terminate()
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stderr.close()
+
+
+def run_startup(runs: int = DEFAULT_RUNS, budget: float = STARTUP_BUDGET_SECONDS,
+                env: Optional[Dict[str, str]] = None, progress=None) -> dict:
+    """Несколько холодных стартов подряд; в бюджет должен укладываться худший."""
+    first_response, imports = [], []
+    for run in range(runs):
+        imports.append(measure_import(env))
+        first_response.append(measure_first_response(env))
+        if progress:
+            progress(f"run {run + 1}: import {imports[-1]:.3f}s, first response {first_response[-1]:.3f}s")
+    return {
+        "runs": runs,
+        "import_median_s": round(statistics.median(imports), 3),
+        "first_response_median_s": round(statistics.median(first_response), 3),
+        "first_response_max_s": round(max(first_response), 3),
+        "budget_s": budget,
+        "within_budget": max(first_response) <= budget,
+    }
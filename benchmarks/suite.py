@@ -0,0 +1,238 @@
+import json
+import platform
+import statistics
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import sqlalchemy
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.dataset import DEFAULT_DATA_DIR, DEFAULT_SEED, DatasetSpec, build_dataset, describe
+from config.cache import get_entity_cache
+from config.categories import CategoryDirectory, get_category_directory, set_category_directory
+from config.database import create_db_engine
+from config.versions import DatabaseVersionStore, get_version_store, set_version_store
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.book_search import BookSearchCriteria
+from repositories.loading import JOINED, SELECTIN
+from repositories.loan_repository import LoanRepository
+from repositories.user_repository import UserRepository
+from services.author_service import AuthorService
+from services.book_service import BookService
+from services.user_service import UserService
+from schemas.book_schema import BookResponse
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = (10000,)
+DEFAULT_REPEAT = 5
+# Замедление медианы больше чем на TOLERANCE и больше чем на MIN_DELTA_MS считается регрессией
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA_MS = 1.0
+
+
+@dataclass(frozen=True)
+class Probe:
+    """Параметры запросов, подобранные под набор: значения, которые в нём точно есть."""
+    author_id: int
+    user_id: int
+    title_term: str = "мир"
+    title_search: str = "тихий город"
+    name_term: str = "ов"
+
+
+def _probe(spec: DatasetSpec) -> Probe:
+    # Автор 1 — самый плодовитый, читатель 1 — самый активный из-за перекоса распределений:
+    # худший случай выборки по автору и по читателю
+    return Probe(author_id=1, user_id=1)
+
+
+# Страница списка книг, на которой мерится сериализация
+SERIALIZE_PAGE_SIZE = 1000
+_BOOK_LIST = TypeAdapter(List[BookResponse])
+
+
+def _serialize(page, response_class):
+    """Путь ответа FastAPI со списком BookResponse: проверка модели, dump в JSON-типы, кодирование."""
+    items = _BOOK_LIST.validate_python(page.items)
+    response_class(_BOOK_LIST.dump_python(items, mode="json"))
+    return page
+
+
+# Имя -> (сессия, Probe) -> результат; список или Page
+CASES: Dict[str, Callable] = {
+    "book_repository.find_all": lambda db, p: BookRepository(db).find_all(),
+    "book_repository.find_all[joined]": lambda db, p: BookRepository(db, JOINED).find_all(),
+    "book_repository.find_page": lambda db, p: BookRepository(db).find_page(limit=100),
+    "book_repository.find_by_title_containing": lambda db, p: BookRepository(db).find_by_title_containing(p.title_term),
+    "book_repository.search_by_title": lambda db, p: BookRepository(db).search_by_title(p.title_search),
+    "book_repository.find_by_author_id": lambda db, p: BookRepository(db).find_by_author_id(p.author_id),
+    "book_repository.find_available_books": lambda db, p: BookRepository(db).find_available_books(),
+    "book_repository.find_overdue_books": lambda db, p: BookRepository(db).find_overdue_books(),
+    "book_repository.find_overdue_page": lambda db, p: BookRepository(db).find_overdue_page(limit=100),
+    "author_repository.search_by_name": lambda db, p: AuthorRepository(db).search_by_name(p.name_term),
+    "author_repository.find_authors_with_books": lambda db, p: AuthorRepository(db).find_authors_with_books(),
+    "user_repository.search_by_name": lambda db, p: UserRepository(db).search_by_name(p.name_term),
+    "user_repository.find_users_with_active_loans": lambda db, p: UserRepository(db).find_users_with_active_loans(),
+    "loan_repository.find_open_by_user_id": lambda db, p: LoanRepository(db).find_open_by_user_id(p.user_id),
+    "book_service.find_overdue_books": lambda db, p: BookService(db).find_overdue_books(),
+    "book_service.search": lambda db, p: BookService(db, JOINED).search(
+        BookSearchCriteria(category_ids=[1], available=True, year_from=1950), sort="-year", limit=50
+    ),
+    # До и после: ORM-объекты с подгрузкой связей и json.dumps против проекции столбцов и orjson
+    "serialize.book_page[orm,json]": lambda db, p: _serialize(
+        BookService(db, SELECTIN).find_page(limit=SERIALIZE_PAGE_SIZE), JSONResponse),
+    "serialize.book_page[rows,json]": lambda db, p: _serialize(
+        BookService(db).find_rows_page(limit=SERIALIZE_PAGE_SIZE), JSONResponse),
+    "serialize.book_page[rows,orjson]": lambda db, p: _serialize(
+        BookService(db).find_rows_page(limit=SERIALIZE_PAGE_SIZE), ORJSONResponse),
+    "author_service.search_by_name": lambda db, p: AuthorService(db).search_by_name(p.name_term),
+    "user_service.find_users_with_active_loans": lambda db, p: UserService(db).find_users_with_active_loans(),
+}
+
+
+def select_cases(patterns: Optional[Sequence[str]] = None) -> Dict[str, Callable]:
+    if not patterns:
+        return dict(CASES)
+    return {name: case for name, case in CASES.items() if any(pattern in name for pattern in patterns)}
+
+
+def _row_count(result) -> int:
+    items = getattr(result, "items", result)
+    return len(items) if items is not None else 0
+
+
+def measure(session_factory, case: Callable, probe: Probe, repeat: int = DEFAULT_REPEAT) -> dict:
+    """Время и число SQL-запросов одного случая.
+
+    Каждый прогон идёт в новой сессии с пустым кэшем сущностей, чтобы мерить
+    путь до БД, а не identity map. Первый прогон прогревочный и в замеры не входит.
+    """
+    engine = session_factory.kw["bind"]
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    timings, counts, rows = [], [], 0
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        for run in range(repeat + 1):
+            get_entity_cache().clear()
+            statements.clear()
+            db = session_factory()
+            try:
+                started = time.perf_counter()
+                result = case(db, probe)
+                rows = _row_count(result)
+                elapsed = time.perf_counter() - started
+            finally:
+                db.close()
+            if run:
+                timings.append(elapsed * 1000)
+                counts.append(len(statements))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "max_ms": round(max(timings), 3),
+        "statements": max(counts),
+        "rows": rows,
+        # Цена строки: для списков с сериализацией — главный показатель
+        "per_row_us": round(statistics.median(timings) * 1000 / rows, 3) if rows else None,
+    }
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "sqlite": sqlite3.sqlite_version,
+    }
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, seed: int = DEFAULT_SEED, repeat: int = DEFAULT_REPEAT,
+              patterns: Optional[Sequence[str]] = None, data_dir: str = DEFAULT_DATA_DIR,
+              progress: Callable[[str], None] = lambda message: None) -> dict:
+    cases = select_cases(patterns)
+    report = {"version": REPORT_VERSION, "environment": environment(), "repeat": repeat,
+              "datasets": {}, "results": {}}
+    for size in sizes:
+        spec = DatasetSpec(books=size, seed=seed)
+        started = time.perf_counter()
+        path = build_dataset(spec, data_dir)
+        progress(f"dataset {size}: {path} ({time.perf_counter() - started:.1f}s)")
+        report["datasets"][str(size)] = describe(spec)
+
+        engine = create_db_engine(f"sqlite:///{path}")
+        session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        probe = _probe(spec)
+        results = report["results"][str(size)] = {}
+        # Версии сущностей и справочник категорий, как в приложении после старта, — но для БД набора
+        previous_store, previous_directory = get_version_store(), get_category_directory()
+        set_version_store(DatabaseVersionStore(engine))
+        directory = CategoryDirectory(engine)
+        directory.load()
+        set_category_directory(directory)
+        try:
+            for name, case in cases.items():
+                results[name] = measure(session_factory, case, probe, repeat)
+                per_row = results[name]["per_row_us"]
+                progress(f"  {name:50s} {results[name]['median_ms']:10.2f} ms "
+                         f"{results[name]['statements']:3d} stmt {results[name]['rows']:8d} rows"
+                         + (f" {per_row:9.2f} us/row" if per_row is not None else ""))
+        finally:
+            set_category_directory(previous_directory)
+            set_version_store(previous_store)
+            engine.dispose()
+    return report
+
+
+@dataclass(frozen=True)
+class Regression:
+    size: str
+    case: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self) -> str:
+        return f"{self.size} {self.case}: {self.metric} {self.baseline} -> {self.current}"
+
+
+def compare(report: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> List[Regression]:
+    """Регрессии отчёта относительно эталона.
+
+    Рост числа запросов — регрессия всегда: он не зависит от машины. Время
+    сравнивается по медиане с допуском tolerance. Случаи и размеры, которых
+    нет в эталоне, пропускаются.
+    """
+    regressions = []
+    for size, results in report["results"].items():
+        expected = baseline.get("results", {}).get(size, {})
+        for case, current in results.items():
+            reference = expected.get(case)
+            if reference is None:
+                continue
+            if current["statements"] > reference["statements"]:
+                regressions.append(Regression(size, case, "statements", reference["statements"], current["statements"]))
+            limit = max(reference["median_ms"] * (1 + tolerance), reference["median_ms"] + min_delta_ms)
+            if current["median_ms"] > limit:
+                regressions.append(Regression(size, case, "median_ms", reference["median_ms"], current["median_ms"]))
+    return regressions
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as stream:
+        return json.load(stream)
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as stream:
+        json.dump(report, stream, ensure_ascii=False, indent=2, sort_keys=True)
+        stream.write("\n")
@@ -0,0 +1,199 @@
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+from config.data_generator import DEFAULT_AS_OF, DEFAULT_SEED, GENERATOR_CHUNK_SIZE
+from config.database import SessionLocal, engine
+from services.import_service import ImportService, FORMATS, detect_format, read_rows
+from services.overdue_sweeper import OVERDUE_SWEEP_BATCH_SIZE, sweep_overdue
+
+
+def import_command(args):
+    fmt = args.format or detect_format(args.path)
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        with open(args.path, encoding="utf-8-sig", newline="") as stream:
+            import_service = ImportService(db, args.chunk_size)
+            rows = read_rows(stream, fmt)
+            if args.entity == "books":
+                report = import_service.import_books(rows)
+            else:
+                report = import_service.import_authors(rows)
+    finally:
+        db.close()
+    elapsed = time.perf_counter() - started
+    
+    for error in report.errors:
+        print(f"row {error.row}: {'; '.join(error.errors)}", file=sys.stderr)
+    total = report.imported + report.failed
+    rate = total / elapsed if elapsed else 0
+    print(f"imported={report.imported} failed={report.failed} elapsed={elapsed:.2f}s rows/s={rate:.0f}")
+    return 1 if report.failed else 0
+
+
+def sweep_overdue_command(args):
+    started = time.perf_counter()
+    updated = sweep_overdue(args.batch_size)
+    print(f"overdue={updated} elapsed={time.perf_counter() - started:.2f}s")
+    return 0
+
+
+def migrate_command(args):
+    from config import migrations
+    if args.downgrade:
+        migrations.downgrade(engine, args.revision)
+    else:
+        migrations.upgrade(engine, args.revision)
+    return 0
+
+
+def seed_command(args):
+    from config.startup import seed_test_data
+    seed_test_data(SessionLocal)
+    return 0
+
+
+def rebuild_author_stats_command(args):
+    from config.unit_of_work import unit_of_work
+    from repositories.author_repository import AuthorRepository
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        with unit_of_work(db):
+            updated = AuthorRepository(db).rebuild_stats()
+    finally:
+        db.close()
+    print(f"authors={updated} elapsed={time.perf_counter() - started:.2f}s")
+    return 0
+
+
+def generate_data_command(args):
+    from datetime import datetime
+    from config.data_generator import GenerationSpec
+    from config.data_loader import DataLoader
+    spec = GenerationSpec(books=args.books, authors=args.authors, users=args.users, loans=args.loans,
+                          seed=args.seed, as_of=datetime.combine(args.as_of, datetime.min.time()))
+    started = time.perf_counter()
+    
+    def progress(table, done, total):
+        elapsed = time.perf_counter() - started
+        print(f"{table}: {done}/{total} elapsed={elapsed:.1f}s", flush=True)
+    
+    db = SessionLocal()
+    try:
+        inserted = DataLoader(db).generate(spec, args.chunk_size, not args.no_resume, args.password, progress)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    print(" ".join(f"{table}={count}" for table, count in inserted.items()) + f" elapsed={time.perf_counter() - started:.1f}s")
+    return 0
+
+
+def startup_time_command(args):
+    from benchmarks import startup
+    env = {}
+    if args.schema_mode:
+        env["STARTUP_SCHEMA_MODE"] = args.schema_mode
+    if args.seed is not None:
+        env["STARTUP_SEED_DATA"] = "true" if args.seed else "false"
+    budget = args.budget if args.budget is not None else startup.STARTUP_BUDGET_SECONDS
+    report = startup.run_startup(args.runs, budget, env, progress=print)
+    print(f"import={report['import_median_s']}s first_response={report['first_response_median_s']}s "
+          f"max={report['first_response_max_s']}s budget={report['budget_s']}s")
+    if not report["within_budget"]:
+        print(f"STARTUP BUDGET EXCEEDED: {report['first_response_max_s']}s > {report['budget_s']}s", file=sys.stderr)
+        return 1
+    return 0
+
+
+def benchmark_command(args):
+    from benchmarks import suite
+    report = suite.run_suite(args.sizes, args.seed, args.repeat, args.cases, args.data_dir, progress=print)
+    suite.save_report(report, args.output)
+    print(f"report={args.output}")
+    if args.save_baseline:
+        suite.save_report(report, args.baseline)
+        print(f"baseline={args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, comparison skipped", file=sys.stderr)
+        return 0
+    regressions = suite.compare(report, suite.load_report(args.baseline), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Library Management System CLI")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    import_parser = commands.add_parser("import", help="Потоковый импорт книг или авторов из CSV/JSONL")
+    import_parser.add_argument("entity", choices=["books", "authors"])
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=FORMATS)
+    import_parser.add_argument("--chunk-size", type=int, default=1000)
+    import_parser.set_defaults(handler=import_command)
+    
+    migrate_parser = commands.add_parser("migrate", help="Применить миграции схемы (alembic upgrade)")
+    migrate_parser.add_argument("revision", nargs="?", default="head", help="head или номер ревизии")
+    migrate_parser.add_argument("--downgrade", action="store_true", help="Откатить схему до ревизии (base — полностью)")
+    migrate_parser.set_defaults(handler=migrate_command)
+    
+    sweep_parser = commands.add_parser("sweep-overdue", help="Перевести просроченные займы в OVERDUE")
+    sweep_parser.add_argument("--batch-size", type=int, default=OVERDUE_SWEEP_BATCH_SIZE)
+    sweep_parser.set_defaults(handler=sweep_overdue_command)
+    
+    benchmark_parser = commands.add_parser("benchmark", help="Замеры репозиториев и сервисов на синтетических данных")
+    benchmark_parser.add_argument("--sizes", type=int, nargs="+", default=[10000], help="Число книг в наборах")
+    benchmark_parser.add_argument("--seed", type=int, default=42)
+    benchmark_parser.add_argument("--repeat", type=int, default=5)
+    benchmark_parser.add_argument("--cases", nargs="*", help="Подстроки имён случаев, например book_repository")
+    benchmark_parser.add_argument("--data-dir", default=os.path.join("benchmarks", "data"))
+    benchmark_parser.add_argument("--output", default="benchmark-report.json")
+    benchmark_parser.add_argument("--baseline", default=os.path.join("benchmarks", "baseline.json"))
+    benchmark_parser.add_argument("--tolerance", type=float, default=0.25, help="Допустимое замедление медианы")
+    benchmark_parser.add_argument("--save-baseline", action="store_true", help="Записать отчёт как новый эталон")
+    benchmark_parser.set_defaults(handler=benchmark_command)
+    
+    seed_parser = commands.add_parser("seed", help="Загрузить тестовые данные, если БД пуста")
+    seed_parser.set_defaults(handler=seed_command)
+    
+    generate_parser = commands.add_parser("generate-data", help="Синтетический набор данных для нагрузочных тестов")
+    generate_parser.add_argument("--books", type=int, required=True)
+    generate_parser.add_argument("--authors", type=int, default=0, help="По умолчанию 10%% от числа книг")
+    generate_parser.add_argument("--users", type=int, default=0, help="По умолчанию 5%% от числа книг")
+    generate_parser.add_argument("--loans", type=int, default=0, help="По умолчанию 30%% от числа книг")
+    generate_parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    generate_parser.add_argument("--as-of", type=date.fromisoformat, default=DEFAULT_AS_OF.date(),
+                                 help="Дата, относительно которой займы активны или просрочены")
+    generate_parser.add_argument("--chunk-size", type=int, default=GENERATOR_CHUNK_SIZE)
+    generate_parser.add_argument("--password", help="Общий пароль всех сгенерированных читателей")
+    generate_parser.add_argument("--no-resume", action="store_true", help="Ошибка, если таблицы уже не пусты")
+    generate_parser.set_defaults(handler=generate_data_command)
+    
+    stats_parser = commands.add_parser("rebuild-author-stats", help="Пересчитать счётчики книг и займов у авторов")
+    stats_parser.set_defaults(handler=rebuild_author_stats_command)
+    
+    startup_parser = commands.add_parser("startup-time", help="Холодный старт до первого ответа и проверка бюджета")
+    startup_parser.add_argument("--runs", type=int, default=3)
+    startup_parser.add_argument("--budget", type=float, default=None, help="Бюджет в секундах (STARTUP_BUDGET_SECONDS)")
+    startup_parser.add_argument("--schema-mode", choices=["create", "check", "off"], help="STARTUP_SCHEMA_MODE для замера")
+    startup_parser.add_argument("--seed", action=argparse.BooleanOptionalAction, default=None,
+                                help="STARTUP_SEED_DATA для замера")
+    startup_parser.set_defaults(handler=startup_time_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
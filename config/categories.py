@@ -0,0 +1,129 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+
+# Слушатели версий должны быть зарегистрированы раньше наших: после коммита
+# справочник сверяется с уже поднятой версией categories
+from config.versions import get_version_store
+
+ENTITY = "categories"
+# Страховка на записи, не поднявшие версию (правка БД вручную, хранилище версий в памяти)
+CATEGORY_REFRESH_SECONDS = float(os.getenv("CATEGORY_REFRESH_SECONDS", "60"))
+
+
+class CategoryEntry(NamedTuple):
+    id: int
+    name: str
+    description: Optional[str]
+
+
+class CategorySnapshot:
+    """Неизменяемый снимок таблицы categories и версия, с которой он снят."""
+
+    def __init__(self, version: str, entries: Iterable[CategoryEntry]):
+        self.version = version
+        self.entries: Tuple[CategoryEntry, ...] = tuple(sorted(entries))
+        self.by_id: Dict[int, CategoryEntry] = {entry.id: entry for entry in self.entries}
+        self.by_name: Dict[str, CategoryEntry] = {entry.name: entry for entry in self.entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class CategoryDirectory:
+    """Справочник категорий в памяти процесса.
+
+    Категорий единицы, а меняются они редко, поэтому имя категории при
+    сериализации книги и проверка category_id при записи не ходят в БД.
+    Снимок загружается при старте, перечитывается после коммита, изменившего
+    categories в этом процессе, и при обращении, если версия categories в
+    хранилище версий ушла вперёд (запись в другом воркере) или снимок старше
+    ttl секунд. Справочник отвечает только сессиям, работающим с той же БД;
+    до load() он пуст и все обращаются к таблице.
+    """
+
+    def __init__(self, engine=None, ttl: float = CATEGORY_REFRESH_SECONDS):
+        self._engine = engine
+        self.ttl = ttl
+        self._snapshot: Optional[CategorySnapshot] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from config.database import engine
+            self._engine = engine
+        return self._engine
+
+    @property
+    def loaded(self) -> bool:
+        return self._snapshot is not None
+
+    def load(self) -> CategorySnapshot:
+        from models.category import Category
+        with self._lock:
+            # Версия читается до строк: запись между ними лишь вызовет ещё одну перезагрузку
+            version = get_version_store().get(ENTITY)
+            with self.engine.connect() as connection:
+                rows = connection.execute(
+                    select(Category.id, Category.name, Category.description)
+                ).all()
+            self._snapshot = CategorySnapshot(version, (CategoryEntry(*row) for row in rows))
+            self._expires = time.monotonic() + self.ttl
+            return self._snapshot
+
+    def current(self) -> Optional[CategorySnapshot]:
+        snapshot = self._snapshot
+        if snapshot is not None and (time.monotonic() >= self._expires
+                                     or snapshot.version != get_version_store().get(ENTITY)):
+            snapshot = self.load()
+        return snapshot
+
+    def serves(self, bind) -> bool:
+        from config.database import same_database
+        return self._snapshot is not None and same_database(bind, self.engine)
+
+    def for_session(self, session) -> Optional[CategorySnapshot]:
+        """Текущий снимок, если сессия читает ту же БД; иначе None — спросите таблицу."""
+        if session is None:
+            return None
+        session = getattr(session, "sync_session", session)
+        if not self.serves(session.bind):
+            return None
+        return self.current()
+
+    def name_of(self, instance, category_id: Optional[int]) -> Optional[str]:
+        if category_id is None:
+            return None
+        snapshot = self.for_session(object_session(instance))
+        entry = snapshot.by_id.get(category_id) if snapshot is not None else None
+        return entry.name if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+_category_directory = CategoryDirectory()
+
+
+def get_category_directory() -> CategoryDirectory:
+    return _category_directory
+
+
+def set_category_directory(directory: CategoryDirectory) -> None:
+    global _category_directory
+    _category_directory = directory
+
+
+@event.listens_for(Session, "after_commit")
+def _refresh_after_commit(session):
+    # Свои записи видны сразу после коммита, не дожидаясь следующего обращения
+    directory = get_category_directory()
+    if directory.serves(session.bind):
+        directory.current()
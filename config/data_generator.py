@@ -0,0 +1,283 @@
+import math
+import os
+import random
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple
+
+from models import Author, Book, Category, Loan, LoanStatus, User
+from models.book_title_trigram import title_trigrams
+
+DEFAULT_SEED = 42
+# Строк в одном INSERT ... executemany и в одной транзакции
+GENERATOR_CHUNK_SIZE = int(os.getenv("GENERATOR_CHUNK_SIZE", "20000"))
+# Строки генерируются блоками по BLOCK_SIZE id, у каждого блока свой генератор
+# случайных чисел: данные не зависят от размера пачки, а продолжить можно с любого блока.
+BLOCK_SIZE = 1000
+
+# Опорная дата вместо datetime.utcnow(): один и тот же seed даёт одни и те же строки
+DEFAULT_AS_OF = datetime(2024, 1, 1)
+LOAN_DAYS = 14
+LOAN_HISTORY_DAYS = 3 * 365
+# Экземпляров одной книги в фонде: выдано и доступно вместе
+MAX_COPIES = 10
+
+CATEGORIES = (
+    "Художественная литература", "Научная литература", "История", "Философия", "Поэзия",
+    "Детская литература", "Фантастика", "Детектив", "Биография", "Психология",
+    "Экономика", "Право", "Медицина", "Искусство", "Путешествия",
+    "Кулинария", "Спорт", "Религия", "Техника", "Справочники",
+)
+FIRST_NAMES = (
+    "Александр", "Алексей", "Анна", "Борис", "Валентина", "Владимир", "Галина", "Дмитрий",
+    "Екатерина", "Елена", "Иван", "Ирина", "Константин", "Лев", "Мария", "Михаил",
+    "Наталья", "Николай", "Ольга", "Пётр", "Сергей", "Татьяна", "Фёдор", "Юлия",
+)
+LAST_NAMES = (
+    "Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов",
+    "Новиков", "Фёдоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семёнов", "Егоров",
+    "Павлов", "Козлов", "Степанов", "Николаев", "Орлов", "Андреев", "Макаров", "Никитин",
+    "Захаров", "Зайцев", "Соловьёв", "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьёв",
+)
+TITLE_ADJECTIVES = (
+    "Тихий", "Белый", "Последний", "Тёмный", "Старый", "Новый", "Золотой", "Далёкий",
+    "Северный", "Забытый", "Вечный", "Красный", "Ночной", "Первый", "Морской", "Чужой",
+)
+TITLE_NOUNS = (
+    "мир", "дом", "сад", "лес", "город", "берег", "путь", "остров",
+    "ветер", "огонь", "свет", "век", "край", "мост", "сон", "год",
+)
+TITLE_TAILS = (
+    "", "", "", " и война", " над рекой", " в огне", " без имени", " на краю",
+    " и море", " за горизонтом", " среди звёзд", " у дороги",
+)
+
+# Сколько строк каждой таблицы приходится на одну книгу, если объём не задан явно
+AUTHORS_PER_BOOK = 0.1
+USERS_PER_BOOK = 0.05
+LOANS_PER_BOOK = 0.3
+
+# Показатели степени перекоса: чем больше, тем сильнее спрос сосредоточен на первых местах
+BOOK_POPULARITY_SKEW = 3.0
+READER_ACTIVITY_SKEW = 2.0
+
+
+@dataclass(frozen=True)
+class GenerationSpec:
+    """Объёмы и seed синтетического набора; 0 — посчитать от числа книг."""
+    books: int
+    authors: int = 0
+    users: int = 0
+    loans: int = 0
+    seed: int = DEFAULT_SEED
+    as_of: datetime = field(default=DEFAULT_AS_OF)
+
+    def __post_init__(self):
+        if self.books < 1:
+            raise ValueError("books must be positive")
+        for name, ratio in (("authors", AUTHORS_PER_BOOK), ("users", USERS_PER_BOOK)):
+            if not getattr(self, name):
+                object.__setattr__(self, name, max(10, int(self.books * ratio)))
+        if not self.loans:
+            object.__setattr__(self, "loans", int(self.books * LOANS_PER_BOOK))
+
+    def counts(self) -> dict:
+        return {"categories": len(CATEGORIES), "authors": self.authors, "books": self.books,
+                "users": self.users, "loans": self.loans}
+
+
+class Popularity:
+    """Номер от 1 до size с перекосом по степенному закону.
+
+    Место в рейтинге rank = size * u ** skew (u равномерно на [0, 1)) и
+    переставляется умножением на взаимно простой шаг: популярные id
+    рассыпаны по всей таблице, но место 0 всегда у id 1.
+    """
+
+    def __init__(self, size: int, skew: float):
+        self.size = size
+        self.skew = skew
+        self.stride = next(step for step in range(int(size * 0.618) | 1, 2 * size + 3, 2) if math.gcd(step, size) == 1)
+
+    def pick(self, rnd: random.Random) -> int:
+        rank = min(self.size - 1, int(self.size * rnd.random() ** self.skew))
+        return rank * self.stride % self.size + 1
+
+
+def book_copies(spec: GenerationSpec, book_id: int) -> int:
+    """Экземпляров книги в фонде, 1–MAX_COPIES: хеш seed и id, без генерации самой книги."""
+    return 1 + zlib.crc32(f"{spec.seed}:{book_id}".encode()) % MAX_COPIES
+
+
+@lru_cache(maxsize=8192)
+def _trigrams_of(title: str) -> tuple:
+    # Названий немного (прилагательное × существительное × хвост), разбор повторяется
+    return tuple(sorted(title_trigrams(title)))
+
+
+def _categories(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    for category_id in range(first, last + 1):
+        yield {"id": category_id, "name": CATEGORIES[category_id - 1], "description": None}
+
+
+def _authors(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    for author_id in range(first, last + 1):
+        yield {
+            "id": author_id,
+            "first_name": rnd.choice(FIRST_NAMES),
+            "last_name": rnd.choice(LAST_NAMES),
+            "birth_date": date(1800, 1, 1) + timedelta(days=rnd.randrange(200 * 365)),
+            "biography": None,
+        }
+
+
+def _books(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    authors = Popularity(spec.authors, 2.0)
+    on_loan = _open_loans(spec).on_loan
+    for book_id in range(first, last + 1):
+        yield {
+            "id": book_id,
+            "title": f"{rnd.choice(TITLE_ADJECTIVES)} {rnd.choice(TITLE_NOUNS)}{rnd.choice(TITLE_TAILS)}",
+            "isbn": f"978-{book_id:010d}",
+            "publication_date": date(1850, 1, 1) + timedelta(days=rnd.randrange(170 * 365)),
+            # Как после выдач через LoanService: каждый открытый заём держит экземпляр
+            "available_copies": book_copies(spec, book_id) - on_loan[book_id],
+            # Треть книг — у плодовитых авторов, остальные распределены равномерно
+            "author_id": authors.pick(rnd) if rnd.random() < 0.3 else rnd.randint(1, spec.authors),
+            "category_id": rnd.randint(1, len(CATEGORIES)) if rnd.random() < 0.9 else None,
+        }
+
+
+def _users(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    for user_id in range(first, last + 1):
+        yield {
+            "id": user_id,
+            "email": f"reader{user_id}@library.test",
+            # Непригодный хеш: войти нельзя, пока не задан общий пароль (см. DataLoader.generate)
+            "password": "!",
+            "first_name": rnd.choice(FIRST_NAMES),
+            "last_name": rnd.choice(LAST_NAMES),
+            "created_at": spec.as_of - timedelta(days=rnd.randrange(3 * 365)),
+        }
+
+
+def _drawn_loans(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    books = Popularity(spec.books, BOOK_POPULARITY_SKEW)
+    readers = Popularity(spec.users, READER_ACTIVITY_SKEW)
+    for loan_id in range(first, last + 1):
+        # Выдачи за последние годы; свежих больше — библиотека растёт
+        age = LOAN_HISTORY_DAYS * rnd.random() ** 1.5
+        loan_date = spec.as_of - timedelta(days=age)
+        due_date = loan_date + timedelta(days=LOAN_DAYS)
+        # Срок чтения: медиана около 10 дней, длинный хвост опозданий; 2% книг не возвращают
+        keep_days = None if rnd.random() < 0.02 else rnd.lognormvariate(math.log(10), 0.6)
+        if keep_days is not None and keep_days <= age:
+            status, return_date = LoanStatus.RETURNED, loan_date + timedelta(days=keep_days)
+        else:
+            status = LoanStatus.OVERDUE if due_date < spec.as_of else LoanStatus.ACTIVE
+            return_date = None
+        yield {
+            "id": loan_id,
+            "book_id": books.pick(rnd),
+            "user_id": readers.pick(rnd),
+            "loan_date": loan_date,
+            "due_date": due_date,
+            "return_date": return_date,
+            "status": status,
+        }
+
+
+class OpenLoans(NamedTuple):
+    book_of: Dict[int, int]
+    on_loan: Counter
+
+
+@lru_cache(maxsize=4)
+def _open_loans(spec: GenerationSpec) -> OpenLoans:
+    """Книги открытых займов с учётом фонда: loan_id -> book_id и займы на руках по книгам.
+
+    Открытый заём занимает экземпляр, поэтому выданных книг не больше, чем
+    book_copies: если все экземпляры вытянутой книги на руках, заём переходит
+    к следующей по id. Займы раздаются по порядку id, так что ответ не зависит
+    от того, с какого места продолжается генерация.
+    """
+    book_of, on_loan = {}, Counter()
+    capacity = sum(book_copies(spec, book_id) for book_id in range(1, spec.books + 1))
+    for row in _block_rows(spec, "loans", _drawn_loans, 1, spec.loans):
+        if row["return_date"] is not None:
+            continue
+        if len(book_of) == capacity:
+            raise ValueError(f"{spec.books} books cannot hold more than {capacity} open loans")
+        book_id = row["book_id"]
+        while on_loan[book_id] >= book_copies(spec, book_id):
+            book_id = book_id % spec.books + 1
+        on_loan[book_id] += 1
+        book_of[row["id"]] = book_id
+    return OpenLoans(book_of, on_loan)
+
+
+def _loans(spec: GenerationSpec, rnd: random.Random, first: int, last: int) -> Iterator[dict]:
+    book_of = _open_loans(spec).book_of
+    for row in _drawn_loans(spec, rnd, first, last):
+        row["book_id"] = book_of.get(row["id"], row["book_id"])
+        yield row
+
+
+# Порядок вставки соответствует внешним ключам
+TABLES = (
+    ("categories", Category, _categories),
+    ("authors", Author, _authors),
+    ("books", Book, _books),
+    ("users", User, _users),
+    ("loans", Loan, _loans),
+)
+
+
+# Продолжение сверяет первый блок каждой таблицы целиком: в нём видны seed, объёмы и as_of.
+# Пароль читателей DataLoader.generate заменяет после генерации, его не сравниваем.
+FINGERPRINT_ROWS = BLOCK_SIZE
+FINGERPRINT_SKIP = {"users": ("password",)}
+
+
+def expected_available_copies(spec: GenerationSpec, last: int) -> List[int]:
+    """available_copies книг 1..last; только здесь виден объём займов, поэтому продолжение сверяет их все."""
+    on_loan = _open_loans(spec).on_loan
+    return [book_copies(spec, book_id) - on_loan[book_id] for book_id in range(1, last + 1)]
+
+
+def generate_rows(spec: GenerationSpec, table: str, first: int, last: int) -> Iterator[dict]:
+    """Строки table с id от first до last; одинаковы при любом разбиении на диапазоны."""
+    return _block_rows(spec, table, {name: generator for name, _, generator in TABLES}[table], first, last)
+
+
+def _block_rows(spec: GenerationSpec, table: str, generate, first: int, last: int) -> Iterator[dict]:
+    block = (first - 1) // BLOCK_SIZE
+    while first <= last:
+        block_last = min(last, (block + 1) * BLOCK_SIZE)
+        rnd = random.Random(f"{spec.seed}:{table}:{block}")
+        # Блок генерируется с начала, чтобы продолжение с середины давало те же строки
+        for row in generate(spec, rnd, block * BLOCK_SIZE + 1, block_last):
+            if row["id"] >= first:
+                yield row
+        first = block_last + 1
+        block += 1
+
+
+def trigram_rows(books: List[dict]) -> List[tuple]:
+    """(trigram, book_id) кортежами — для insert_many."""
+    return [(trigram, book["id"]) for book in books for trigram in _trigrams_of(book["title"])]
+
+
+def chunks(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
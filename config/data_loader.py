@@ -1,11 +1,23 @@
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from models.author import Author
 from models.category import Category
 from models.book import Book
 from models.user import User
-from datetime import date, datetime
-from passlib.context import CryptContext
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from datetime import date, datetime, timedelta
+from config.passwords import hash_password
+from config.unit_of_work import unit_of_work
+from config.data_generator import (
+    FINGERPRINT_ROWS, FINGERPRINT_SKIP, GENERATOR_CHUNK_SIZE, TABLES, GenerationSpec, chunks,
+    expected_available_copies, generate_rows, trigram_rows,
+)
+from models.book_title_trigram import BookTitleTrigram
+from repositories.author_repository import AuthorRepository
+from repositories.author_stats import counters_enabled
+from repositories.bulk import insert_many
+
+
 class DataLoader:
     def __init__(self, db: Session):
         self.db = db
@@ -18,6 +30,22 @@ class DataLoader:
         
         print(" Загрузка тестовых данных...")
         
+        # Одна транзакция: flush выдаёт id для связей, коммит — один в конце
+        try:
+            with unit_of_work(self.db):
+                self._add_test_data()
+        except IntegrityError:
+            # Параллельно стартовавший воркер успел загрузить те же данные
+            print(" Тестовые данные уже загружены")
+            return
+        
+        print(" Тестовые данные успешно загружены!")
+        print(f"   - Авторов: {self.db.query(Author).count()}")
+        print(f"   - Категорий: {self.db.query(Category).count()}")
+        print(f"   - Книг: {self.db.query(Book).count()}")
+        print(f"   - Пользователей: {self.db.query(User).count()}")
+    
+    def _add_test_data(self):
         fiction = Category(
             name="Художественная литература",
             description="Романы, повести, рассказы"
@@ -34,7 +62,7 @@ class DataLoader:
         )
         
         self.db.add_all([fiction, science, history])
-        self.db.commit()
+        self.db.flush()
         
         tolstoy = Author(
             first_name="Лев",
@@ -51,7 +79,7 @@ class DataLoader:
         )
         
         self.db.add_all([tolstoy, pushkin])
-        self.db.commit()
+        self.db.flush()
         
         war_and_peace = Book(
             title="Война и мир",
@@ -72,7 +100,7 @@ class DataLoader:
         )
         
         self.db.add_all([war_and_peace, eugene_onegin])
-        self.db.commit()
+        self.db.flush()
         
         users_data = [
                 {
@@ -90,7 +118,7 @@ class DataLoader:
             ]
             
         for user_data in users_data:
-            hashed_password = pwd_context.hash(user_data["password"])
+            hashed_password = hash_password(user_data["password"])
             user = User(
                 email=user_data["email"],
                 password=hashed_password,  # ← Теперь хешированный пароль
@@ -99,10 +127,75 @@ class DataLoader:
             )
             self.db.add(user)
             
-        self.db.commit()
+        self.db.flush()
+    
+    def generate(self, spec: GenerationSpec, chunk_size: int = GENERATOR_CHUNK_SIZE, resume: bool = True,
+                 password: str = None, progress=None) -> dict:
+        """Синтетический набор объёма spec многострочными INSERT по chunk_size строк.
         
-        print(" Тестовые данные успешно загружены!")
-        print(f"   - Авторов: {self.db.query(Author).count()}")
-        print(f"   - Категорий: {self.db.query(Category).count()}")
-        print(f"   - Книг: {self.db.query(Book).count()}")
-        print(f"   - Пользователей: {self.db.query(User).count()}")
\ No newline at end of file
+        Каждая пачка — отдельная транзакция, так что прерванную генерацию
+        можно продолжить: таблица дописывается с max(id) + 1, а строки
+        с тем же seed получаются те же, что и при запуске с нуля. Возвращает
+        число вставленных строк по таблицам. password задаёт всем читателям
+        общий пароль (хешируется один раз), без него войти ими нельзя.
+        """
+        # Сначала проверяем все таблицы: чужой набор не должен дописываться даже частично
+        counts = spec.counts()
+        existing = {}
+        for name, model, _ in TABLES:
+            table = model.__table__
+            done = self.db.execute(select(func.max(table.c.id))).scalar() or 0
+            if done:
+                if not resume:
+                    raise ValueError(f"Table {name} is not empty")
+                self._check_fingerprint(spec, name, table, done)
+            if done > counts[name]:
+                raise ValueError(f"Table {name} already has {done} rows, more than {counts[name]} requested")
+            existing[name] = done
+        self.db.rollback()
+        
+        password_hash = hash_password(password) if password else None
+        inserted = {}
+        for name, model, _ in TABLES:
+            table = model.__table__
+            total = counts[name]
+            inserted[name] = total - existing[name]
+            for chunk in chunks(generate_rows(spec, name, existing[name] + 1, total), chunk_size):
+                if password_hash and model is User:
+                    for row in chunk:
+                        row["password"] = password_hash
+                with unit_of_work(self.db):
+                    self.db.execute(insert(table), chunk)
+                    if model is Book:
+                        insert_many(self.db, BookTitleTrigram.__table__, ("trigram", "book_id"), trigram_rows(chunk))
+                if progress:
+                    progress(name, chunk[-1]["id"], total)
+        if counters_enabled():
+            # Строки шли мимо ORM: счётчики авторов пересчитываются один раз в конце
+            with unit_of_work(self.db):
+                AuthorRepository(self.db).rebuild_stats()
+        return inserted
+    
+    def _check_fingerprint(self, spec: GenerationSpec, name: str, table, done: int):
+        expected = list(generate_rows(spec, name, 1, min(done, FINGERPRINT_ROWS)))
+        columns = [column for column in expected[0] if column not in FINGERPRINT_SKIP.get(name, ())]
+        actual = self.db.execute(
+            select(*(table.c[column] for column in columns)).where(table.c.id <= len(expected)).order_by(table.c.id)
+        ).all()
+        matches = len(actual) == len(expected) and all(
+            _same(value, row[column]) for stored, row in zip(actual, expected) for value, column in zip(stored, columns)
+        )
+        if matches and name == "books":
+            copies = self.db.execute(
+                select(table.c.available_copies).where(table.c.id <= done).order_by(table.c.id)
+            ).scalars().all()
+            matches = copies == expected_available_copies(spec, done)
+        if not matches:
+            raise ValueError(f"Table {name} holds data of another seed or volume; use an empty database")
+
+
+def _same(stored, generated) -> bool:
+    # MySQL DATETIME без дробной части округляет микросекунды
+    if isinstance(generated, datetime) and isinstance(stored, datetime):
+        return abs(stored - generated) <= timedelta(seconds=1)
+    return stored == generated
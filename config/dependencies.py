@@ -1,13 +1,39 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.database import get_db
+from config.database import get_db, get_async_db
+from config.revocation import get_revocation_list
+from config.security import AUTH_STATELESS
 from services.auth_service import AuthService
 from schemas.auth_schema import TokenData
+from schemas.user_schema import UserResponse
 
 security = HTTPBearer()
 
+def _user_from_token(token_data: TokenData):
+    """Пользователь из утверждений токена или None, если токен старого формата.
+
+    Удалённые пользователи (с токеном любой давности) и изменённые после выдачи
+    токена отсекаются списком отзыва в памяти процесса — запросов к БД нет.
+    """
+    if not AUTH_STATELESS or not token_data.has_profile or token_data.issued_at is None:
+        return None
+    if get_revocation_list().is_revoked(token_data.user_id, token_data.issued_at):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Токен отозван",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return UserResponse(
+        id=token_data.user_id,
+        email=token_data.email,
+        first_name=token_data.first_name,
+        last_name=token_data.last_name,
+        created_at=token_data.created_at,
+    )
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -15,6 +41,9 @@ def get_current_user(
     """Зависимость для получения текущего пользователя"""
     auth_service = AuthService(db)
     token_data = auth_service.verify_token(credentials.credentials)
+    user = _user_from_token(token_data)
+    if user is not None:
+        return user
     
     from services.user_service import UserService
     user_service = UserService(db)
@@ -29,4 +58,26 @@ def get_current_user(
 
 def get_current_active_user(current_user = Depends(get_current_user)):
     """Зависимость для получения активного пользователя"""
-    return current_user
\ No newline at end of file
+    return current_user
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Асинхронный вариант get_current_user для маршрутов на AsyncSession"""
+    auth_service = AuthService(db)
+    token_data = auth_service.verify_token(credentials.credentials)
+    user = _user_from_token(token_data)
+    if user is not None:
+        return user
+    
+    from services.async_user_service import AsyncUserService
+    user_service = AsyncUserService(db)
+    user = await user_service.find_by_email(token_data.email)
+    
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Пользователь не найден",
+        )
+    return user
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
+from config.passwords import HasherBusyError
 
 def add_exception_handlers(app: FastAPI):
     
@@ -24,6 +25,14 @@ def add_exception_handlers(app: FastAPI):
             }
         )
     
+    @app.exception_handler(HasherBusyError)
+    async def hasher_busy_handler(request: Request, exc: HasherBusyError):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "Authentication service is busy, try again later"},
+            headers={"Retry-After": "1"}
+        )
+    
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         return JSONResponse(
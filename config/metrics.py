@@ -0,0 +1,163 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Границы корзин гистограммы задержек, секунды
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Family:
+    """Одна метрика в текстовом формате Prometheus: HELP, TYPE и строки образцов."""
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.samples: List[Tuple[str, str, float]] = []
+
+    def add(self, value: float, suffix: str = "", **labels) -> "Family":
+        self.samples.append((suffix, _labels(labels.keys(), labels.values()), value))
+        return self
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{self.name}{suffix}{labels} {_number(value)}" for suffix, labels, value in self.samples)
+        return lines
+
+
+class HttpMetrics:
+    """Счётчики HTTP-запросов процесса: число по маршрутам, гистограмма задержек, запросы в работе.
+
+    Маршрут берётся шаблоном (/api/books/{book_id}), а не фактическим путём,
+    чтобы число рядов не росло с числом id.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = HTTP_LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        # (метод, маршрут) -> [счётчики корзин..., сумма, количество]
+        self.latency: Dict[Tuple[str, str], List[float]] = {}
+        self.in_flight = 0
+
+    def started(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def finished(self, method: str, route: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            key = (method, route, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            histogram = self.latency.get((method, route))
+            if histogram is None:
+                histogram = self.latency[(method, route)] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram[index] += 1
+            histogram[-2] += seconds
+            histogram[-1] += 1
+
+    def families(self) -> List[Family]:
+        with self._lock:
+            requests = sorted(self.requests.items())
+            latency = sorted((key, list(values)) for key, values in self.latency.items())
+            in_flight = self.in_flight
+        total = Family("http_requests_total", "counter", "Обработанные HTTP-запросы")
+        for (method, route, status), count in requests:
+            total.add(count, method=method, route=route, status=status)
+        duration = Family("http_request_duration_seconds", "histogram", "Время обработки HTTP-запроса")
+        for (method, route), values in latency:
+            for bound, count in zip(self.buckets, values):
+                duration.add(count, "_bucket", method=method, route=route, le=_number(float(bound)))
+            duration.add(values[-1], "_bucket", method=method, route=route, le="+Inf")
+            duration.add(values[-2], "_sum", method=method, route=route)
+            duration.add(values[-1], "_count", method=method, route=route)
+        gauge = Family("http_requests_in_flight", "gauge", "HTTP-запросы в обработке").add(in_flight)
+        return [total, duration, gauge]
+
+
+_http_metrics = HttpMetrics()
+
+
+def get_http_metrics() -> HttpMetrics:
+    return _http_metrics
+
+
+class MetricsMiddleware:
+    """ASGI-middleware, снимающее HttpMetrics со всех HTTP-запросов приложения."""
+
+    def __init__(self, app, metrics: Optional[HttpMetrics] = None):
+        self.app = app
+        self.metrics = metrics or get_http_metrics()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.started()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # FastAPI кладёт сработавший маршрут в scope при маршрутизации
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.metrics.finished(scope["method"], route, status, time.perf_counter() - started)
+
+
+def pool_families(status: dict) -> List[Family]:
+    families = [
+        Family("db_pool_size", "gauge", "Постоянные соединения пула").add(status.get("size", 0)),
+        Family("db_pool_checked_out", "gauge", "Соединения, выданные из пула").add(status.get("checked_out", 0)),
+        Family("db_pool_overflow", "gauge", "Соединения сверх размера пула").add(status.get("overflow", 0)),
+        Family("db_pool_saturation", "gauge", "Доля занятых соединений от максимума").add(status.get("saturation", 0.0)),
+    ]
+    if "checkouts" in status:
+        families += [
+            Family("db_pool_checkouts_total", "counter", "Выдачи соединений из пула").add(status["checkouts"]),
+            Family("db_pool_timeouts_total", "counter", "Таймауты ожидания соединения").add(status["timeouts"]),
+            Family("db_pool_wait_seconds_total", "counter", "Суммарное ожидание соединения").add(status["wait_seconds_total"]),
+        ]
+    return families
+
+
+def cache_families(name: str, stats: dict) -> List[Family]:
+    return [
+        Family("cache_hits_total", "counter", "Попадания в кэш").add(stats["hits"], cache=name),
+        Family("cache_misses_total", "counter", "Промахи кэша").add(stats["misses"], cache=name),
+        Family("cache_evictions_total", "counter", "Вытеснения и истечения записей").add(stats["evictions"], cache=name),
+        Family("cache_entries", "gauge", "Записей в кэше").add(stats["size"], cache=name),
+        Family("cache_hit_ratio", "gauge", "Доля попаданий с запуска").add(stats["hit_ratio"], cache=name),
+    ]
+
+
+def render(families: Iterable[Family]) -> str:
+    lines = []
+    for family in families:
+        lines.extend(family.render())
+    return "\n".join(lines) + "\n"
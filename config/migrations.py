@@ -0,0 +1,61 @@
+import os
+from contextlib import contextmanager
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Последняя ревизия из migrations/versions: с ней сверяется БД при быстром
+# старте. Alembic для этого не импортируется — при новой миграции обновите
+# константу (тест сверяет её с head).
+SCHEMA_REVISION = "0007"
+
+
+def alembic_config(connection=None):
+    """Конфигурация Alembic; при переданном соединении миграции идут через него."""
+    from alembic.config import Config
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "migrations"))
+    if connection is not None:
+        config.attributes["connection"] = connection
+        config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revision() -> str:
+    from alembic.script import ScriptDirectory
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+@contextmanager
+def sqlite_foreign_keys_off(connection):
+    """Выключает проверку внешних ключей SQLite на время миграций.
+
+    batch-режим пересоздаёт таблицу через DROP, а DROP таблицы, на которую
+    ссылаются строки других таблиц, при включённой проверке падает. PRAGMA
+    внутри транзакции не действует, поэтому переключается до неё и после.
+    """
+    if connection.dialect.name != "sqlite":
+        yield
+        return
+    connection.exec_driver_sql("PRAGMA foreign_keys = OFF")
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.rollback()
+        connection.exec_driver_sql("PRAGMA foreign_keys = ON")
+        connection.commit()
+
+
+def _run(bind, command_name: str, revision: str) -> None:
+    from alembic import command
+    with bind.connect() as connection, sqlite_foreign_keys_off(connection):
+        with connection.begin():
+            getattr(command, command_name)(alembic_config(connection), revision)
+
+
+def upgrade(bind, revision: str = "head") -> None:
+    _run(bind, "upgrade", revision)
+
+
+def downgrade(bind, revision: str) -> None:
+    _run(bind, "downgrade", revision)
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+import passlib.utils.handlers as uh
+
+# Поддерживаемые схемы: первая из PASSWORD_HASH_SCHEME — для новых хешей,
+# остальные только проверяются и при успешном входе заменяются на текущую.
+PASSWORD_HASH_SCHEME = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_PBKDF2_ROUNDS = int(os.getenv("PASSWORD_PBKDF2_ROUNDS", "290000"))
+PASSWORD_SCRYPT_ROUNDS = int(os.getenv("PASSWORD_SCRYPT_ROUNDS", "16"))
+
+# 0 — хешировать в вызывающем потоке (CLI, загрузка тестовых данных)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+PASSWORD_HASH_QUEUE_SIZE = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", str(max(PASSWORD_HASH_WORKERS, 1) * 8)))
+PASSWORD_HASH_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_HASH_QUEUE_TIMEOUT", "5"))
+
+
+class library_sha256(uh.StaticHandler):
+    """Прежний формат AuthService: sha256("library_salt_" + пароль) в hex, общая соль на всех."""
+    name = "library_sha256"
+    checksum_chars = uh.HEX_CHARS
+    checksum_size = 64
+
+    def _calc_checksum(self, secret):
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        return hashlib.sha256(b"library_salt_" + secret).hexdigest()
+
+
+SCHEMES = ("bcrypt", "pbkdf2_sha256", "scrypt", library_sha256)
+
+
+def context_settings(scheme: str = PASSWORD_HASH_SCHEME,
+                     bcrypt_rounds: int = PASSWORD_BCRYPT_ROUNDS,
+                     pbkdf2_rounds: int = PASSWORD_PBKDF2_ROUNDS,
+                     scrypt_rounds: int = PASSWORD_SCRYPT_ROUNDS) -> dict:
+    """Аргументы CryptContext; хеш другой схемы или с другой стоимостью считается устаревшим."""
+    if scheme not in SCHEMES[:-1]:
+        raise ValueError(f"Unknown password hash scheme: {scheme}")
+    return {
+        "schemes": list(SCHEMES),
+        "default": scheme,
+        "deprecated": ["auto"],
+        "bcrypt__rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+        "pbkdf2_sha256__rounds": pbkdf2_rounds,
+        "pbkdf2_sha256__min_rounds": pbkdf2_rounds,
+        "scrypt__rounds": scrypt_rounds,
+        "scrypt__min_rounds": scrypt_rounds,
+    }
+
+
+def _verify_and_update(context: CryptContext, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    try:
+        return context.verify_and_update(password, hashed)
+    except (ValueError, TypeError):
+        # Нераспознанный или повреждённый хеш — просто неверный пароль
+        return False, None
+
+
+# Состояние процесса-воркера: контекст собирается один раз в initializer
+_worker_context = None
+
+
+def _init_worker(settings: dict) -> None:
+    global _worker_context
+    _worker_context = CryptContext(**settings)
+
+
+def _worker_hash(password: str) -> str:
+    return _worker_context.hash(password)
+
+
+def _worker_verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return _verify_and_update(_worker_context, password, hashed)
+
+
+class HasherBusyError(RuntimeError):
+    """Очередь хеширования заполнена: запрос отклоняется, а не ждёт бесконечно."""
+
+
+class PasswordHasher:
+    """Хеширование и проверка паролей в отдельном пуле процессов с ограниченной очередью.
+
+    Медленный хеш не занимает GIL веб-воркера, а число одновременно принятых
+    задач ограничено queue_size: при переполнении через queue_timeout секунд
+    поднимается HasherBusyError.
+    """
+
+    def __init__(self, settings: Optional[dict] = None, workers: int = PASSWORD_HASH_WORKERS,
+                 queue_size: int = PASSWORD_HASH_QUEUE_SIZE, queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT):
+        self.settings = settings or context_settings()
+        self.context = CryptContext(**self.settings)
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._executor = None
+        self._lock = threading.Lock()
+        self.rejected = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, initializer=_init_worker, initargs=(self.settings,)
+                    )
+        return self._executor
+
+    def _run(self, function, inline, *args):
+        if self.workers <= 0:
+            return inline(*args)
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise HasherBusyError("Password hashing queue is full")
+        try:
+            return self._get_executor().submit(function, *args).result()
+        finally:
+            self._slots.release()
+
+    def hash(self, password: str) -> str:
+        return self._run(_worker_hash, self.context.hash, password)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self.verify_and_update(password, hashed)[0]
+
+    def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(совпал ли пароль, новый хеш или None, если текущий не устарел)."""
+        return self._run(_worker_verify_and_update,
+                         lambda *args: _verify_and_update(self.context, *args), password, hashed)
+
+    def needs_update(self, hashed: str) -> bool:
+        try:
+            return self.context.needs_update(hashed)
+        except (ValueError, TypeError):
+            return True
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_password_hasher = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
+
+
+def set_password_hasher(hasher: Optional[PasswordHasher]) -> None:
+    """Подменяет хешер процесса (например, с другой стоимостью); прежний пул закрывается."""
+    global _password_hasher
+    previous, _password_hasher = _password_hasher, hasher
+    if previous is not None and previous is not hasher:
+        previous.shutdown()
+
+
+def hash_password(password: str) -> str:
+    return get_password_hasher().hash(password)
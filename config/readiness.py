@@ -0,0 +1,58 @@
+import asyncio
+import os
+import threading
+import time
+
+from sqlalchemy import text
+
+# Дольше проверка не ждёт ни свободного соединения, ни ответа БД
+READINESS_TIMEOUT_SECONDS = float(os.getenv("READINESS_TIMEOUT_SECONDS", "2"))
+
+_probe_running = threading.Lock()
+
+
+def _ping(engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _resolve(future: asyncio.Future, error) -> None:
+    if not future.done():
+        future.set_result(error)
+
+
+def _run_probe(engine, loop, future: asyncio.Future) -> None:
+    error = None
+    try:
+        _ping(engine)
+    except Exception as exc:
+        error = exc
+    finally:
+        _probe_running.release()
+    try:
+        loop.call_soon_threadsafe(_resolve, future, error)
+    except RuntimeError:
+        # Цикл событий уже закрыт: ответ на проверку никому не нужен
+        pass
+
+
+async def check_database(engine, timeout: float = READINESS_TIMEOUT_SECONDS) -> dict:
+    """SELECT 1 через пул с ограничением по времени.
+
+    Проверка идёт в отдельном потоке, а не в общем пуле: зависший запрос
+    нельзя прервать, он дорабатывает сам. Пока он не завершился, следующие
+    проверки сразу отвечают DOWN и не занимают новые потоки и соединения.
+    """
+    if not _probe_running.acquire(blocking=False):
+        return {"status": "DOWN", "error": "previous check is still running"}
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    started = time.perf_counter()
+    threading.Thread(target=_run_probe, args=(engine, loop, future), name="readiness-probe", daemon=True).start()
+    try:
+        error = await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        return {"status": "DOWN", "error": f"timed out after {timeout:g}s"}
+    if error is not None:
+        return {"status": "DOWN", "error": error.__class__.__name__}
+    return {"status": "UP", "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
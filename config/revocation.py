@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from config.security import ACCESS_TOKEN_EXPIRE_MINUTES
+
+AUTH_REVOCATION_REFRESH_SECONDS = float(os.getenv("AUTH_REVOCATION_REFRESH_SECONDS", "5"))
+# Насколько раньше последнего виденного отзыва перечитывать журнал: строка,
+# вставленная долгой транзакцией, становится видна позже более новых
+AUTH_REVOCATION_LOOKBACK_SECONDS = float(os.getenv("AUTH_REVOCATION_LOOKBACK_SECONDS", "60"))
+
+_PENDING_KEY = "revoked_users"
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Отозванные пользователи в памяти процесса: user_id -> момент отзыва.
+
+    Проверка токена — поиск в словаре без запросов к БД. Раз в ttl секунд
+    фоновая задача (run_revocation_refresher) дочитывает из user_revocations
+    строки не старше последнего виденного отзыва минус lookback, поэтому
+    отзывы из других воркеров доходят с задержкой около ttl, а свои — сразу
+    после коммита. Если БД недоступна, проверки идут по последнему снимку.
+    Записи старше срока жизни токена отбрасываются: такие токены уже истекли сами.
+
+    Удалённый пользователь отозван целиком, независимо от момента выдачи токена:
+    вход, прочитавший строку до удаления, мог выдать токен и после revoked_at.
+    Такие записи живут два срока жизни токена — дольше любого токена, выданного
+    в течение срока жизни после удаления. id удалённых пользователей заново
+    не выдаются (users в SQLite — AUTOINCREMENT), так что отметка не задевает новых.
+    """
+
+    def __init__(self, engine=None, ttl: float = AUTH_REVOCATION_REFRESH_SECONDS,
+                 token_lifetime: float = ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+                 lookback: float = AUTH_REVOCATION_LOOKBACK_SECONDS):
+        self._engine = engine
+        self.ttl = ttl
+        self.token_lifetime = token_lifetime
+        self.lookback = lookback
+        self._revoked = {}
+        self._deleted = {}
+        self._last_seen = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from config.database import engine
+            self._engine = engine
+        return self._engine
+
+    def add(self, user_id: int, revoked_at: float, deleted: bool = False) -> None:
+        with self._lock:
+            if revoked_at > self._revoked.get(user_id, 0.0):
+                self._revoked[user_id] = revoked_at
+            if deleted and revoked_at > self._deleted.get(user_id, 0.0):
+                self._deleted[user_id] = revoked_at
+
+    def is_revoked(self, user_id: int, issued_at: float) -> bool:
+        if user_id in self._deleted:
+            return True
+        revoked_at = self._revoked.get(user_id)
+        return revoked_at is not None and issued_at <= revoked_at
+
+    def refresh(self) -> None:
+        # Обновляет один поток; остальные не ждут и проверяют по текущему состоянию
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            from models.user_revocation import UserRevocation
+            cutoff = time.time() - self.token_lifetime
+            deleted_cutoff = cutoff - self.token_lifetime
+            # Не по id: на MySQL id раздаются при вставке, а видны строки в порядке
+            # коммитов, так что меньший id может появиться после большего
+            since = deleted_cutoff if self._last_seen is None else max(cutoff, self._last_seen - self.lookback)
+            statement = select(UserRevocation.user_id, UserRevocation.revoked_at, UserRevocation.deleted).where(
+                UserRevocation.revoked_at > since
+            )
+            with self.engine.connect() as connection:
+                rows = connection.execute(statement).all()
+            for user_id, revoked_at, deleted in rows:
+                self.add(user_id, revoked_at, deleted)
+                if self._last_seen is None or revoked_at > self._last_seen:
+                    self._last_seen = revoked_at
+            with self._lock:
+                self._revoked = {user_id: at for user_id, at in self._revoked.items() if at > cutoff}
+                self._deleted = {user_id: at for user_id, at in self._deleted.items() if at > deleted_cutoff}
+        finally:
+            self._refresh_lock.release()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._revoked.clear()
+            self._deleted.clear()
+
+    def __len__(self) -> int:
+        return len(self._revoked.keys() | self._deleted.keys())
+
+
+_revocation_list = RevocationList()
+
+
+def get_revocation_list() -> RevocationList:
+    return _revocation_list
+
+
+def set_revocation_list(revocation_list: RevocationList) -> None:
+    global _revocation_list
+    _revocation_list = revocation_list
+
+
+async def run_revocation_refresher(revocation_list: Optional[RevocationList] = None) -> None:
+    """Фоновое обновление списка отзыва; запрос к БД уходит в пул потоков, а не в цикл событий."""
+    while True:
+        current = revocation_list or get_revocation_list()
+        await asyncio.sleep(current.ttl)
+        try:
+            await asyncio.to_thread(current.refresh)
+        except Exception:
+            logger.exception("Revocation list refresh failed, keeping the last snapshot")
+
+
+def record_revocation(session: Optional[Session], user_id: int, revoked_at: float, deleted: bool = False) -> None:
+    """Запоминает отзыв до коммита; в память процесса он попадёт только если транзакция прошла."""
+    if session is None:
+        get_revocation_list().add(user_id, revoked_at, deleted)
+        return
+    session.info.setdefault(_PENDING_KEY, []).append((user_id, revoked_at, deleted))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_revocations(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        revocation_list = get_revocation_list()
+        for user_id, revoked_at, deleted in pending:
+            revocation_list.add(user_id, revoked_at, deleted)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_revocations(session):
+    session.info.pop(_PENDING_KEY, None)
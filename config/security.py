@@ -5,4 +5,7 @@ load_dotenv()
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-for-development-only")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
\ No newline at end of file
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+# Пользователь собирается из утверждений токена, без SELECT на каждый запрос
+AUTH_STATELESS = os.getenv("AUTH_STATELESS", "true").strip().lower() in ("1", "true", "yes", "on")
\ No newline at end of file
@@ -0,0 +1,200 @@
+import json
+import os
+import time
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Выключено — ни слушателей движка, ни middleware: накладных расходов нет совсем
+SQL_TIMING_ENABLED = os.getenv("SQL_TIMING_ENABLED", "false").strip().lower() in ("1", "true", "yes", "on")
+# Разрешить отладочный отчёт по запросам с заголовком X-Debug-SQL: 1
+SQL_TIMING_DEBUG = os.getenv("SQL_TIMING_DEBUG", "false").strip().lower() in ("1", "true", "yes", "on")
+SQL_TIMING_DEBUG_MAX_STATEMENTS = int(os.getenv("SQL_TIMING_DEBUG_MAX_STATEMENTS", "100"))
+SQL_TIMING_DEBUG_HEADER = "x-debug-sql"
+
+_current: ContextVar[Optional["RequestStats"]] = ContextVar("sql_timing_stats", default=None)
+
+
+class RequestStats:
+    """SQL-статистика одного HTTP-запроса.
+
+    db_seconds — время execute() на курсоре; у SQLite часть работы SELECT
+    приходится на выборку строк и сюда не попадает. rows — ORM-объекты,
+    загруженные из результатов, и строки проекций (count_rows), affected — строки, изменённые INSERT/UPDATE/DELETE.
+    """
+
+    __slots__ = ("started", "statements", "db_seconds", "rows", "affected", "log", "_returning")
+
+    def __init__(self, debug: bool = False):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+        self.affected = 0
+        self.log: Optional[List[dict]] = [] if debug else None
+        self._returning = None
+
+    def record(self, statement: str, seconds: float, affected: int, returning=None) -> None:
+        """returning — курсор DML с RETURNING: его rowcount дочитывается после выборки строк."""
+        self._settle()
+        self.statements += 1
+        self.db_seconds += seconds
+        self.affected += affected
+        entry = None
+        if self.log is not None and len(self.log) < SQL_TIMING_DEBUG_MAX_STATEMENTS:
+            entry = {"sql": statement, "ms": round(seconds * 1000, 3), "rows": 0, "affected": affected}
+            self.log.append(entry)
+        if returning is not None:
+            self._returning = (returning, entry)
+
+    def _settle(self) -> None:
+        # sqlite3 выставляет rowcount у INSERT/UPDATE/DELETE ... RETURNING только
+        # после выборки строк, а выбираются они уже после after_cursor_execute
+        if self._returning is None:
+            return
+        (cursor, entry), self._returning = self._returning, None
+        affected = max(cursor.rowcount, 0)
+        self.affected += affected
+        if entry is not None:
+            entry["affected"] = affected
+
+    def loaded(self, count: int = 1) -> None:
+        self.rows += count
+        # Строки выбираются сразу после своего запроса: относим их к последнему
+        if self.log:
+            self.log[-1]["rows"] += count
+
+    def server_timing(self) -> str:
+        self._settle()
+        total = (time.perf_counter() - self.started) * 1000
+        return (f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statements} statements", '
+                f'db-rows;desc="{self.rows}", app;dur={total:.2f}')
+
+    def as_dict(self) -> dict:
+        self._settle()
+        report = {
+            "statements": self.statements,
+            "db_ms": round(self.db_seconds * 1000, 3),
+            "rows": self.rows,
+            "affected": self.affected,
+        }
+        if self.log is not None:
+            report["log"] = self.log
+        return report
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        context._sql_timing_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    if stats is None:
+        return
+    elapsed = time.perf_counter() - getattr(context, "_sql_timing_started", time.perf_counter())
+    if not (context.isinsert or context.isupdate or context.isdelete):
+        stats.record(statement, elapsed, 0)
+    elif cursor.description is not None:
+        stats.record(statement, elapsed, 0, returning=cursor)
+    else:
+        stats.record(statement, elapsed, max(cursor.rowcount, 0))
+
+
+def _count_load(target, context):
+    stats = _current.get()
+    if stats is not None:
+        stats.loaded()
+
+
+def count_rows(count: int) -> None:
+    """Строки, выбранные без ORM-объектов (проекции столбцов): событие load для них не срабатывает."""
+    stats = _current.get()
+    if stats is not None:
+        stats.loaded(count)
+
+
+def install(base) -> None:
+    """Вешает счётчики на все движки процесса (включая sync_engine асинхронного) и модели base."""
+    if event.contains(Engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(base, "load", _count_load, propagate=True)
+
+
+def uninstall(base) -> None:
+    if not event.contains(Engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.remove(base, "load", _count_load)
+
+
+class SqlTimingMiddleware:
+    """ASGI-middleware: собирает RequestStats и добавляет заголовок Server-Timing.
+
+    Заголовки уходят вместе с началом ответа, поэтому у потоковых ответов
+    (экспорт) в них попадает только то, что выполнилось до первой порции тела.
+    С SQL_TIMING_DEBUG и заголовком запроса X-Debug-SQL: 1 JSON-ответ
+    оборачивается в {"data": ..., "debug": {"sql": ...}}.
+    """
+
+    def __init__(self, app, debug: bool = SQL_TIMING_DEBUG):
+        self.app = app
+        self.debug = debug
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        debug = self.debug and (SQL_TIMING_DEBUG_HEADER.encode(), b"1") in scope["headers"]
+        stats = RequestStats(debug)
+        token = _current.set(stats)
+        try:
+            if debug:
+                await self._debug_call(scope, receive, send, stats)
+            else:
+                await self.app(scope, receive, self._timed_send(send, stats))
+        finally:
+            _current.reset(token)
+
+    def _timed_send(self, send, stats: RequestStats):
+        async def timed_send(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"server-timing", stats.server_timing().encode("latin-1"))
+                ]
+            await send(message)
+        return timed_send
+
+    async def _debug_call(self, scope, receive, send, stats: RequestStats):
+        # Отладочный режим буферизует ответ целиком: тело меняется, а с ним и Content-Length
+        start, chunks = None, []
+
+        async def buffered_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, buffered_send)
+        body = b"".join(chunks)
+        headers = [(name, value) for name, value in start.get("headers", []) if name.lower() != b"content-length"]
+        content_type = dict(headers).get(b"content-type", b"")
+        if content_type.startswith(b"application/json"):
+            data = json.loads(body) if body else None
+            body = json.dumps({"data": data, "debug": {"sql": stats.as_dict()}}, ensure_ascii=False).encode("utf-8")
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+        await send({**start, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+def add_sql_timing(app, base, enabled: bool = SQL_TIMING_ENABLED, debug: bool = SQL_TIMING_DEBUG) -> None:
+    if enabled:
+        install(base)
+        app.add_middleware(SqlTimingMiddleware, debug=debug)
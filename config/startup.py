@@ -0,0 +1,66 @@
+import os
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from config.migrations import SCHEMA_REVISION
+
+# check (по умолчанию) — один SELECT из alembic_version, схему заранее готовит `cli.py migrate`;
+# create — create_all при каждом старте (локально без миграций и в тестах);
+# off — БД не трогается вовсе.
+STARTUP_SCHEMA_MODE = os.getenv("STARTUP_SCHEMA_MODE", "check").strip().lower()
+# Тестовые данные при старте; по умолчанию их загружает отдельная команда `cli.py seed`
+STARTUP_SEED_DATA = os.getenv("STARTUP_SEED_DATA", "false").strip().lower() in ("1", "true", "yes", "on")
+
+SCHEMA_MODES = ("create", "check", "off")
+
+
+class SchemaVersionError(RuntimeError):
+    pass
+
+
+def check_schema_version(engine, expected: str = SCHEMA_REVISION) -> str:
+    """Ревизия схемы из alembic_version; если она не та, что ждёт код, — SchemaVersionError.
+
+    В отличие от create_all не отражает таблицы: на MySQL это один запрос
+    вместо запроса на каждую таблицу.
+    """
+    try:
+        with engine.connect() as connection:
+            versions = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    except DBAPIError as exc:
+        raise SchemaVersionError("Database schema is not migrated: run `python cli.py migrate`") from exc
+    if versions != [expected]:
+        found = ", ".join(versions) or "none"
+        raise SchemaVersionError(f"Database schema revision {found} does not match {expected}: run `python cli.py migrate`")
+    return expected
+
+
+def seed_test_data(session_factory) -> None:
+    # Загрузчик тянет за собой хеширование паролей — импортируем только когда он нужен
+    from config.data_loader import DataLoader
+    db = session_factory()
+    try:
+        DataLoader(db).load_test_data()
+    finally:
+        db.close()
+
+
+def prepare_database(engine, metadata, session_factory, mode: str = STARTUP_SCHEMA_MODE,
+                     seed: bool = STARTUP_SEED_DATA) -> dict:
+    """Подготовка БД в lifespan; возвращает длительность шагов в секундах."""
+    if mode not in SCHEMA_MODES:
+        raise ValueError(f"Unknown STARTUP_SCHEMA_MODE: {mode}")
+    timings = {}
+    started = time.perf_counter()
+    if mode == "create":
+        metadata.create_all(bind=engine)
+    elif mode == "check":
+        check_schema_version(engine)
+    timings["schema"] = time.perf_counter() - started
+    if seed:
+        started = time.perf_counter()
+        seed_test_data(session_factory)
+        timings["seed"] = time.perf_counter() - started
+    return timings
@@ -0,0 +1,52 @@
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+# Сессии текущего HTTP-запроса; список создаёт UnitOfWorkRoute, get_db в него добавляет
+_request_sessions: ContextVar[Optional[List]] = ContextVar("request_sessions", default=None)
+
+
+@contextmanager
+def unit_of_work(db: Session):
+    """Явная единица работы: один коммит в конце блока, откат при исключении.
+
+    Репозитории только flush'ат, поэтому всё, что сделано внутри блока,
+    попадает в БД одной транзакцией.
+    """
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+
+
+@asynccontextmanager
+async def async_unit_of_work(db):
+    try:
+        yield db
+        await db.commit()
+    except BaseException:
+        await db.rollback()
+        raise
+
+
+def begin_request() -> object:
+    return _request_sessions.set([])
+
+
+def end_request(token) -> List:
+    sessions = _request_sessions.get() or []
+    _request_sessions.reset(token)
+    return sessions
+
+
+def track_request_session(db) -> bool:
+    """Отдаёт сессию запросу на коммит; False — запрос без единицы работы (коммитит get_db)."""
+    sessions = _request_sessions.get()
+    if sessions is None:
+        return False
+    sessions.append(db)
+    return True
@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+from sqlalchemy import event, select, update, insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+ENTITY_VERSION_STORE = os.getenv("ENTITY_VERSION_STORE", "database")
+ENTITY_VERSION_TTL_SECONDS = float(os.getenv("ENTITY_VERSION_TTL_SECONDS", "1"))
+
+_CHANGED_KEY = "changed_entities"
+
+
+class MemoryVersionStore:
+    """Счётчики версий в памяти процесса (ENTITY_VERSION_STORE=memory).
+
+    Корректны, только если запись и чтение идут в одном процессе: воркер, не
+    видевший чужой записи, продолжит отвечать 304 на старый ETag. Поэтому по
+    умолчанию используется DatabaseVersionStore.
+    """
+
+    def __init__(self):
+        # Эпоха отличает перезапуски процесса, чтобы старые ETag не совпали с новыми
+        self.epoch = uuid.uuid4().hex[:8]
+        self._versions = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def serves(self, bind) -> bool:
+        return True
+
+    def get(self, entity: str) -> str:
+        with self._lock:
+            return f"{self.epoch}.{self._versions[entity]}"
+
+    def bump(self, entity: str) -> None:
+        with self._lock:
+            self._versions[entity] += 1
+
+
+class DatabaseVersionStore:
+    """Версии в таблице entity_versions, общие для всех воркеров.
+
+    Чтение кэшируется в процессе на ttl секунд, так что опрос без изменений
+    обходится без запросов к БД; свои записи видны сразу.
+    """
+
+    def __init__(self, engine=None, ttl: float = ENTITY_VERSION_TTL_SECONDS):
+        self._engine = engine
+        self.ttl = ttl
+        self._cached = {}
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from config.database import engine
+            self._engine = engine
+        return self._engine
+
+    def serves(self, bind) -> bool:
+        # Версии описывают свою БД: записи в другие (наборы бенчмарков, генератор) их не трогают
+        from config.database import same_database
+        return same_database(bind, self.engine)
+
+    def get(self, entity: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cached.get(entity)
+            if cached and cached[1] > now:
+                return str(cached[0])
+        from models.entity_version import EntityVersion
+        with self.engine.connect() as connection:
+            version = connection.execute(
+                select(EntityVersion.version).where(EntityVersion.entity == entity)
+            ).scalar() or 0
+        with self._lock:
+            self._cached[entity] = (version, now + self.ttl)
+        return str(version)
+
+    def bump(self, entity: str) -> None:
+        from models.entity_version import EntityVersion
+        table = EntityVersion.__table__
+        with self.engine.begin() as connection:
+            updated = connection.execute(
+                update(table).where(table.c.entity == entity).values(version=table.c.version + 1)
+            ).rowcount
+            if not updated:
+                try:
+                    with connection.begin_nested():
+                        connection.execute(insert(table).values(entity=entity, version=1))
+                except IntegrityError:
+                    connection.execute(
+                        update(table).where(table.c.entity == entity).values(version=table.c.version + 1)
+                    )
+            version = connection.execute(select(table.c.version).where(table.c.entity == entity)).scalar()
+        with self._lock:
+            self._cached[entity] = (version, time.monotonic() + self.ttl)
+
+
+_store = DatabaseVersionStore() if ENTITY_VERSION_STORE == "database" else MemoryVersionStore()
+
+
+def get_version_store():
+    return _store
+
+
+def set_version_store(store) -> None:
+    global _store
+    _store = store
+
+
+def mark_changed(db: Session, *entities: str) -> None:
+    """Отмечает изменённые таблицы для записей в обход ORM (bulk insert, UPDATE из Core)."""
+    db.info.setdefault(_CHANGED_KEY, set()).update(entities)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_entities(session, flush_context):
+    changed = session.info.setdefault(_CHANGED_KEY, set())
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(instance, "__tablename__", None)
+        if table:
+            changed.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_dml(orm_execute_state):
+    # UPDATE/DELETE через session.execute() идут мимо flush
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            mark_changed(orm_execute_state.session, table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_entities(session):
+    # Версия растёт только после коммита, иначе читатель мог бы закэшировать старые данные под новым ETag
+    changed = session.info.pop(_CHANGED_KEY, None)
+    store = get_version_store()
+    if changed and store.serves(session.bind):
+        for entity in changed:
+            store.bump(entity)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_entities(session):
+    session.info.pop(_CHANGED_KEY, None)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from config.database import get_async_db
+from controllers.pagination import set_next_cursor
+from services.async_author_service import AsyncAuthorService
+from schemas.author_schema import AuthorResponse, AuthorCreate, AuthorUpdate
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/async/authors", tags=["authors (async)"], route_class=UnitOfWorkRoute)
+
+@router.get("/", response_model=List[AuthorResponse])
+async def get_all_authors(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)):
+    author_service = AsyncAuthorService(db)
+    page = await author_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/{author_id}", response_model=AuthorResponse)
+async def get_author_by_id(author_id: int, db: AsyncSession = Depends(get_async_db)):
+    author_service = AsyncAuthorService(db)
+    author = await author_service.find_by_id(author_id)
+    if not author:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Author with id {author_id} not found"
+        )
+    return author
+
+@router.post("/", response_model=AuthorResponse, status_code=status.HTTP_201_CREATED)
+async def create_author(author_create: AuthorCreate, db: AsyncSession = Depends(get_async_db)):
+    author_service = AsyncAuthorService(db)
+    return await author_service.save(author_create)
+
+@router.put("/{author_id}", response_model=AuthorResponse)
+async def update_author(author_id: int, author_update: AuthorUpdate, db: AsyncSession = Depends(get_async_db)):
+    author_service = AsyncAuthorService(db)
+    author = await author_service.update(author_id, author_update)
+    if not author:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Author with id {author_id} not found"
+        )
+    return author
+
+@router.delete("/{author_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_author(author_id: int, db: AsyncSession = Depends(get_async_db)):
+    author_service = AsyncAuthorService(db)
+    if not await author_service.delete_by_id(author_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Author with id {author_id} not found"
+        )
@@ -0,0 +1,165 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from config.categories import get_category_directory
+from config.database import get_async_db
+from config.dependencies import get_current_user_async
+from controllers.pagination import set_next_cursor
+from models.category import Category
+from repositories.loading import JOINED
+from services.async_book_service import AsyncBookService
+from services.async_author_service import AsyncAuthorService
+from schemas.book_schema import BookResponse, BookCreate, BookUpdate
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/async/books", tags=["books (async)"], route_class=UnitOfWorkRoute)
+
+async def _category_exists(db: AsyncSession, category_id: int) -> bool:
+    # Справочник в памяти отвечает без запроса; в таблицу идём только за неизвестным id
+    snapshot = get_category_directory().for_session(db)
+    if snapshot is not None and category_id in snapshot.by_id:
+        return True
+    return await db.get(Category, category_id) is not None
+
+@router.get("/", response_model=List[BookResponse])
+async def get_all_books(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)):
+    book_service = AsyncBookService(db)
+    page = await book_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/public/", response_model=List[BookResponse])
+async def get_public_books(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    page = await book_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/{book_id}", response_model=BookResponse)
+async def get_book_by_id(
+    book_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
+):
+    book_service = AsyncBookService(db, JOINED)
+    book = await book_service.find_by_id(book_id)
+    if not book:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+    return book
+
+@router.post("/", response_model=BookResponse, status_code=status.HTTP_201_CREATED)
+async def create_book(
+    book_create: BookCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
+):
+    book_service = AsyncBookService(db)
+    author_service = AsyncAuthorService(db)
+    
+    if not await author_service.find_by_id(book_create.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"The author with ID {book_create.author_id} does not exist."
+        )
+    if book_create.category_id and not await _category_exists(db, book_create.category_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Category with ID {book_create.category_id} does not exist")
+    if await book_service.find_by_isbn(book_create.isbn):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A book with ISBN {book_create.isbn} already exists"
+        )
+    
+    return await book_service.save(book_create)
+
+@router.put("/{book_id}", response_model=BookResponse)
+async def update_book(book_id: int, book_update: BookUpdate, db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    
+    existing_book = await book_service.find_by_id(book_id)
+    if not existing_book:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+    if book_update.author_id:
+        author_service = AsyncAuthorService(db)
+        if not await author_service.find_by_id(book_update.author_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"The author with ID {book_update.author_id} does not exist."
+            )
+    if book_update.isbn and book_update.isbn != existing_book.isbn:
+        book_with_isbn = await book_service.find_by_isbn(book_update.isbn)
+        if book_with_isbn and book_with_isbn.id != book_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A book with ISBN {book_update.isbn} already exists"
+            )
+    
+    return await book_service.update(book_id, book_update)
+
+@router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_book(book_id: int, db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    if not await book_service.delete_by_id(book_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {book_id} not found"
+        )
+
+@router.get("/search/title/{title}", response_model=List[BookResponse])
+async def search_books_by_title(
+    title: str,
+    limit: int = Query(50, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    return await book_service.search_by_title(title, limit)
+
+@router.get("/author/{author_id}", response_model=List[BookResponse])
+async def get_books_by_author(author_id: int, db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    return await book_service.find_by_author_id(author_id)
+
+@router.get("/isbn/{isbn}", response_model=BookResponse)
+async def get_book_by_isbn(isbn: str, db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db, JOINED)
+    book = await book_service.find_by_isbn(isbn)
+    if not book:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ISBN {isbn} not found"
+        )
+    return book
+
+@router.get("/available/", response_model=List[BookResponse])
+async def get_available_books(db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    return await book_service.find_available_books()
+
+@router.get("/overdue/", response_model=List[BookResponse])
+async def get_overdue_books(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)):
+    book_service = AsyncBookService(db)
+    page = await book_service.find_overdue_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
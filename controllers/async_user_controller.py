@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from config.database import get_async_db
+from controllers.pagination import set_next_cursor
+from services.async_user_service import AsyncUserService
+from schemas.user_schema import UserResponse, UserCreate, UserUpdate
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/async/users", tags=["users (async)"], route_class=UnitOfWorkRoute)
+
+@router.get("/", response_model=List[UserResponse])
+async def get_all_users(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    page = await user_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/{user_id}", response_model=UserResponse)
+async def get_user_by_id(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    user = await user_service.find_by_id(user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found"
+        )
+    return user
+
+@router.post("/", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(user_create: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    
+    if await user_service.exists_by_email(user_create.email):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email already exists"
+        )
+    
+    return await user_service.save(user_create)
+
+@router.put("/{user_id}", response_model=UserResponse)
+async def update_user(user_id: int, user_update: UserUpdate, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    user = await user_service.update(user_id, user_update)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found"
+        )
+    return user
+
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    if not await user_service.delete_by_id(user_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with id {user_id} not found"
+        )
+
+@router.get("/email/{email}", response_model=UserResponse)
+async def get_user_by_email(email: str, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    user = await user_service.find_by_email(email)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"User with email {email} not found"
+        )
+    return user
+
+@router.get("/search/{name}", response_model=List[UserResponse])
+async def search_users_by_name(name: str, db: AsyncSession = Depends(get_async_db)):
+    user_service = AsyncUserService(db)
+    return await user_service.search_by_name(name)
@@ -9,8 +9,9 @@ from services.auth_service import AuthService
 from services.user_service import UserService
 from schemas.auth_schema import LoginRequest, Token, UserRegister
 from schemas.user_schema import UserResponse
+from controllers.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/api/auth", tags=["authentication"])
+router = APIRouter(prefix="/api/auth", tags=["authentication"], route_class=UnitOfWorkRoute)
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def register(user_data: UserRegister, db: Session = Depends(get_db)):
@@ -45,10 +46,7 @@ def login(login_data: LoginRequest, db: Session = Depends(get_db)):
         )
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = auth_service.create_access_token(
-        data={"sub": user.email, "user_id": user.id},
-        expires_delta=access_token_expires
-    )
+    access_token = auth_service.create_user_token(user, expires_delta=access_token_expires)
     
     return Token(access_token=access_token)
 
@@ -1,16 +1,47 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from config.database import get_db
+from controllers.pagination import set_next_cursor
+from controllers.caching import conditional, AUTHOR_ENTITIES
+from controllers.streaming import EXPORT_FORMAT_PATTERN, export_response
+from services.export_service import ExportService
 from services.author_service import AuthorService
-from schemas.author_schema import AuthorResponse, AuthorCreate, AuthorUpdate
+from schemas.author_schema import AuthorResponse, AuthorCreate, AuthorUpdate, AuthorStatsResponse
+from controllers.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/api/authors", tags=["authors"])
+router = APIRouter(prefix="/api/authors", tags=["authors"], route_class=UnitOfWorkRoute)
 
-@router.get("/", response_model=List[AuthorResponse])
-def get_all_authors(db: Session = Depends(get_db)):
+@router.get("/", response_model=List[AuthorResponse], dependencies=[Depends(conditional(*AUTHOR_ENTITIES))])
+def get_all_authors(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db)):
     author_service = AuthorService(db)
-    return author_service.find_all()
+    page = author_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+def export_authors(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN),
+    db: Session = Depends(get_db)):
+    export_service = ExportService(db)
+    return export_response(export_service.export_authors(format), format, "authors")
+
+@router.get("/stats", response_model=List[AuthorStatsResponse])
+def get_author_stats(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db)):
+    author_service = AuthorService(db)
+    page = author_service.find_stats_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
 
 @router.get("/{author_id}", response_model=AuthorResponse)
 def get_author_by_id(author_id: int, db: Session = Depends(get_db)):
@@ -1,24 +1,91 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from config.database import get_db
 from services.book_service import BookService
+from repositories.loading import SELECTIN, JOINED
 from services.author_service import AuthorService
 from services.category_service import CategoryService
 from schemas.book_schema import BookResponse, BookCreate, BookUpdate
+from schemas.book_search_schema import BookSearchResponse
+from repositories.book_search import SORTS, BookSearchCriteria
 from config.dependencies import get_current_active_user
+from controllers.pagination import set_next_cursor
+from controllers.caching import conditional, BOOK_ENTITIES
+from controllers.streaming import EXPORT_FORMAT_PATTERN, export_response
+from services.export_service import ExportService
+from services.book_batch_service import BookBatchService
+from schemas.book_batch_schema import BookBatchGetRequest, BookBatchGetResponse, BookBatchWriteRequest, BatchWriteReport
+from controllers.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/api/books", tags=["books"])
+router = APIRouter(prefix="/api/books", tags=["books"], route_class=UnitOfWorkRoute)
 
 @router.get("/", response_model=List[BookResponse])
 def get_all_books(
+    response: Response,
     skip: int = Query(0, ge=0, description="Пропустить записей"),
     limit: int = Query(100, ge=1, le=1000, description="Лимит записей"),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы (X-Next-Cursor)"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)):
     book_service = BookService(db)
-    books = book_service.find_all()
-    return books[skip:skip + limit]
+    page = book_service.find_rows_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+def export_books(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN, description="ndjson или csv"),
+    db: Session = Depends(get_db)):
+    export_service = ExportService(db)
+    return export_response(export_service.export_books(format), format, "books")
+
+@router.post("/batch-get", response_model=BookBatchGetResponse)
+def get_books_batch(
+    request: BookBatchGetRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    batch_service = BookBatchService(db)
+    return batch_service.get_many(request.ids, request.isbns)
+
+@router.post("/batch-create", response_model=BatchWriteReport)
+def create_books_batch(
+    request: BookBatchWriteRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    batch_service = BookBatchService(db)
+    return batch_service.create_many(request.items)
+
+@router.post("/batch-update", response_model=BatchWriteReport)
+def update_books_batch(
+    request: BookBatchWriteRequest,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    batch_service = BookBatchService(db)
+    return batch_service.update_many(request.items)
+
+@router.get("/search", response_model=BookSearchResponse)
+def search_books(
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Часть названия"),
+    author_id: Optional[List[int]] = Query(None, description="ID авторов, можно несколько"),
+    category_id: Optional[List[int]] = Query(None, description="ID категорий, можно несколько"),
+    available: Optional[bool] = Query(None, description="Только доступные (true) или выданные (false)"),
+    year_from: Optional[int] = Query(None, ge=1, le=9998, description="Год издания от"),
+    year_to: Optional[int] = Query(None, ge=1, le=9998, description="Год издания до, включительно"),
+    sort: str = Query("id", pattern="^(" + "|".join(SORTS) + ")$", description="Поле сортировки, '-' — по убыванию"),
+    skip: int = Query(0, ge=0, description="Пропустить записей"),
+    limit: int = Query(20, ge=1, le=100, description="Лимит записей"),
+    facet_size: int = Query(20, ge=1, le=100, description="Максимум значений в фасетах авторов и категорий"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    if year_from is not None and year_to is not None and year_from > year_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="year_from must not be greater than year_to"
+        )
+    criteria = BookSearchCriteria(q, author_id, category_id, available, year_from, year_to)
+    book_service = BookService(db, JOINED)
+    return book_service.search(criteria, sort, skip, limit, facet_size)
 
 @router.get("/{book_id}", response_model=BookResponse)
 def get_book_by_id(
@@ -26,7 +93,7 @@ def get_book_by_id(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_active_user)
 ):
-    book_service = BookService(db)
+    book_service = BookService(db, JOINED)
     book = book_service.find_by_id(book_id)
     if not book:
         raise HTTPException(
@@ -52,8 +119,7 @@ def create_book(
             detail=f"The author with ID {book_create.author_id} does not exist."
         )
     if book_create.category_id:
-        category = category_service.find_by_id(book_create.category_id)
-        if not category:
+        if not category_service.exists_by_id(book_create.category_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Category with ID {book_create.category_id} does not exist")
@@ -86,6 +152,10 @@ def update_book(book_id: int, book_update: BookUpdate, db: Session = Depends(get
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"The author with ID {book_update.author_id} does not exist."
             )
+    if book_update.category_id and not CategoryService(db).exists_by_id(book_update.category_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Category with ID {book_update.category_id} does not exist")
     if book_update.isbn and book_update.isbn != existing_book.isbn:
         book_with_isbn = book_service.find_by_isbn(book_update.isbn)
         if book_with_isbn and book_with_isbn.id != book_id:
@@ -102,14 +172,17 @@ def update_book(book_id: int, book_update: BookUpdate, db: Session = Depends(get
         )
     return updated_book
 
-@router.get("/public/", response_model=List[BookResponse])
+@router.get("/public/", response_model=List[BookResponse], dependencies=[Depends(conditional(*BOOK_ENTITIES))])
 def get_public_books(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db)):
     book_service = BookService(db)
-    books = book_service.find_all()
-    return books[skip:skip + limit]
+    page = book_service.find_rows_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
 
 
 @router.delete("/{book_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -122,23 +195,28 @@ def delete_book(book_id: int, db: Session = Depends(get_db)):
         )
 
 @router.get("/search/title/{title}", response_model=List[BookResponse])
-def search_books_by_title(title: str, db: Session = Depends(get_db)):
+def search_books_by_title(
+    title: str,
+    limit: int = Query(50, ge=1, le=1000, description="Максимум результатов"),
+    db: Session = Depends(get_db)):
+    book_service = BookService(db, SELECTIN)
+    return book_service.search_by_title(title, limit)
+
+@router.post("/search/reindex")
+def rebuild_search_index(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
     book_service = BookService(db)
-    return book_service.find_by_title_containing(title)
+    return {"indexed": book_service.rebuild_title_index()}
 
 @router.get("/author/{author_id}", response_model=List[BookResponse])
 def get_books_by_author(author_id: int, db: Session = Depends(get_db)):
     book_service = BookService(db)
-    return book_service.find_by_author_id(author_id)
-
-@router.get("/search/title/{title}", response_model=List[BookResponse])
-def search_books_by_title(title: str, db: Session = Depends(get_db)):
-    book_service = BookService(db)
-    return book_service.find_by_title_containing(title)
+    return book_service.find_rows_by_author_id(author_id)
 
-@router.get("/isbn/{isbn}", response_model=BookResponse)
+@router.get("/isbn/{isbn}", response_model=BookResponse, dependencies=[Depends(conditional(*BOOK_ENTITIES))])
 def get_book_by_isbn(isbn: str, db: Session = Depends(get_db)):
-    book_service = BookService(db)
+    book_service = BookService(db, JOINED)
     book = book_service.find_by_isbn(isbn)
     if not book:
         raise HTTPException(
@@ -147,12 +225,19 @@ def get_book_by_isbn(isbn: str, db: Session = Depends(get_db)):
         )
     return book
 
-@router.get("/available/", response_model=List[BookResponse])
+@router.get("/available/", response_model=List[BookResponse], dependencies=[Depends(conditional(*BOOK_ENTITIES))])
 def get_available_books(db: Session = Depends(get_db)):
     book_service = BookService(db)
-    return book_service.find_available_books()
+    return book_service.find_available_rows()
 
 @router.get("/overdue/", response_model=List[BookResponse])
-def get_overdue_books(db: Session = Depends(get_db)):
+def get_overdue_books(
+    response: Response,
+    skip: int = Query(0, ge=0, description="Пропустить записей"),
+    limit: int = Query(100, ge=1, le=1000, description="Лимит записей"),
+    cursor: Optional[str] = Query(None, description="Курсор следующей страницы (X-Next-Cursor)"),
+    db: Session = Depends(get_db)):
     book_service = BookService(db)
-    return book_service.find_overdue_books()
\ No newline at end of file
+    page = book_service.find_overdue_rows_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
\ No newline at end of file
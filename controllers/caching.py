@@ -0,0 +1,40 @@
+import hashlib
+
+from fastapi import HTTPException, Request, Response, status
+
+from config.versions import get_version_store
+
+CACHE_CONTROL = "public, no-cache"
+
+
+def _etag(request: Request, entities) -> str:
+    store = get_version_store()
+    versions = ",".join(f"{entity}={store.get(entity)}" for entity in entities)
+    key = f"{request.url.path}?{request.url.query}|{versions}"
+    return '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def conditional(*entities: str):
+    """Зависимость для GET-эндпоинтов: строгий ETag из версий сущностей и URL.
+
+    Совпавший If-None-Match отвечает 304 до обращения к БД: версии берутся
+    из хранилища версий, а не из таблиц.
+    """
+    def dependency(request: Request, response: Response):
+        etag = _etag(request, entities)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _matches(if_none_match, etag):
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+    return dependency
+
+
+BOOK_ENTITIES = ("books", "authors", "categories")
+AUTHOR_ENTITIES = ("authors",)
+CATEGORY_ENTITIES = ("categories",)
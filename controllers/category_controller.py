@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from config.database import get_db
+from controllers.caching import conditional, CATEGORY_ENTITIES
+from services.category_service import CategoryService
+from schemas.category_schema import CategoryResponse, CategoryCreate, CategoryUpdate
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/categories", tags=["categories"], route_class=UnitOfWorkRoute)
+
+@router.get("/", response_model=List[CategoryResponse], dependencies=[Depends(conditional(*CATEGORY_ENTITIES))])
+def get_all_categories(db: Session = Depends(get_db)):
+    category_service = CategoryService(db)
+    return category_service.find_all()
+
+@router.get("/{category_id}", response_model=CategoryResponse)
+def get_category_by_id(category_id: int, db: Session = Depends(get_db)):
+    category_service = CategoryService(db)
+    category = category_service.find_by_id(category_id)
+    if not category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with id {category_id} not found"
+        )
+    return category
+
+@router.post("/", response_model=CategoryResponse, status_code=status.HTTP_201_CREATED)
+def create_category(category_create: CategoryCreate, db: Session = Depends(get_db)):
+    category_service = CategoryService(db)
+    if category_service.exists_by_name(category_create.name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A category named {category_create.name} already exists"
+        )
+    return category_service.save(category_create)
+
+@router.put("/{category_id}", response_model=CategoryResponse)
+def update_category(category_id: int, category_update: CategoryUpdate, db: Session = Depends(get_db)):
+    category_service = CategoryService(db)
+    existing_category = category_service.find_by_id(category_id)
+    if not existing_category:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with id {category_id} not found"
+        )
+    if category_update.name and category_update.name != existing_category.name \
+            and category_service.exists_by_name(category_update.name):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"A category named {category_update.name} already exists"
+        )
+    return category_service.update(category_id, category_update)
+
+@router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_category(category_id: int, db: Session = Depends(get_db)):
+    category_service = CategoryService(db)
+    if not category_service.delete_by_id(category_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Category with id {category_id} not found"
+        )
@@ -0,0 +1,38 @@
+import io
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from sqlalchemy.orm import Session
+from typing import Optional
+from config.database import get_db
+from config.dependencies import get_current_active_user
+from services.import_service import ImportService, FORMATS, detect_format, read_rows
+from schemas.import_schema import ImportReport
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/import", tags=["import"], route_class=UnitOfWorkRoute)
+
+def _rows(upload: UploadFile, fmt: Optional[str]):
+    fmt = fmt or detect_format(upload.filename)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported import format: {fmt}")
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    return read_rows(stream, fmt)
+
+@router.post("/books", response_model=ImportReport)
+def import_books(
+    file: UploadFile = File(..., description="CSV с заголовком или JSONL"),
+    format: Optional[str] = Query(None, description="csv или jsonl; по умолчанию по расширению файла"),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    import_service = ImportService(db, chunk_size)
+    return import_service.import_books(_rows(file, format))
+
+@router.post("/authors", response_model=ImportReport)
+def import_authors(
+    file: UploadFile = File(..., description="CSV с заголовком или JSONL"),
+    format: Optional[str] = Query(None, description="csv или jsonl; по умолчанию по расширению файла"),
+    chunk_size: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    import_service = ImportService(db, chunk_size)
+    return import_service.import_authors(_rows(file, format))
@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from config.database import get_db
+from config.dependencies import get_current_active_user
+from services.book_service import BookService
+from services.loan_service import LoanService
+from schemas.loan_schema import LoanCreate, LoanResponse
+from controllers.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(prefix="/api/loans", tags=["loans"], route_class=UnitOfWorkRoute)
+
+@router.post("/checkout", response_model=LoanResponse, status_code=status.HTTP_201_CREATED)
+def checkout_book(
+    loan_create: LoanCreate,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    loan_service = LoanService(db)
+    # Сначала атомарная выдача, а причину отказа выясняем только после неё
+    loan = loan_service.checkout(loan_create.book_id, current_user.id, loan_create.days)
+    if loan:
+        return loan
+    
+    book_service = BookService(db)
+    if not book_service.find_by_id(loan_create.book_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Book with ID {loan_create.book_id} not found"
+        )
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=f"No available copies of book with ID {loan_create.book_id}"
+    )
+
+@router.post("/{loan_id}/return", response_model=LoanResponse)
+def return_book(
+    loan_id: int,
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    loan_service = LoanService(db)
+    loan = loan_service.find_by_id(loan_id)
+    if not loan or loan.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Loan with ID {loan_id} not found"
+        )
+    if not loan_service.return_loan(loan):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Loan with ID {loan_id} is already returned"
+        )
+    return loan
+
+@router.get("/me", response_model=List[LoanResponse])
+def get_my_loans(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)
+):
+    loan_service = LoanService(db)
+    return loan_service.find_open_by_user_id(current_user.id)
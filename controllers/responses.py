@@ -0,0 +1,10 @@
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Ответ по умолчанию для всех маршрутов. orjson кодирует списки в несколько раз
+# быстрее json.dumps; без него приложение работает на стандартном JSONResponse.
+DEFAULT_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
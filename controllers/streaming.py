@@ -0,0 +1,16 @@
+from typing import Iterator
+
+from fastapi.responses import StreamingResponse
+
+from services.export_service import MEDIA_TYPES
+
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+
+
+def export_response(chunks: Iterator[str], fmt: str, name: str) -> StreamingResponse:
+    extension = "ndjson" if fmt == "ndjson" else "csv"
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in chunks),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{extension}"'},
+    )
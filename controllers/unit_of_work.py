@@ -0,0 +1,40 @@
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.unit_of_work import begin_request, end_request
+
+
+async def _finish(sessions, commit: bool) -> None:
+    for db in sessions:
+        if isinstance(db, AsyncSession):
+            await (db.commit() if commit else db.rollback())
+        else:
+            await run_in_threadpool(db.commit if commit else db.rollback)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """Маршрут, который коммитит сессии запроса ровно один раз.
+
+    Коммит идёт после того, как ответ уже сериализован, но до отправки:
+    ошибка коммита превращается в 500, а не теряется после ответа 2xx.
+    Исключение или ответ с кодом 4xx/5xx откатывают транзакцию.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            token = begin_request()
+            try:
+                response = await handler(request)
+            except BaseException:
+                await _finish(end_request(token), commit=False)
+                raise
+            await _finish(end_request(token), commit=response.status_code < 400)
+            return response
+
+        return unit_of_work_handler
@@ -1,16 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from config.database import get_db
+from controllers.pagination import set_next_cursor
+from controllers.streaming import EXPORT_FORMAT_PATTERN, export_response
+from config.dependencies import get_current_active_user
+from services.export_service import ExportService
 from services.user_service import UserService
 from schemas.user_schema import UserResponse, UserCreate, UserUpdate
+from controllers.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter(prefix="/api/users", tags=["users"])
+router = APIRouter(prefix="/api/users", tags=["users"], route_class=UnitOfWorkRoute)
 
 @router.get("/", response_model=List[UserResponse])
-def get_all_users(db: Session = Depends(get_db)):
+def get_all_users(
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None),
+    db: Session = Depends(get_db)):
     user_service = UserService(db)
-    return user_service.find_all()
+    page = user_service.find_page(limit, cursor, skip)
+    set_next_cursor(response, page)
+    return page.items
+
+@router.get("/export")
+def export_users(
+    format: str = Query("ndjson", pattern=EXPORT_FORMAT_PATTERN),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_active_user)):
+    export_service = ExportService(db)
+    return export_response(export_service.export_users(format), format, "users")
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user_by_id(user_id: int, db: Session = Depends(get_db)):
@@ -1,38 +1,67 @@
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from contextlib import asynccontextmanager
-from config.database import engine, Base, get_db
-from config.data_loader import DataLoader
+from config.database import engine, Base, dispose_async_engine, get_db, get_pool_status
+from config.cache import get_entity_cache
+from config import metrics
+from config.readiness import check_database
+from config.passwords import get_password_hasher
+from config.revocation import get_revocation_list, run_revocation_refresher
+from config.categories import get_category_directory
 from config.exception_handlers import add_exception_handlers
+from config.sql_timing import add_sql_timing
+from config.startup import prepare_database
 from controllers import book_controller, author_controller, user_controller, auth_controller
+from controllers import async_book_controller, async_author_controller, async_user_controller
+from controllers import import_controller, loan_controller, category_controller
+from controllers.responses import DEFAULT_RESPONSE_CLASS
+from services.overdue_sweeper import OVERDUE_SWEEP_INTERVAL_SECONDS, run_overdue_sweeper
 import models
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    
     from config.database import SessionLocal
-    db = SessionLocal()
-    try:
-        data_loader = DataLoader(db)
-        data_loader.load_test_data()
-    finally:
-        db.close()
+    prepare_database(engine, Base.metadata, SessionLocal)
+    
+    get_revocation_list().refresh()
+    get_category_directory().load()
+    
+    revocations = asyncio.create_task(run_revocation_refresher())
+    sweeper = None
+    if OVERDUE_SWEEP_INTERVAL_SECONDS > 0:
+        sweeper = asyncio.create_task(run_overdue_sweeper())
     
     yield
+    
+    revocations.cancel()
+    if sweeper is not None:
+        sweeper.cancel()
+    get_password_hasher().shutdown()
+    await dispose_async_engine()
 
 app = FastAPI(
     title="Library Management System",
     description="Spring Boot-like library management API built with FastAPI",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS
 )
 
 add_exception_handlers(app)
+add_sql_timing(app, Base)
+app.add_middleware(metrics.MetricsMiddleware)
 
 app.include_router(auth_controller.router)
 app.include_router(book_controller.router)
 app.include_router(author_controller.router)
+app.include_router(category_controller.router)
 app.include_router(user_controller.router)
+app.include_router(async_book_controller.router)
+app.include_router(async_author_controller.router)
+app.include_router(async_user_controller.router)
+app.include_router(import_controller.router)
+app.include_router(loan_controller.router)
 
 @app.get("/")
 def read_root():
@@ -40,8 +69,33 @@ def read_root():
 
 @app.get("/health")
 def health_check():
+    """Liveness: процесс жив и отвечает; состояние БД здесь не проверяется."""
     return {"status": "UP", "service": "library-management"}
 
+@app.get("/ready")
+async def readiness_check():
+    database = await check_database(engine)
+    ready = database["status"] == "UP"
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "READY" if ready else "NOT_READY", "checks": {"database": database}}
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    families = metrics.get_http_metrics().families()
+    families += metrics.pool_families(get_pool_status())
+    families += metrics.cache_families("entity", get_entity_cache().stats())
+    return PlainTextResponse(metrics.render(families), media_type=metrics.CONTENT_TYPE)
+
+@app.get("/cache/stats")
+def cache_stats():
+    return get_entity_cache().stats()
+
+@app.get("/db/pool")
+def db_pool_stats():
+    return get_pool_status()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
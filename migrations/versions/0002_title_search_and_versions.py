@@ -0,0 +1,39 @@
+"""title trigram index and entity versions
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-02-03 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "book_title_trigrams",
+        sa.Column("trigram", sa.String(length=3), nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("trigram", "book_id"),
+    )
+    op.create_index("ix_book_title_trigrams_book_id", "book_title_trigrams", ["book_id"])
+
+    op.create_table(
+        "entity_versions",
+        sa.Column("entity", sa.String(length=50), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("entity"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("entity_versions")
+    op.drop_index("ix_book_title_trigrams_book_id", table_name="book_title_trigrams")
+    op.drop_table("book_title_trigrams")
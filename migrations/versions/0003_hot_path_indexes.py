@@ -0,0 +1,44 @@
+"""indexes for repository filter columns
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-02-17 10:00:00
+
+Каждый индекс обслуживает конкретные запросы репозиториев:
+
+- ix_books_author_id, ix_books_category_id — книги автора/категории,
+  подсчёт книг автора, каскадное удаление;
+- ix_books_available_copies — доступные книги;
+- ix_authors_last_name — поиск и сортировка авторов по фамилии;
+- ix_loans_status_due_date — фоновый перевод в OVERDUE и список просроченных книг;
+- ix_loans_user_id_status — открытые займы читателя;
+- ix_loans_book_id — проверка внешнего ключа при удалении книги.
+
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_books_author_id", "books", ["author_id"]),
+    ("ix_books_category_id", "books", ["category_id"]),
+    ("ix_books_available_copies", "books", ["available_copies"]),
+    ("ix_authors_last_name", "authors", ["last_name"]),
+    ("ix_loans_status_due_date", "loans", ["status", "due_date"]),
+    ("ix_loans_user_id_status", "loans", ["user_id", "status"]),
+    ("ix_loans_book_id", "loans", ["book_id"]),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
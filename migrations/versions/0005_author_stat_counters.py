@@ -0,0 +1,37 @@
+"""author stat counters
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-03-17 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+COUNTERS = ("book_count", "available_copies", "open_loan_count")
+
+
+def upgrade() -> None:
+    for name in COUNTERS:
+        op.add_column("authors", sa.Column(name, sa.Integer(), nullable=False, server_default="0"))
+    # Начальные значения; дальше их ведёт приложение при AUTHOR_STATS_COUNTERS=true
+    op.execute(
+        "UPDATE authors SET "
+        "book_count = (SELECT COUNT(*) FROM books WHERE books.author_id = authors.id), "
+        "available_copies = (SELECT COALESCE(SUM(books.available_copies), 0) FROM books "
+        "WHERE books.author_id = authors.id), "
+        "open_loan_count = (SELECT COUNT(*) FROM loans JOIN books ON books.id = loans.book_id "
+        "WHERE books.author_id = authors.id AND loans.status IN ('ACTIVE', 'OVERDUE'))"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("authors") as batch:
+        for name in reversed(COUNTERS):
+            batch.drop_column(name)
@@ -0,0 +1,22 @@
+"""user revocations revoked_at index
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-03-24 10:00:00
+
+"""
+from alembic import op
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_revocations_revoked_at", "user_revocations", ["revoked_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_revocations_revoked_at", table_name="user_revocations")
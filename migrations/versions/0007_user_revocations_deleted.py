@@ -0,0 +1,41 @@
+"""user revocations deleted flag, users autoincrement on sqlite
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-03-31 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def _recreate_users(autoincrement: bool) -> None:
+    # Проверка внешних ключей на время миграций выключена (sqlite_foreign_keys_off):
+    # иначе DROP старой users при живых ссылках из loans не прошёл бы
+    with op.batch_alter_table("users", recreate="always",
+                              table_kwargs={"sqlite_autoincrement": autoincrement}):
+        pass
+    violations = op.get_bind().exec_driver_sql("PRAGMA foreign_key_check").all()
+    if violations:
+        raise RuntimeError(f"Foreign key violations after rebuilding users: {violations}")
+
+
+def upgrade() -> None:
+    op.add_column("user_revocations", sa.Column("deleted", sa.Boolean(), nullable=False, server_default=sa.false()))
+    # Отзыв удалённого пользователя бессрочен, поэтому его id не должен достаться
+    # новому; MySQL и PostgreSQL id не переиспользуют, SQLite — только с AUTOINCREMENT
+    if op.get_bind().dialect.name == "sqlite":
+        _recreate_users(autoincrement=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        _recreate_users(autoincrement=False)
+    with op.batch_alter_table("user_revocations") as batch:
+        batch.drop_column("deleted")
@@ -2,4 +2,7 @@ from .author import Author
 from .book import Book
 from .category import Category
 from .user import User
-from .loan import Loan, LoanStatus
\ No newline at end of file
+from .loan import Loan, LoanStatus
+from .book_title_trigram import BookTitleTrigram
+from .entity_version import EntityVersion
+from .user_revocation import UserRevocation
\ No newline at end of file
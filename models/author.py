@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Text
+from sqlalchemy import Column, Integer, String, Date, Text, Index
 from sqlalchemy.orm import relationship
 from config.database import Base
 
@@ -13,7 +13,16 @@ class Author(Base):
     birth_date = Column(Date, nullable=True)
     biography = Column(Text, nullable=True)
     
+    # Денормализованные счётчики по книгам автора; ведутся при AUTHOR_STATS_COUNTERS=true
+    book_count = Column(Integer, nullable=False, default=0, server_default="0")
+    available_copies = Column(Integer, nullable=False, default=0, server_default="0")
+    open_loan_count = Column(Integer, nullable=False, default=0, server_default="0")
+    
     books = relationship("Book", back_populates="author", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index("ix_authors_last_name", "last_name"),
+    )
+    
     def __repr__(self):
         return f"<Author {self.first_name} {self.last_name}>"
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from config.database import Base
 
@@ -20,6 +20,12 @@ class Book(Base):
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     category = relationship("Category", back_populates="books")
     
+    __table_args__ = (
+        Index("ix_books_author_id", "author_id"),
+        Index("ix_books_category_id", "category_id"),
+        Index("ix_books_available_copies", "available_copies"),
+    )
+    
     def __repr__(self):
         return f"<Book {self.title}>"
     
@@ -0,0 +1,76 @@
+import re
+import unicodedata
+from functools import lru_cache
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, event, insert, delete, inspect
+from config.database import Base
+from models.book import Book
+
+class BookTitleTrigram(Base):
+    """Инвертированный индекс названий книг: триграмма -> книга."""
+    __tablename__ = "book_title_trigrams"
+
+    trigram = Column(String(3), primary_key=True)
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_book_title_trigrams_book_id", "book_id"),
+    )
+
+    def __repr__(self):
+        return f"<BookTitleTrigram {self.trigram!r} -> {self.book_id}>"
+
+
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+_WORD = re.compile(r"[^\W_]+")
+
+
+def normalize(text: str) -> str:
+    # Снимаем регистр и диакритику (ё -> е), как это делает accent-insensitive collation MySQL
+    return _COMBINING.sub("", unicodedata.normalize("NFKD", text.casefold()))
+
+
+def words(text: str) -> list:
+    return _WORD.findall(normalize(text))
+
+
+@lru_cache(maxsize=65536)
+def _word_trigrams(word: str) -> tuple:
+    # Слова в названиях повторяются, поэтому при массовом импорте нарезка почти всегда из кэша
+    padded = f"  {word} "
+    return tuple(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def title_trigrams(text: str) -> set:
+    """Триграммы каждого слова с отбивкой пробелами, как в pg_trgm."""
+    result = set()
+    for word in words(text):
+        result.update(_word_trigrams(word))
+    return result
+
+
+def index_rows(book_id: int, title: str) -> list:
+    return [{"trigram": trigram, "book_id": book_id} for trigram in title_trigrams(title or "")]
+
+
+@event.listens_for(Book, "after_insert")
+def _index_inserted_book(mapper, connection, target):
+    rows = index_rows(target.id, target.title)
+    if rows:
+        connection.execute(insert(BookTitleTrigram.__table__), rows)
+
+
+@event.listens_for(Book, "after_update")
+def _reindex_updated_book(mapper, connection, target):
+    if not inspect(target).attrs.title.history.has_changes():
+        return
+    table = BookTitleTrigram.__table__
+    connection.execute(delete(table).where(table.c.book_id == target.id))
+    rows = index_rows(target.id, target.title)
+    if rows:
+        connection.execute(insert(table), rows)
+
+
+@event.listens_for(Book, "before_delete")
+def _unindex_deleted_book(mapper, connection, target):
+    table = BookTitleTrigram.__table__
+    connection.execute(delete(table).where(table.c.book_id == target.id))
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String
+from config.database import Base
+
+class EntityVersion(Base):
+    """Версия данных по типу сущности: растёт при каждой закоммиченной записи."""
+    __tablename__ = "entity_versions"
+    
+    entity = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<EntityVersion {self.entity}={self.version}>"
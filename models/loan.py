@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from config.database import Base
 import enum
@@ -27,5 +27,14 @@ class Loan(Base):
     
     status = Column(Enum(LoanStatus), default=LoanStatus.ACTIVE)
     
+    __table_args__ = (
+        # Поиск просроченных: status = ACTIVE AND due_date < now и выборка OVERDUE
+        Index("ix_loans_status_due_date", "status", "due_date"),
+        # Займы читателя (и открытые займы читателя), каскадное удаление пользователя
+        Index("ix_loans_user_id_status", "user_id", "status"),
+        # Проверка внешнего ключа при удалении книги
+        Index("ix_loans_book_id", "book_id"),
+    )
+    
     def __repr__(self):
         return f"<Loan {self.id}>"
\ No newline at end of file
@@ -10,7 +10,8 @@ class User(Base):
     
     email = Column(String(100), nullable=False, unique=True)
     
-    password = Column(String(255), nullable=False)
+    # Хеш пароля не попадает в кэш сущностей: вход сверяется только с БД
+    password = Column(String(255), nullable=False, info={"cached": False})
     
     first_name = Column(String(50), nullable=False)
     
@@ -20,5 +21,12 @@ class User(Base):
     
     loans = relationship("Loan", back_populates="user", cascade="all, delete-orphan")
     
+    # created_at возвращается тем же INSERT ... RETURNING, без отдельного SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Без AUTOINCREMENT SQLite отдаёт id удалённой последней строки новому
+    # пользователю, и тот унаследовал бы отзыв токенов удалённого
+    __table_args__ = {"sqlite_autoincrement": True}
+    
     def __repr__(self):
         return f"<User {self.email}>"
\ No newline at end of file
@@ -0,0 +1,51 @@
+import time
+from sqlalchemy import Column, Integer, Double, Boolean, Index, event, insert, inspect, false
+from sqlalchemy.orm import object_session
+from config.database import Base
+from config.revocation import record_revocation
+from models.user import User
+
+class UserRevocation(Base):
+    """Журнал отзыва токенов: токены пользователя, выданные до revoked_at, недействительны.
+
+    Для удалённого пользователя (deleted) недействительны все его токены.
+    """
+    __tablename__ = "user_revocations"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Без внешнего ключа: запись должна пережить удаление пользователя
+    user_id = Column(Integer, nullable=False)
+    revoked_at = Column(Double, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False, server_default=false())
+    
+    __table_args__ = (
+        # Дочитывание журнала воркерами: revoked_at > последний виденный отзыв - lookback
+        Index("ix_user_revocations_revoked_at", "revoked_at"),
+    )
+    
+    def __repr__(self):
+        return f"<UserRevocation {self.user_id} @ {self.revoked_at}>"
+
+
+# Поля, которые попадают в токен: их изменение делает выданные токены устаревшими
+CLAIM_FIELDS = ("email", "first_name", "last_name", "password")
+
+
+def _revoke(connection, target, deleted: bool = False):
+    revoked_at = time.time()
+    connection.execute(insert(UserRevocation.__table__).values(user_id=target.id, revoked_at=revoked_at,
+                                                               deleted=deleted))
+    record_revocation(object_session(target), target.id, revoked_at, deleted)
+
+
+@event.listens_for(User, "after_update")
+def _revoke_updated_user(mapper, connection, target):
+    attrs = inspect(target).attrs
+    if any(attrs[field].history.has_changes() for field in CLAIM_FIELDS):
+        _revoke(connection, target)
+
+
+@event.listens_for(User, "after_delete")
+def _revoke_deleted_user(mapper, connection, target):
+    _revoke(connection, target, deleted=True)
+
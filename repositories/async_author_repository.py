@@ -0,0 +1,74 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from models.author import Author
+from repositories.entity_cache import invalidate_on_commit
+from repositories.pagination import Page, keyset, make_page
+from sqlalchemy import select, or_, func
+
+class AsyncAuthorRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _all(self, statement) -> List[Author]:
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+    
+    async def find_all(self) -> List[Author]:
+        return await self._all(select(Author))
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Author]:
+        rows = await self._all(keyset(select(Author), Author.id, limit, cursor, offset))
+        return make_page(rows, Author.id, limit)
+    
+    async def find_by_id(self, author_id: int) -> Optional[Author]:
+        return await self.db.get(Author, author_id)
+    
+    async def save(self, author: Author) -> Author:
+        self.db.add(author)
+        await self.db.flush()
+        # Снимки кэша сущностей читают синхронные пути: сбрасываем их и здесь
+        invalidate_on_commit(self.db.sync_session, Author, id=author.id)
+        return author
+    
+    async def delete_by_id(self, author_id: int) -> bool:
+        # Каскадное удаление требует загруженной коллекции: лениво в AsyncSession её не получить
+        result = await self.db.execute(
+            select(Author).options(selectinload(Author.books)).where(Author.id == author_id)
+        )
+        author = result.scalars().first()
+        if author:
+            await self.db.delete(author)
+            await self.db.flush()
+            invalidate_on_commit(self.db.sync_session, Author, id=author_id)
+            return True
+        return False
+    
+    async def update(self, author_id: int, author_data: dict) -> Optional[Author]:
+        author = await self.find_by_id(author_id)
+        if author:
+            for key, value in author_data.items():
+                setattr(author, key, value)
+            await self.db.flush()
+            invalidate_on_commit(self.db.sync_session, Author, id=author_id)
+        return author
+    
+    async def search_by_name(self, search_term: str) -> List[Author]:
+        return await self._all(select(Author).where(
+            or_(
+                Author.first_name.ilike(f"%{search_term}%"),
+                Author.last_name.ilike(f"%{search_term}%")
+            )
+        ))
+    
+    async def find_by_last_name(self, last_name: str) -> List[Author]:
+        return await self._all(select(Author).where(Author.last_name.ilike(f"%{last_name}%")))
+    
+    async def find_authors_with_books(self) -> List[Author]:
+        from models.book import Book
+        return await self._all(select(Author).join(Book).distinct())
+    
+    async def count_books_by_author_id(self, author_id: int) -> int:
+        from models.book import Book
+        result = await self.db.execute(select(func.count(Book.id)).where(Book.author_id == author_id))
+        return result.scalar_one()
@@ -0,0 +1,109 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import List, Optional
+from models.book import Book
+from models.book_title_trigram import BookTitleTrigram, title_trigrams
+from repositories.loading import SELECTIN, apply_loading, validate_strategy
+from repositories.pagination import Page, keyset, make_page
+from sqlalchemy import select, func
+
+class AsyncBookRepository:
+    def __init__(self, db: AsyncSession, load_strategy: str = SELECTIN):
+        # Ленивая загрузка связей в AsyncSession невозможна, поэтому стратегия обязательна
+        if load_strategy is None:
+            raise ValueError("AsyncBookRepository requires an eager loading strategy")
+        self.db = db
+        self.load_strategy = validate_strategy(load_strategy)
+    
+    def _select(self):
+        return apply_loading(select(Book), self.load_strategy, Book.author, Book.category)
+    
+    async def _all(self, statement) -> List[Book]:
+        result = await self.db.execute(statement)
+        return list(result.scalars().unique().all())
+    
+    async def _first(self, statement) -> Optional[Book]:
+        result = await self.db.execute(statement.limit(1))
+        return result.scalars().first()
+    
+    async def _reload(self, book_id: int) -> Optional[Book]:
+        statement = self._select().where(Book.id == book_id).execution_options(populate_existing=True)
+        return await self._first(statement)
+    
+    async def find_all(self) -> List[Book]:
+        return await self._all(self._select())
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        rows = await self._all(keyset(self._select(), Book.id, limit, cursor, offset))
+        return make_page(rows, Book.id, limit)
+    
+    async def find_by_id(self, book_id: int) -> Optional[Book]:
+        return await self._first(self._select().where(Book.id == book_id))
+    
+    async def save(self, book: Book) -> Book:
+        self.db.add(book)
+        await self.db.flush()
+        return await self._reload(book.id)
+    
+    async def delete_by_id(self, book_id: int) -> bool:
+        book = await self.find_by_id(book_id)
+        if book:
+            await self.db.delete(book)
+            await self.db.flush()
+            return True
+        return False
+    
+    async def update(self, book_id: int, book_data: dict) -> Optional[Book]:
+        book = await self.find_by_id(book_id)
+        if book:
+            for key, value in book_data.items():
+                setattr(book, key, value)
+            await self.db.flush()
+            book = await self._reload(book_id)
+        return book
+    
+    async def find_by_title_containing(self, title: str) -> List[Book]:
+        return await self._all(self._select().where(Book.title.ilike(f"%{title}%")))
+    
+    async def search_by_title(self, text: str, limit: int = 50, min_similarity: float = 0.5) -> List[Book]:
+        trigrams = title_trigrams(text)
+        if not trigrams:
+            return []
+        required = max(1, int(len(trigrams) * min_similarity + 0.999))
+        score = func.count(BookTitleTrigram.trigram).label("score")
+        ranked = select(BookTitleTrigram.book_id, score).where(
+            BookTitleTrigram.trigram.in_(trigrams)
+        ).group_by(BookTitleTrigram.book_id).having(score >= required).subquery()
+        return await self._all(self._select().join(ranked, Book.id == ranked.c.book_id).order_by(
+            ranked.c.score.desc(), func.length(Book.title), Book.id
+        ).limit(limit))
+    
+    async def find_by_isbn(self, isbn: str) -> Optional[Book]:
+        return await self._first(self._select().where(Book.isbn == isbn))
+    
+    async def find_by_author_id(self, author_id: int) -> List[Book]:
+        return await self._all(self._select().where(Book.author_id == author_id))
+    
+    async def find_by_category_id(self, category_id: int) -> List[Book]:
+        return await self._all(self._select().where(Book.category_id == category_id))
+    
+    async def find_available_books(self, min_copies: int = 1) -> List[Book]:
+        return await self._all(self._select().where(Book.available_copies >= min_copies))
+    
+    async def find_by_title_and_author_lastname(self, title: str, author_lastname: str) -> List[Book]:
+        from models.author import Author
+        return await self._all(self._select().join(Book.author).where(
+            Book.title.ilike(f"%{title}%"),
+            Author.last_name.ilike(f"%{author_lastname}%")
+        ))
+    
+    def _overdue_select(self):
+        from repositories.loan_repository import overdue_book_ids
+        return self._select().where(Book.id.in_(overdue_book_ids(datetime.utcnow())))
+    
+    async def find_overdue_books(self) -> List[Book]:
+        return await self._all(self._overdue_select().order_by(Book.id))
+    
+    async def find_overdue_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        rows = await self._all(keyset(self._overdue_select(), Book.id, limit, cursor, offset))
+        return make_page(rows, Book.id, limit)
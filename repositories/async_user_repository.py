@@ -0,0 +1,79 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing import List, Optional
+from models.user import User
+from repositories.entity_cache import invalidate_on_commit
+from repositories.pagination import Page, keyset, make_page
+from sqlalchemy import select, or_
+
+class AsyncUserRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def _all(self, statement) -> List[User]:
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+    
+    async def _first(self, statement) -> Optional[User]:
+        result = await self.db.execute(statement.limit(1))
+        return result.scalars().first()
+    
+    async def find_all(self) -> List[User]:
+        return await self._all(select(User))
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[User]:
+        rows = await self._all(keyset(select(User), User.id, limit, cursor, offset))
+        return make_page(rows, User.id, limit)
+    
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        return await self.db.get(User, user_id)
+    
+    async def save(self, user: User) -> User:
+        self.db.add(user)
+        await self.db.flush()
+        # Снимки кэша сущностей читают синхронные пути: сбрасываем их и здесь
+        invalidate_on_commit(self.db.sync_session, User, id=user.id, email=user.email)
+        return user
+    
+    async def delete_by_id(self, user_id: int) -> bool:
+        # Каскадное удаление требует загруженной коллекции: лениво в AsyncSession её не получить
+        result = await self.db.execute(
+            select(User).options(selectinload(User.loans)).where(User.id == user_id)
+        )
+        user = result.scalars().first()
+        if user:
+            email = user.email
+            await self.db.delete(user)
+            await self.db.flush()
+            invalidate_on_commit(self.db.sync_session, User, id=user_id, email=email)
+            return True
+        return False
+    
+    async def update(self, user_id: int, user_data: dict) -> Optional[User]:
+        user = await self.find_by_id(user_id)
+        if user:
+            old_email = user.email
+            for key, value in user_data.items():
+                setattr(user, key, value)
+            await self.db.flush()
+            invalidate_on_commit(self.db.sync_session, User, id=user_id, email=old_email)
+            invalidate_on_commit(self.db.sync_session, User, email=user_data.get("email"))
+        return user
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self._first(select(User).where(User.email == email))
+    
+    async def search_by_name(self, search_term: str) -> List[User]:
+        return await self._all(select(User).where(
+            or_(
+                User.first_name.ilike(f"%{search_term}%"),
+                User.last_name.ilike(f"%{search_term}%")
+            )
+        ))
+    
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.find_by_email(email) is not None
+    
+    async def find_users_with_active_loans(self) -> List[User]:
+        from models.loan import Loan, LoanStatus
+        return await self._all(select(User).join(Loan).where(Loan.status == LoanStatus.ACTIVE).distinct())
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from models.author import Author
-from sqlalchemy import or_, func
+from repositories.bulk import insert_many
+from repositories.entity_cache import cached_lookup, invalidate_on_commit
+from repositories.author_stats import counters_enabled
+from repositories.pagination import Page, keyset, make_page, paginate
+from sqlalchemy import or_, func, select, update
 
 class AuthorRepository:
     def __init__(self, db: Session):
@@ -10,20 +14,31 @@ class AuthorRepository:
     def find_all(self) -> List[Author]:
         return self.db.query(Author).all()
     
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Author]:
+        return paginate(self.db.query(Author), Author.id, limit, cursor, offset)
+    
+    def iter_export_batches(self, batch_size: int = 1000) -> Iterator[list]:
+        statement = select(
+            Author.id, Author.first_name, Author.last_name, Author.birth_date, Author.biography
+        ).order_by(Author.id).execution_options(yield_per=batch_size)
+        yield from self.db.execute(statement).mappings().partitions()
+    
     def find_by_id(self, author_id: int) -> Optional[Author]:
-        return self.db.query(Author).filter(Author.id == author_id).first()
+        return cached_lookup(self.db, Author, "id", author_id,
+                             lambda: self.db.query(Author).filter(Author.id == author_id).first())
     
     def save(self, author: Author) -> Author:
         self.db.add(author)
-        self.db.commit()
-        self.db.refresh(author)
+        self.db.flush()
+        invalidate_on_commit(self.db, Author, id=author.id)
         return author
     
     def delete_by_id(self, author_id: int) -> bool:
         author = self.find_by_id(author_id)
         if author:
             self.db.delete(author)
-            self.db.commit()
+            self.db.flush()
+            invalidate_on_commit(self.db, Author, id=author_id)
             return True
         return False
     
@@ -32,10 +47,20 @@ class AuthorRepository:
         if author:
             for key, value in author_data.items():
                 setattr(author, key, value)
-            self.db.commit()
-            self.db.refresh(author)
+            self.db.flush()
+            invalidate_on_commit(self.db, Author, id=author_id)
         return author
     
+    def find_existing_ids(self, author_ids) -> set:
+        if not author_ids:
+            return set()
+        return {author_id for (author_id,) in self.db.query(Author.id).filter(Author.id.in_(author_ids))}
+    
+    def bulk_insert(self, rows: List[dict]) -> None:
+        if rows:
+            columns = list(rows[0].keys())
+            insert_many(self.db, Author.__table__, columns, [tuple(row[column] for column in columns) for row in rows])
+    
     def search_by_name(self, search_term: str) -> List[Author]:
         return self.db.query(Author).filter(
             or_(
@@ -48,9 +73,85 @@ class AuthorRepository:
         return self.db.query(Author).filter(Author.last_name.ilike(f"%{last_name}%")).all()
     
     def find_authors_with_books(self) -> List[Author]:
+        if counters_enabled():
+            return self.db.query(Author).filter(Author.book_count > 0).all()
         from models.book import Book
         return self.db.query(Author).join(Book).distinct().all()
     
     def count_books_by_author_id(self, author_id: int) -> int:
+        if counters_enabled():
+            return self.db.execute(select(Author.book_count).where(Author.id == author_id)).scalar() or 0
+        from models.book import Book
+        return self.db.query(Book).filter(Book.author_id == author_id).count()
+    
+    def find_stats_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page:
+        """Страница авторов с числом книг, доступных экземпляров и открытых займов — один запрос.
+        
+        Со счётчиками это чтение authors по первичному ключу. Без них книги и
+        займы группируются только для авторов страницы, а не для всего каталога.
+        """
+        if counters_enabled():
+            statement = select(
+                Author.id, Author.first_name, Author.last_name, Author.book_count,
+                Author.available_copies, Author.open_loan_count.label("active_loans"),
+            )
+            rows = self.db.execute(keyset(statement, Author.id, limit, cursor, offset)).all()
+        else:
+            page = keyset(select(Author.id), Author.id, limit, cursor, offset).cte("author_page")
+            rows = self.db.execute(self._aggregate_stats(page)).all()
+        return make_page(rows, Author.id, limit)
+    
+    def _aggregate_stats(self, page):
+        from models.book import Book
+        from models.loan import Loan
+        from repositories.loan_repository import OPEN_STATUSES
+        # Группировка идёт от авторов страницы: книги и займы читаются по индексам
+        # author_id и book_id, а не сканом всего каталога
+        books = (
+            select(page.c.id.label("author_id"), func.count(Book.id).label("book_count"),
+                   func.sum(Book.available_copies).label("available_copies"))
+            .select_from(page)
+            .join(Book, Book.author_id == page.c.id)
+            .group_by(page.c.id)
+            .subquery()
+        )
+        loans = (
+            select(page.c.id.label("author_id"), func.count(Loan.id).label("active_loans"))
+            .select_from(page)
+            .join(Book, Book.author_id == page.c.id)
+            .join(Loan, Loan.book_id == Book.id)
+            .where(Loan.status.in_(OPEN_STATUSES))
+            .group_by(page.c.id)
+            .subquery()
+        )
+        return (
+            select(
+                Author.id, Author.first_name, Author.last_name,
+                func.coalesce(books.c.book_count, 0).label("book_count"),
+                func.coalesce(books.c.available_copies, 0).label("available_copies"),
+                func.coalesce(loans.c.active_loans, 0).label("active_loans"),
+            )
+            .select_from(page)
+            .join(Author, Author.id == page.c.id)
+            .outerjoin(books, books.c.author_id == Author.id)
+            .outerjoin(loans, loans.c.author_id == Author.id)
+            .order_by(page.c.id)
+        )
+    
+    def rebuild_stats(self) -> int:
+        """Пересчитывает счётчики всех авторов одним UPDATE; возвращает число строк."""
         from models.book import Book
-        return self.db.query(Book).filter(Book.author_id == author_id).count()
\ No newline at end of file
+        from models.loan import Loan
+        from repositories.loan_repository import OPEN_STATUSES
+        books = select(Book.id).where(Book.author_id == Author.id)
+        return self.db.execute(
+            update(Author)
+            .values(
+                book_count=select(func.count(Book.id)).where(Book.author_id == Author.id).scalar_subquery(),
+                available_copies=select(func.coalesce(func.sum(Book.available_copies), 0))
+                .where(Book.author_id == Author.id).scalar_subquery(),
+                open_loan_count=select(func.count(Loan.id))
+                .where(Loan.book_id.in_(books), Loan.status.in_(OPEN_STATUSES)).scalar_subquery(),
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
\ No newline at end of file
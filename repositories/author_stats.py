@@ -0,0 +1,134 @@
+import os
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import bindparam, event, inspect, select, update
+
+from models.author import Author
+from models.book import Book
+from models.loan import Loan, LoanStatus
+
+# Счётчики книг, доступных экземпляров и открытых займов прямо в authors.
+# Выключены по умолчанию: каждая выдача и возврат обновляют строку автора,
+# а у популярных авторов это точка конкуренции за блокировку.
+AUTHOR_STATS_COUNTERS = os.getenv("AUTHOR_STATS_COUNTERS", "false").strip().lower() in ("1", "true", "yes", "on")
+
+_authors = Author.__table__
+_installed = False
+
+
+def counters_enabled() -> bool:
+    return _installed
+
+
+def _adjust_statement():
+    return (
+        update(_authors)
+        .where(_authors.c.id == bindparam("author_id"))
+        .values(
+            book_count=_authors.c.book_count + bindparam("books"),
+            available_copies=_authors.c.available_copies + bindparam("copies"),
+            open_loan_count=_authors.c.open_loan_count + bindparam("loans"),
+        )
+    )
+
+
+def adjust(executor, author_id, books: int = 0, copies: int = 0, loans: int = 0) -> None:
+    """Сдвигает счётчики автора в текущей транзакции; executor — Session или Connection."""
+    if author_id is None or not (books or copies or loans):
+        return
+    executor.execute(_adjust_statement(), {"author_id": author_id, "books": books, "copies": copies, "loans": loans})
+
+
+def adjust_by_book(executor, book_id: int, copies: int = 0, loans: int = 0) -> None:
+    """То же для автора книги book_id: выдача и возврат знают только книгу."""
+    if not _installed:
+        return
+    author_id = select(Book.author_id).where(Book.id == book_id).scalar_subquery()
+    executor.execute(
+        update(_authors)
+        .where(_authors.c.id == author_id)
+        .values(
+            available_copies=_authors.c.available_copies + copies,
+            open_loan_count=_authors.c.open_loan_count + loans,
+        )
+    )
+
+
+def adjust_for_inserted_books(executor, rows: Iterable[dict]) -> None:
+    """Книги, вставленные мимо ORM: одно UPDATE на автора одним executemany."""
+    if not _installed:
+        return
+    deltas = defaultdict(lambda: [0, 0])
+    for row in rows:
+        if row.get("author_id") is not None:
+            deltas[row["author_id"]][0] += 1
+            deltas[row["author_id"]][1] += row.get("available_copies") or 0
+    if deltas:
+        executor.execute(_adjust_statement(), [
+            {"author_id": author_id, "books": books, "copies": copies, "loans": 0}
+            for author_id, (books, copies) in sorted(deltas.items())
+        ])
+
+
+def _previous(target, name: str):
+    # Значение в БД до этого flush: изменённое в памяти ещё не записано
+    history = inspect(target).attrs[name].history
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, name)
+
+
+def _book_inserted(mapper, connection, target):
+    adjust(connection, target.author_id, books=1, copies=target.available_copies or 0)
+
+
+def _book_updated(mapper, connection, target):
+    old_author, old_copies = _previous(target, "author_id"), _previous(target, "available_copies") or 0
+    new_author, new_copies = target.author_id, target.available_copies or 0
+    if old_author == new_author:
+        adjust(connection, new_author, copies=new_copies - old_copies)
+        return
+    adjust(connection, old_author, books=-1, copies=-old_copies)
+    adjust(connection, new_author, books=1, copies=new_copies)
+
+
+def _book_deleted(mapper, connection, target):
+    adjust(connection, _previous(target, "author_id"), books=-1, copies=-(_previous(target, "available_copies") or 0))
+
+
+def _loan_deleted(mapper, connection, target):
+    # Открытый займ удалён вместе с читателем: экземпляр не возвращается, займа больше нет
+    if _previous(target, "status") != LoanStatus.RETURNED:
+        adjust_by_book(connection, target.book_id, loans=-1)
+
+
+_LISTENERS = (
+    (Book, "after_insert", _book_inserted),
+    (Book, "after_update", _book_updated),
+    (Book, "after_delete", _book_deleted),
+    (Loan, "after_delete", _loan_deleted),
+)
+
+
+def install() -> None:
+    """Включает ведение счётчиков. Перед этим их нужно пересчитать: `python cli.py rebuild-author-stats`."""
+    global _installed
+    if _installed:
+        return
+    for target, name, listener in _LISTENERS:
+        event.listen(target, name, listener)
+    _installed = True
+
+
+def uninstall() -> None:
+    global _installed
+    if not _installed:
+        return
+    for target, name, listener in _LISTENERS:
+        event.remove(target, name, listener)
+    _installed = False
+
+
+if AUTHOR_STATS_COUNTERS:
+    install()
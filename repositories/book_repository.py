@@ -1,29 +1,98 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from config.categories import get_category_directory
+from config.sql_timing import count_rows
+from datetime import datetime
+from typing import Iterator, List, Optional
 from models.book import Book
-from sqlalchemy import or_, and_
+from models.book_title_trigram import BookTitleTrigram, title_trigrams, index_rows
+from repositories.book_rows import BookRow, rows_statement, to_rows
+from repositories.book_search import BookSearchCriteria, facet_statement, group_facets, order_by
+from repositories.bulk import insert_many
+from repositories.author_stats import adjust_for_inserted_books
+from repositories.loading import apply_loading, validate_strategy
+from repositories.pagination import Page, keyset, make_page, paginate
+from sqlalchemy import or_, and_, func, insert, delete, select
 
 class BookRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, load_strategy: Optional[str] = None):
         self.db = db
+        self.load_strategy = validate_strategy(load_strategy)
+    
+    def _query(self):
+        # Имя категории книге даёт справочник в памяти — связь подгружаем, только если он не отвечает
+        relationships = (Book.author,) if get_category_directory().for_session(self.db) else (Book.author, Book.category)
+        return apply_loading(self.db.query(Book), self.load_strategy, *relationships)
     
     def find_all(self) -> List[Book]:
-        return self.db.query(Book).all()
+        return self._query().all()
+    
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return paginate(self._query(), Book.id, limit, cursor, offset)
+    
+    def find_rows_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[BookRow]:
+        """Страница книг проекцией столбцов: без ORM-объектов и ленивых связей, один запрос."""
+        return self._rows_page(None, limit, cursor, offset)
+    
+    def _rows_statement(self, condition=None):
+        # Имя категории даёт справочник, если он отвечает этой сессии; иначе — JOIN categories
+        snapshot = get_category_directory().for_session(self.db)
+        statement = rows_statement(join_categories=snapshot is None)
+        if condition is not None:
+            statement = statement.where(condition)
+        return statement, snapshot
+    
+    def _rows_page(self, condition, limit: int, cursor: Optional[str], offset: Optional[int]) -> Page[BookRow]:
+        statement, snapshot = self._rows_statement(condition)
+        return make_page(self._rows(keyset(statement, Book.id, limit, cursor, offset), snapshot), Book.id, limit)
+    
+    def _rows(self, statement, snapshot) -> List[BookRow]:
+        result = self.db.execute(statement).all()
+        count_rows(len(result))
+        if snapshot is None:
+            return to_rows(result)
+        names = {category_id: entry.name for category_id, entry in snapshot.by_id.items()}
+        # Категория, которой ещё нет в снимке (создана другим воркером), — одним запросом
+        missing = {values[6] for values in result if values[6] is not None and values[6] not in names}
+        if missing:
+            from models.category import Category
+            found = self.db.execute(select(Category.id, Category.name).where(Category.id.in_(missing))).all()
+            count_rows(len(found))
+            names.update(found)
+        return to_rows(result, names)
+    
+    def iter_export_batches(self, batch_size: int = 1000) -> Iterator[list]:
+        """Плоские строки каталога пачками через серверный курсор (yield_per).
+
+        Выбираются только нужные столбцы с уже присоединёнными автором и категорией,
+        поэтому память не растёт с размером каталога и ORM-объекты не создаются.
+        """
+        from models.author import Author
+        from models.category import Category
+        statement = select(
+            Book.id, Book.title, Book.isbn, Book.publication_date, Book.available_copies,
+            Book.author_id,
+            Author.first_name.label("author_first_name"),
+            Author.last_name.label("author_last_name"),
+            Book.category_id,
+            Category.name.label("category_name"),
+        ).outerjoin(Author, Book.author_id == Author.id).outerjoin(
+            Category, Book.category_id == Category.id
+        ).order_by(Book.id).execution_options(yield_per=batch_size)
+        yield from self.db.execute(statement).mappings().partitions()
     
     def find_by_id(self, book_id: int) -> Optional[Book]:
-        return self.db.query(Book).filter(Book.id == book_id).first()
+        return self._query().filter(Book.id == book_id).first()
     
     def save(self, book: Book) -> Book:
         self.db.add(book)
-        self.db.commit()
-        self.db.refresh(book)
+        self.db.flush()
         return book
     
     def delete_by_id(self, book_id: int) -> bool:
         book = self.find_by_id(book_id)
         if book:
             self.db.delete(book)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
     
@@ -32,36 +101,132 @@ class BookRepository:
         if book:
             for key, value in book_data.items():
                 setattr(book, key, value)
-            self.db.commit()
-            self.db.refresh(book)
+            self.db.flush()
         return book
     
+    def search(self, criteria: BookSearchCriteria, sort: str = "id", offset: int = 0, limit: int = 20) -> List[Book]:
+        return self._query().filter(*criteria.conditions()).order_by(*order_by(sort)).offset(offset).limit(limit).all()
+    
+    def search_facets(self, criteria: BookSearchCriteria, facet_size: int = 20) -> dict:
+        return group_facets(self.db.execute(facet_statement(criteria, facet_size)))
+    
     def find_by_title_containing(self, title: str) -> List[Book]:
-        return self.db.query(Book).filter(Book.title.ilike(f"%{title}%")).all()
+        return self._query().filter(Book.title.ilike(f"%{title}%")).all()
+    
+    def search_by_title(self, text: str, limit: int = 50, min_similarity: float = 0.5) -> List[Book]:
+        """Поиск по триграммному индексу, самые релевантные книги первыми.
+
+        Релевантность — доля триграмм запроса, найденных в названии; при равной
+        доле выше короткие названия. Книги с долей ниже min_similarity отсекаются.
+        """
+        trigrams = title_trigrams(text)
+        if not trigrams:
+            return []
+        required = max(1, int(len(trigrams) * min_similarity + 0.999))
+        score = func.count(BookTitleTrigram.trigram).label("score")
+        ranked = self.db.query(BookTitleTrigram.book_id, score).filter(
+            BookTitleTrigram.trigram.in_(trigrams)
+        ).group_by(BookTitleTrigram.book_id).having(score >= required).subquery()
+        return self._query().join(ranked, Book.id == ranked.c.book_id).order_by(
+            ranked.c.score.desc(), func.length(Book.title), Book.id
+        ).limit(limit).all()
+    
+    def rebuild_title_index(self, batch_size: int = 1000) -> int:
+        table = BookTitleTrigram.__table__
+        self.db.execute(delete(table))
+        indexed = 0
+        last_id = 0
+        while True:
+            batch = self.db.query(Book.id, Book.title).filter(Book.id > last_id).order_by(Book.id).limit(batch_size).all()
+            if not batch:
+                break
+            rows = [row for book_id, title in batch for row in index_rows(book_id, title)]
+            if rows:
+                self.db.execute(insert(table), rows)
+            indexed += len(batch)
+            last_id = batch[-1].id
+        return indexed
+    
+    def find_existing_isbns(self, isbns) -> set:
+        if not isbns:
+            return set()
+        return {isbn for (isbn,) in self.db.query(Book.isbn).filter(Book.isbn.in_(isbns))}
+    
+    def find_ids_by_isbns(self, isbns) -> dict:
+        """ISBN -> id для уже существующих книг, одним запросом."""
+        if not isbns:
+            return {}
+        return {isbn: book_id for book_id, isbn in self.db.query(Book.id, Book.isbn).filter(Book.isbn.in_(isbns))}
+    
+    def find_by_ids(self, book_ids) -> List[Book]:
+        if not book_ids:
+            return []
+        return self._query().filter(Book.id.in_(book_ids)).all()
+    
+    def find_by_ids_or_isbns(self, book_ids, isbns) -> List[Book]:
+        """Книги по набору id и/или ISBN одним запросом."""
+        conditions = []
+        if book_ids:
+            conditions.append(Book.id.in_(book_ids))
+        if isbns:
+            conditions.append(Book.isbn.in_(isbns))
+        if not conditions:
+            return []
+        return self._query().filter(or_(*conditions)).all()
+    
+    def bulk_insert(self, rows: List[dict]) -> dict:
+        """Один executemany без гидрации ORM-объектов; индекс названий дописывается сразу.
+
+        Возвращает ISBN -> id вставленных книг. Коммит остаётся за вызывающим,
+        чтобы пакет записывался одной транзакцией.
+        """
+        if not rows:
+            return {}
+        columns = list(rows[0].keys())
+        insert_many(self.db, Book.__table__, columns, [tuple(row[column] for column in columns) for row in rows])
+        adjust_for_inserted_books(self.db, rows)
+        ids = dict(self.db.query(Book.isbn, Book.id).filter(Book.isbn.in_([row["isbn"] for row in rows])).all())
+        # Триграммы идут тем же executemany, названия берём из входных строк, а не перечитываем
+        insert_many(self.db, BookTitleTrigram.__table__, ("trigram", "book_id"),
+                    [(trigram, ids[row["isbn"]]) for row in rows for trigram in title_trigrams(row.get("title") or "")])
+        return ids
     
     def find_by_isbn(self, isbn: str) -> Optional[Book]:
-        return self.db.query(Book).filter(Book.isbn == isbn).first()
+        return self._query().filter(Book.isbn == isbn).first()
     
     def find_by_author_id(self, author_id: int) -> List[Book]:
-        return self.db.query(Book).filter(Book.author_id == author_id).all()
+        return self._query().filter(Book.author_id == author_id).all()
+    
+    def find_rows_by_author_id(self, author_id: int) -> List[BookRow]:
+        return self._rows(*self._rows_statement(Book.author_id == author_id))
     
     def find_by_category_id(self, category_id: int) -> List[Book]:
-        return self.db.query(Book).filter(Book.category_id == category_id).all()
+        return self._query().filter(Book.category_id == category_id).all()
     
     def find_available_books(self, min_copies: int = 1) -> List[Book]:
-        return self.db.query(Book).filter(Book.available_copies >= min_copies).all()
+        return self._query().filter(Book.available_copies >= min_copies).all()
+    
+    def find_available_rows(self, min_copies: int = 1) -> List[BookRow]:
+        return self._rows(*self._rows_statement(Book.available_copies >= min_copies))
     
     def find_by_title_and_author_lastname(self, title: str, author_lastname: str) -> List[Book]:
         from models.author import Author
-        return self.db.query(Book).join(Author).filter(
+        return self._query().join(Author).filter(
             Book.title.ilike(f"%{title}%"),
             Author.last_name.ilike(f"%{author_lastname}%")
         ).all()
     
+    def _overdue_query(self):
+        # IN по подзапросу вместо JOIN: книга с несколькими просрочками попадает один раз
+        from repositories.loan_repository import overdue_book_ids
+        return self._query().filter(Book.id.in_(overdue_book_ids(datetime.utcnow())))
+    
     def find_overdue_books(self) -> List[Book]:
-        from models.loan import Loan, LoanStatus
-        from sqlalchemy import func
-        return self.db.query(Book).join(Loan).filter(
-            Loan.due_date < func.now(),
-            Loan.status == LoanStatus.ACTIVE
-        ).all()
\ No newline at end of file
+        return self._overdue_query().order_by(Book.id).all()
+    
+    def find_overdue_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return paginate(self._overdue_query(), Book.id, limit, cursor, offset)
+    
+    def find_overdue_rows_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[BookRow]:
+        from repositories.loan_repository import overdue_book_ids
+        return self._rows_page(Book.id.in_(overdue_book_ids(datetime.utcnow())), limit, cursor, offset)
\ No newline at end of file
@@ -0,0 +1,69 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+
+from models.author import Author
+from models.book import Book
+from models.category import Category
+
+
+class AuthorRow:
+    """Автор книги в списке: только поля AuthorResponse."""
+    __slots__ = ("id", "first_name", "last_name", "birth_date", "biography")
+
+    def __init__(self, id, first_name, last_name, birth_date, biography):
+        self.id = id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.birth_date = birth_date
+        self.biography = biography
+
+
+class BookRow:
+    """Книга в списке: поля BookResponse без ORM-объекта.
+
+    Нет identity map, отслеживания изменений и ленивых связей — Pydantic с
+    from_attributes читает обычные атрибуты, а сессия не держит строки.
+    """
+    __slots__ = ("id", "title", "isbn", "publication_date", "available_copies",
+                 "author_id", "category_id", "author", "category_name")
+
+    def __init__(self, id, title, isbn, publication_date, available_copies, author_id, category_id,
+                 author: Optional[AuthorRow], category_name: Optional[str]):
+        self.id = id
+        self.title = title
+        self.isbn = isbn
+        self.publication_date = publication_date
+        self.available_copies = available_copies
+        self.author_id = author_id
+        self.category_id = category_id
+        self.author = author
+        self.category_name = category_name
+
+
+BOOK_COLUMNS = (Book.id, Book.title, Book.isbn, Book.publication_date, Book.available_copies,
+                Book.author_id, Book.category_id)
+AUTHOR_COLUMNS = (Author.first_name, Author.last_name, Author.birth_date, Author.biography)
+
+
+def rows_statement(join_categories: bool = True):
+    """SELECT только нужных BookResponse столбцов; без join_categories имя категории берут из справочника."""
+    statement = select(*BOOK_COLUMNS, *AUTHOR_COLUMNS).outerjoin(Author, Book.author_id == Author.id)
+    if join_categories:
+        statement = statement.add_columns(Category.name).outerjoin(Category, Book.category_id == Category.id)
+    return statement
+
+
+def to_rows(result, category_names: Optional[Dict[int, str]] = None) -> List[BookRow]:
+    """Строки запроса rows_statement; category_names — имена категорий, если их нет в самом запросе."""
+    # Строка автора собирается один раз на страницу: у плодовитых авторов книг много
+    authors = {}
+    rows = []
+    for values in result:
+        book_id, title, isbn, published, copies, author_id, category_id = values[:7]
+        author = authors.get(author_id)
+        if author is None and author_id is not None and values[7] is not None:
+            author = authors[author_id] = AuthorRow(author_id, *values[7:11])
+        category_name = values[11] if category_names is None else category_names.get(category_id)
+        rows.append(BookRow(book_id, title, isbn, published, copies, author_id, category_id, author, category_name))
+    return rows
@@ -0,0 +1,125 @@
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import case, func, literal, null, select, union_all
+
+from models.author import Author
+from models.book import Book
+from models.category import Category
+
+CATEGORY = "category"
+AUTHOR = "author"
+AVAILABILITY = "availability"
+DECADE = "decade"
+TOTAL = "total"
+
+SORT_COLUMNS = {
+    "id": Book.id,
+    "title": Book.title,
+    "year": Book.publication_date,
+    "available": Book.available_copies,
+}
+SORTS = tuple(SORT_COLUMNS) + tuple(f"-{name}" for name in SORT_COLUMNS)
+
+
+class BookSearchCriteria:
+    """Фильтры поиска книг; None — измерение не ограничено."""
+
+    def __init__(self, title: Optional[str] = None, author_ids: Optional[Sequence[int]] = None,
+                 category_ids: Optional[Sequence[int]] = None, available: Optional[bool] = None,
+                 year_from: Optional[int] = None, year_to: Optional[int] = None):
+        self.title = title
+        self.author_ids = list(author_ids) if author_ids else None
+        self.category_ids = list(category_ids) if category_ids else None
+        self.available = available
+        self.year_from = year_from
+        self.year_to = year_to
+
+    def conditions(self, exclude: Optional[str] = None) -> list:
+        """WHERE-условия; exclude снимает фильтр своего фасета, чтобы в нём были видны и соседние значения."""
+        conditions = []
+        if self.title:
+            conditions.append(Book.title.ilike(f"%{self.title}%"))
+        if self.author_ids and exclude != AUTHOR:
+            conditions.append(Book.author_id.in_(self.author_ids))
+        if self.category_ids and exclude != CATEGORY:
+            conditions.append(Book.category_id.in_(self.category_ids))
+        if self.available is not None and exclude != AVAILABILITY:
+            conditions.append(Book.available_copies > 0 if self.available else Book.available_copies <= 0)
+        if exclude != DECADE:
+            # Диапазоны по самой дате, а не по году из неё: условие остаётся индексируемым
+            if self.year_from is not None:
+                conditions.append(Book.publication_date >= date(self.year_from, 1, 1))
+            if self.year_to is not None:
+                conditions.append(Book.publication_date < date(self.year_to + 1, 1, 1))
+        return conditions
+
+
+def order_by(sort: str) -> list:
+    if sort not in SORTS:
+        raise ValueError(f"Unknown sort: {sort}")
+    descending = sort.startswith("-")
+    column = SORT_COLUMNS[sort.lstrip("-")]
+    if column is Book.id:
+        return [Book.id.desc() if descending else Book.id]
+    return [column.desc() if descending else column, Book.id]
+
+
+def _top(statement, size: int):
+    # LIMIT внутри UNION ALL допустим только в подзапросе
+    ranked = statement.order_by(statement.selected_columns.count.desc(), statement.selected_columns.value).limit(size).subquery()
+    return select(ranked.c.facet, ranked.c.value, ranked.c.label, ranked.c.count)
+
+
+def facet_statement(criteria: BookSearchCriteria, facet_size: int):
+    """Один UNION ALL из сгруппированных агрегатов: все фасеты и общее число за один запрос.
+
+    Строки: (facet, value, label, count). Каждый фасет считается без
+    собственного фильтра — выбранная категория не скрывает остальные.
+    """
+    count = func.count(Book.id).label("count")
+    year = func.extract("year", Book.publication_date)
+    available = case((Book.available_copies > 0, 1), else_=0)
+
+    categories = _top(
+        select(literal(CATEGORY).label("facet"), Book.category_id.label("value"), Category.name.label("label"), count)
+        .select_from(Book).outerjoin(Category, Book.category_id == Category.id)
+        .where(*criteria.conditions(exclude=CATEGORY))
+        .group_by(Book.category_id, Category.name),
+        facet_size,
+    )
+    authors = _top(
+        select(literal(AUTHOR).label("facet"), Book.author_id.label("value"),
+               (Author.first_name + " " + Author.last_name).label("label"), count)
+        .select_from(Book).outerjoin(Author, Book.author_id == Author.id)
+        .where(*criteria.conditions(exclude=AUTHOR))
+        .group_by(Book.author_id, Author.first_name, Author.last_name),
+        facet_size,
+    )
+    availability = (
+        select(literal(AVAILABILITY).label("facet"), available.label("value"), null().label("label"), count)
+        .where(*criteria.conditions(exclude=AVAILABILITY))
+        .group_by(available)
+    )
+    decade = year - year % 10
+    decades = (
+        select(literal(DECADE).label("facet"), decade.label("value"), null().label("label"), count)
+        .where(*criteria.conditions(exclude=DECADE))
+        .group_by(decade)
+    )
+    total = select(literal(TOTAL).label("facet"), null().label("value"), null().label("label"), count).where(
+        *criteria.conditions()
+    )
+    return union_all(categories, authors, availability, decades, total)
+
+
+def group_facets(rows) -> Dict[str, List[dict]]:
+    facets = {CATEGORY: [], AUTHOR: [], AVAILABILITY: [], DECADE: [], TOTAL: []}
+    for facet, value, label, count in rows:
+        facets[facet].append({"value": value, "label": label, "count": count})
+    # Порядок строк UNION ALL не гарантирован: сортируем уже в Python
+    for name in (CATEGORY, AUTHOR):
+        facets[name].sort(key=lambda bucket: (-bucket["count"], bucket["value"] is None, bucket["value"] or 0))
+    for name in (AVAILABILITY, DECADE):
+        facets[name].sort(key=lambda bucket: (bucket["value"] is None, bucket["value"] or 0))
+    return facets
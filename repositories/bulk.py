@@ -0,0 +1,32 @@
+from typing import Sequence
+
+from sqlalchemy import Table, insert
+from sqlalchemy.orm import Session
+
+from config.versions import mark_changed
+
+_MARKERS = {"qmark": "?", "format": "%s", "pyformat": "%s"}
+
+
+def insert_many(db: Session, table: Table, columns: Sequence[str], rows: Sequence[tuple]) -> None:
+    """Пакетный INSERT кортежами напрямую через DBAPI executemany.
+
+    Обходит построчную обработку параметров SQLAlchemy, которая на сотнях тысяч
+    строк стоит больше самой вставки. Для драйверов с другим paramstyle
+    используется обычный insert() из Core.
+    """
+    if not rows:
+        return
+    mark_changed(db, table.name)
+    connection = db.connection()
+    marker = _MARKERS.get(connection.dialect.paramstyle)
+    if marker is None:
+        connection.execute(insert(table), [dict(zip(columns, row)) for row in rows])
+        return
+    quote = connection.dialect.identifier_preparer.quote
+    statement = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote(table.name),
+        ", ".join(quote(column) for column in columns),
+        ", ".join([marker] * len(columns)),
+    )
+    connection.exec_driver_sql(statement, list(rows))
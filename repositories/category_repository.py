@@ -1,16 +1,64 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from config.categories import get_category_directory
 from models.category import Category
+from repositories.entity_cache import cached_lookup, invalidate_on_commit
 
 class CategoryRepository:
     def __init__(self, db: Session):
         self.db = db
     
     def find_all(self) -> List[Category]:
-        return self.db.query(Category).all()
+        return self.db.query(Category).order_by(Category.id).all()
     
     def find_by_id(self, category_id: int) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.id == category_id).first()
+        return cached_lookup(self.db, Category, "id", category_id,
+                             lambda: self.db.query(Category).filter(Category.id == category_id).first())
+    
+    def exists_by_id(self, category_id: int) -> bool:
+        return category_id in self.find_existing_ids({category_id})
+    
+    def find_existing_ids(self, category_ids) -> set:
+        if not category_ids:
+            return set()
+        # Известные справочнику id подтверждаются без запроса; в таблице ищутся только
+        # неизвестные — например, созданные другим воркером до обновления снимка
+        snapshot = get_category_directory().for_session(self.db)
+        known = {category_id for category_id in category_ids if snapshot and category_id in snapshot.by_id}
+        unknown = set(category_ids) - known
+        if not unknown:
+            return known
+        return known | {category_id for (category_id,) in self.db.query(Category.id).filter(Category.id.in_(unknown))}
     
     def find_by_name(self, name: str) -> Optional[Category]:
-        return self.db.query(Category).filter(Category.name == name).first()
\ No newline at end of file
+        return self.db.query(Category).filter(Category.name == name).first()
+    
+    def exists_by_name(self, name: str) -> bool:
+        snapshot = get_category_directory().for_session(self.db)
+        if snapshot and name in snapshot.by_name:
+            return True
+        return self.db.query(Category.id).filter(Category.name == name).first() is not None
+    
+    def save(self, category: Category) -> Category:
+        self.db.add(category)
+        self.db.flush()
+        invalidate_on_commit(self.db, Category, id=category.id)
+        return category
+    
+    def update(self, category_id: int, category_data: dict) -> Optional[Category]:
+        category = self.find_by_id(category_id)
+        if category:
+            for key, value in category_data.items():
+                setattr(category, key, value)
+            self.db.flush()
+            invalidate_on_commit(self.db, Category, id=category_id)
+        return category
+    
+    def delete_by_id(self, category_id: int) -> bool:
+        category = self.find_by_id(category_id)
+        if category:
+            self.db.delete(category)
+            self.db.flush()
+            invalidate_on_commit(self.db, Category, id=category_id)
+            return True
+        return False
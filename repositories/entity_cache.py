@@ -0,0 +1,82 @@
+from typing import Callable, Optional, Type, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config.cache import get_entity_cache
+
+T = TypeVar("T")
+
+_PENDING_KEY = "entity_cache_invalidations"
+
+
+def _key(model: type, field: str, value) -> tuple:
+    return (model.__name__, field, value)
+
+
+def _snapshot(instance) -> dict:
+    # Столбцы с info={"cached": False} (хеш пароля) не кэшируются: у восстановленного
+    # экземпляра они не загружены и при обращении читаются из БД
+    mapper = inspect(instance).mapper
+    return {attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs
+            if attr.columns[0].info.get("cached", True)}
+
+
+def _restore(db: Session, model: Type[T], values: dict) -> T:
+    # Собираем отсоединённый экземпляр из столбцов и присоединяем к сессии без SELECT
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return db.merge(instance, load=False)
+
+
+def cached_lookup(db: Session, model: Type[T], field: str, value,
+                  loader: Callable[[], Optional[T]], *also_by: str) -> Optional[T]:
+    """Read-through поиск сущности по (модель, поле, значение).
+
+    При промахе вызывает loader и кладёт строку в кэш по field и по also_by
+    (например, пользователь по email кэшируется и по id).
+    """
+    values = get_entity_cache().get(_key(model, field, value))
+    if values is not None:
+        return _restore(db, model, values)
+    instance = loader()
+    if instance is not None:
+        remember(instance, field, *also_by)
+    return instance
+
+
+def remember(instance, *fields: str) -> None:
+    cache = get_entity_cache()
+    values = _snapshot(instance)
+    for field in fields:
+        cache.set(_key(type(instance), field, values[field]), values)
+
+
+def invalidate(model: type, **fields) -> None:
+    cache = get_entity_cache()
+    for field, value in fields.items():
+        if value is not None:
+            cache.delete(_key(model, field, value))
+
+
+def invalidate_on_commit(db: Session, model: type, **fields) -> None:
+    """Сбрасывает записи сразу и ещё раз после коммита.
+
+    Повторный сброс нужен, потому что до коммита другая сессия может успеть
+    прочитать и закэшировать старую строку.
+    """
+    invalidate(model, **fields)
+    db.info.setdefault(_PENDING_KEY, []).append((model, fields))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session):
+    for model, fields in session.info.pop(_PENDING_KEY, ()):
+        invalidate(model, **fields)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session):
+    # За время транзакции строку могли снова закэшировать с незакоммиченными значениями
+    for model, fields in session.info.pop(_PENDING_KEY, ()):
+        invalidate(model, **fields)
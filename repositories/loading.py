@@ -0,0 +1,25 @@
+from typing import Optional
+
+from sqlalchemy.orm import Query, joinedload, selectinload
+
+SELECTIN = "selectin"
+JOINED = "joined"
+
+LOADERS = {
+    SELECTIN: selectinload,
+    JOINED: joinedload,
+}
+
+
+def validate_strategy(strategy: Optional[str]) -> Optional[str]:
+    if strategy is not None and strategy not in LOADERS:
+        raise ValueError(f"Unknown loading strategy: {strategy}")
+    return strategy
+
+
+def apply_loading(query: Query, strategy: Optional[str], *relationships) -> Query:
+    """Подгружает связи выбранной стратегией; None оставляет ленивую загрузку."""
+    if strategy is None:
+        return query
+    loader = LOADERS[strategy]
+    return query.options(*(loader(relationship) for relationship in relationships))
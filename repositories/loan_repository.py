@@ -0,0 +1,112 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import List, Optional
+from datetime import datetime
+from models.book import Book
+from models.loan import Loan, LoanStatus
+from sqlalchemy import update, select, or_, and_
+from repositories.author_stats import adjust_by_book
+
+OPEN_STATUSES = (LoanStatus.ACTIVE, LoanStatus.OVERDUE)
+
+def overdue_book_ids(now: datetime):
+    """Подзапрос id книг с просроченными займами.
+
+    Кроме уже помеченных OVERDUE, учитывает ACTIVE-займы с истёкшим сроком,
+    до которых ещё не дошёл фоновый перевод; оба условия — диапазоны
+    индекса (status, due_date).
+    """
+    return select(Loan.book_id).where(or_(
+        Loan.status == LoanStatus.OVERDUE,
+        and_(Loan.status == LoanStatus.ACTIVE, Loan.due_date < now),
+    ))
+
+class LoanRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def find_by_id(self, loan_id: int) -> Optional[Loan]:
+        return self.db.query(Loan).filter(Loan.id == loan_id).first()
+    
+    def find_open_by_user_id(self, user_id: int) -> List[Loan]:
+        return self.db.query(Loan).filter(
+            Loan.user_id == user_id,
+            Loan.status.in_(OPEN_STATUSES)
+        ).order_by(Loan.due_date).all()
+    
+    def mark_overdue_batch(self, now: datetime, batch_size: int = 1000) -> int:
+        """Переводит до batch_size просроченных ACTIVE-займов в OVERDUE одной транзакцией.
+
+        id выбираются по индексу (status, due_date), а UPDATE повторяет условие
+        по статусу, чтобы не затереть займ, возвращённый между SELECT и UPDATE.
+        """
+        ids = [loan_id for (loan_id,) in self.db.execute(
+            select(Loan.id)
+            .where(Loan.status == LoanStatus.ACTIVE, Loan.due_date < now)
+            .order_by(Loan.due_date)
+            .limit(batch_size)
+        )]
+        if not ids:
+            return 0
+        updated = self.db.execute(
+            update(Loan)
+            .where(Loan.id.in_(ids), Loan.status == LoanStatus.ACTIVE)
+            .values(status=LoanStatus.OVERDUE)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        return updated
+    
+    def checkout(self, book_id: int, user_id: int, loan_date: datetime, due_date: datetime) -> Optional[Loan]:
+        """Выдаёт экземпляр книги, если он есть; иначе None.
+
+        Доступность уменьшается одним условным UPDATE (available_copies > 0) —
+        проверка и списание атомарны, поэтому параллельные выдачи не уводят
+        остаток в минус. Займ создаётся в той же транзакции.
+        """
+        decremented = self.db.execute(
+            update(Book)
+            .where(Book.id == book_id, Book.available_copies > 0)
+            .values(available_copies=Book.available_copies - 1)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if decremented != 1:
+            return None
+        adjust_by_book(self.db, book_id, copies=-1, loans=1)
+        
+        loan = Loan(
+            book_id=book_id,
+            user_id=user_id,
+            loan_date=loan_date,
+            due_date=due_date,
+            status=LoanStatus.ACTIVE
+        )
+        self.db.add(loan)
+        self.db.flush()
+        return loan
+    
+    def close(self, loan: Loan, return_date: datetime) -> bool:
+        """Закрывает займ и возвращает экземпляр; False, если займ уже закрыт.
+
+        Статус меняется условным UPDATE, так что повторный или параллельный
+        возврат не увеличит остаток дважды.
+        """
+        closed = self.db.execute(
+            update(Loan)
+            .where(Loan.id == loan.id, Loan.status.in_(OPEN_STATUSES))
+            .values(status=LoanStatus.RETURNED, return_date=return_date)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if closed != 1:
+            return False
+        
+        self.db.execute(
+            update(Book)
+            .where(Book.id == loan.book_id)
+            .values(available_copies=Book.available_copies + 1)
+            .execution_options(synchronize_session=False)
+        )
+        adjust_by_book(self.db, loan.book_id, copies=1, loans=-1)
+        # UPDATE шёл мимо ORM: переносим новые значения в объект без повторного SELECT
+        set_committed_value(loan, "status", LoanStatus.RETURNED)
+        set_committed_value(loan, "return_date", return_date)
+        return True
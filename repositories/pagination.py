@@ -0,0 +1,60 @@
+import base64
+import json
+from typing import Generic, List, Optional, TypeVar
+
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+
+class Page(Generic[T]):
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(last_id: int) -> str:
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        last_id = json.loads(base64.urlsafe_b64decode(padded.encode()))["id"]
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(last_id, int):
+        raise ValueError("Invalid pagination cursor")
+    return last_id
+
+
+def keyset(statement, key_column, limit: int,
+           cursor: Optional[str] = None, offset: Optional[int] = None):
+    """Keyset-выборка по уникальному возрастающему столбцу (обычно первичному ключу).
+
+    Курсор хранит последний отданный ключ, поэтому стоимость страницы не зависит
+    от её номера. offset оставлен для обратной совместимости со skip/limit.
+    Принимает как Query, так и select(); выбирает на одну строку больше limit,
+    чтобы узнать, есть ли следующая страница.
+    """
+    if cursor:
+        statement = statement.filter(key_column > decode_cursor(cursor))
+    statement = statement.order_by(key_column)
+    if offset:
+        statement = statement.offset(offset)
+    return statement.limit(limit + 1)
+
+
+def make_page(rows: List[T], key_column, limit: int) -> Page[T]:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+    return Page(rows, next_cursor)
+
+
+def paginate(query: Query, key_column, limit: int,
+             cursor: Optional[str] = None, offset: Optional[int] = None) -> Page:
+    rows = keyset(query, key_column, limit, cursor, offset).all()
+    return make_page(rows, key_column, limit)
@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from models.user import User
-from sqlalchemy import or_
+from repositories.entity_cache import cached_lookup, invalidate_on_commit
+from repositories.pagination import Page, paginate
+from sqlalchemy import or_, select, update
 
 class UserRepository:
     def __init__(self, db: Session):
@@ -10,33 +12,71 @@ class UserRepository:
     def find_all(self) -> List[User]:
         return self.db.query(User).all()
     
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[User]:
+        return paginate(self.db.query(User), User.id, limit, cursor, offset)
+    
+    def iter_export_batches(self, batch_size: int = 1000) -> Iterator[list]:
+        # Пароль в выгрузку не попадает
+        statement = select(
+            User.id, User.email, User.first_name, User.last_name, User.created_at
+        ).order_by(User.id).execution_options(yield_per=batch_size)
+        yield from self.db.execute(statement).mappings().partitions()
+    
     def find_by_id(self, user_id: int) -> Optional[User]:
-        return self.db.query(User).filter(User.id == user_id).first()
+        return cached_lookup(self.db, User, "id", user_id,
+                             lambda: self.db.query(User).filter(User.id == user_id).first(), "email")
     
     def save(self, user: User) -> User:
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
+        invalidate_on_commit(self.db, User, id=user.id, email=user.email)
         return user
     
     def delete_by_id(self, user_id: int) -> bool:
         user = self.find_by_id(user_id)
         if user:
+            email = user.email
             self.db.delete(user)
-            self.db.commit()
+            self.db.flush()
+            invalidate_on_commit(self.db, User, id=user_id, email=email)
             return True
         return False
     
     def update(self, user_id: int, user_data: dict) -> Optional[User]:
         user = self.find_by_id(user_id)
         if user:
+            old_email = user.email
             for key, value in user_data.items():
                 setattr(user, key, value)
-            self.db.commit()
-            self.db.refresh(user)
+            self.db.flush()
+            invalidate_on_commit(self.db, User, id=user_id, email=old_email)
+            invalidate_on_commit(self.db, User, email=user_data.get("email"))
+        return user
+    
+    def update_password_hash(self, user: User, hashed_password: str) -> User:
+        """Замена хеша того же пароля (новая схема или стоимость).
+
+        UPDATE идёт мимо событий маппера: пароль не менялся, поэтому выданные
+        токены пользователя не отзываются.
+        """
+        user_id, email = user.id, user.email
+        self.db.execute(
+            update(User).where(User.id == user_id).values(password=hashed_password)
+            .execution_options(synchronize_session=False)
+        )
+        invalidate_on_commit(self.db, User, id=user_id, email=email)
         return user
     
     def find_by_email(self, email: str) -> Optional[User]:
+        return cached_lookup(self.db, User, "email", email,
+                             lambda: self.db.query(User).filter(User.email == email).first(), "id")
+    
+    def find_credentials_by_email(self, email: str) -> Optional[User]:
+        """Пользователь для входа: всегда из БД, мимо кэша сущностей.
+
+        Удаление или смена пароля в другом воркере сбрасывает кэш только там,
+        поэтому вход по закэшированной строке принял бы старые учётные данные.
+        """
         return self.db.query(User).filter(User.email == email).first()
     
     def search_by_name(self, search_term: str) -> List[User]:
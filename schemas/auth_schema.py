@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from typing import Optional
+from datetime import datetime
 
 class LoginRequest(BaseModel):
     email: EmailStr = Field(..., description="Email пользователя")
@@ -12,6 +13,15 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     email: Optional[str] = None
     user_id: Optional[int] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    issued_at: Optional[float] = None
+    
+    @property
+    def has_profile(self) -> bool:
+        """Токен несёт всё, что нужно UserResponse, и пользователя можно собрать без БД"""
+        return None not in (self.email, self.user_id, self.first_name, self.last_name, self.created_at)
 
 class UserRegister(BaseModel):
     email: EmailStr = Field(..., description="Email пользователя")
@@ -31,4 +31,15 @@ class AuthorResponse(AuthorBase):
     id: int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AuthorStatsResponse(BaseModel):
+    id: int
+    first_name: str
+    last_name: str
+    book_count: int
+    available_copies: int
+    active_loans: int
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,49 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, List, Optional
+from .book_schema import BookResponse, BookUpdate
+
+BATCH_GET_MAX_KEYS = 1000
+BATCH_WRITE_MAX_ITEMS = 5000
+
+class BookBatchGetRequest(BaseModel):
+    ids: List[int] = Field(default_factory=list, description="ID книг")
+    isbns: List[str] = Field(default_factory=list, description="ISBN книг")
+    
+    @model_validator(mode="after")
+    def keys_within_limit(self):
+        if not self.ids and not self.isbns:
+            raise ValueError("Specify at least one id or ISBN")
+        if len(self.ids) + len(self.isbns) > BATCH_GET_MAX_KEYS:
+            raise ValueError(f"At most {BATCH_GET_MAX_KEYS} ids and ISBNs per request")
+        return self
+
+class BookBatchGetResponse(BaseModel):
+    items: List[BookResponse]
+    missing_ids: List[int] = []
+    missing_isbns: List[str] = []
+
+class BookBatchWriteRequest(BaseModel):
+    # Элементы проверяются по одному, чтобы ошибка в одном не отклоняла весь пакет
+    items: List[Dict[str, Any]] = Field(..., min_length=1, max_length=BATCH_WRITE_MAX_ITEMS)
+
+class BookBatchUpdateItem(BookUpdate):
+    id: int = Field(..., gt=0, description="ID изменяемой книги")
+
+class BatchItemResult(BaseModel):
+    index: int = Field(..., description="Позиция элемента в запросе (с 0)")
+    status: str = Field(..., description="created, updated или error")
+    id: Optional[int] = None
+    errors: List[str] = []
+
+class BatchWriteReport(BaseModel):
+    succeeded: int = 0
+    failed: int = 0
+    results: List[BatchItemResult] = []
+    
+    def add_result(self, index: int, status: str, book_id: int):
+        self.succeeded += 1
+        self.results.append(BatchItemResult(index=index, status=status, id=book_id))
+    
+    def add_error(self, index: int, *errors: str, book_id: Optional[int] = None):
+        self.failed += 1
+        self.results.append(BatchItemResult(index=index, status="error", id=book_id, errors=list(errors)))
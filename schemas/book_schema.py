@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 from datetime import date
 from typing import Optional
+from config.categories import get_category_directory
+from models.book import Book
 from .author_schema import AuthorResponse
 
 class BookBase(BaseModel):
@@ -37,5 +39,16 @@ class BookResponse(BookBase):
     author: Optional[AuthorResponse] = None
     category_name: Optional[str] = None
     
+    @model_validator(mode="before")
+    @classmethod
+    def resolve_category_name(cls, data):
+        # Имя категории ORM-книги берём из справочника в памяти; связь
+        # (Book.category_name) грузится, только если справочник категорию не знает
+        if not isinstance(data, Book):
+            return data
+        values = {name: getattr(data, name) for name in cls.model_fields if name != "category_name"}
+        values["category_name"] = get_category_directory().name_of(data, data.category_id) or data.category_name
+        return values
+    
     class Config:
         from_attributes = True
\ No newline at end of file
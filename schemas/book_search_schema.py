@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from .book_schema import BookResponse
+
+
+class FacetBucket(BaseModel):
+    value: Optional[int] = None
+    label: Optional[str] = None
+    count: int
+
+
+class BookSearchFacets(BaseModel):
+    categories: List[FacetBucket] = []
+    authors: List[FacetBucket] = []
+    available: int = 0
+    unavailable: int = 0
+    decades: List[FacetBucket] = []
+
+
+class BookSearchResponse(BaseModel):
+    items: List[BookResponse]
+    total: int
+    skip: int
+    limit: int
+    facets: BookSearchFacets
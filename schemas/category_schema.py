@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field, validator
+from typing import Optional
+
+class CategoryBase(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100, description="Category name")
+    description: Optional[str] = Field(None, max_length=1000, description="Description")
+
+class CategoryCreate(CategoryBase):
+    @validator('name')
+    def name_not_empty(cls, v):
+        if not v or not v.strip():
+            raise ValueError("Category name is required")
+        return v.strip()
+
+class CategoryUpdate(BaseModel):
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = Field(None, max_length=1000)
+
+class CategoryResponse(CategoryBase):
+    id: int
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+class ImportRowError(BaseModel):
+    row: int = Field(..., description="Номер строки данных (с 1)")
+    errors: List[str]
+
+class ImportReport(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+    
+    def add_error(self, row: int, *errors: str):
+        self.failed += 1
+        self.errors.append(ImportRowError(row=row, errors=list(errors)))
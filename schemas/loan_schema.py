@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional
+from models.loan import LoanStatus
+
+class LoanCreate(BaseModel):
+    book_id: int = Field(..., gt=0, description="Book ID")
+    days: int = Field(14, ge=1, le=90, description="Loan period in days")
+
+class LoanResponse(BaseModel):
+    id: int
+    book_id: int
+    user_id: int
+    loan_date: datetime
+    due_date: datetime
+    return_date: Optional[datetime] = None
+    status: LoanStatus
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,42 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.author import Author
+from repositories.pagination import Page
+from repositories.async_author_repository import AsyncAuthorRepository
+from schemas.author_schema import AuthorCreate, AuthorUpdate
+
+class AsyncAuthorService:
+    def __init__(self, db: AsyncSession):
+        self.author_repository = AsyncAuthorRepository(db)
+    
+    async def find_all(self) -> List[Author]:
+        return await self.author_repository.find_all()
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Author]:
+        return await self.author_repository.find_page(limit, cursor, offset)
+    
+    async def find_by_id(self, author_id: int) -> Optional[Author]:
+        return await self.author_repository.find_by_id(author_id)
+    
+    async def save(self, author_create: AuthorCreate) -> Author:
+        author = Author(**author_create.model_dump())
+        return await self.author_repository.save(author)
+    
+    async def delete_by_id(self, author_id: int) -> bool:
+        return await self.author_repository.delete_by_id(author_id)
+    
+    async def update(self, author_id: int, author_update: AuthorUpdate) -> Optional[Author]:
+        update_data = {k: v for k, v in author_update.model_dump().items() if v is not None}
+        return await self.author_repository.update(author_id, update_data)
+    
+    async def search_by_name(self, search_term: str) -> List[Author]:
+        return await self.author_repository.search_by_name(search_term)
+    
+    async def find_by_last_name(self, last_name: str) -> List[Author]:
+        return await self.author_repository.find_by_last_name(last_name)
+    
+    async def find_authors_with_books(self) -> List[Author]:
+        return await self.author_repository.find_authors_with_books()
+    
+    async def count_books_by_author_id(self, author_id: int) -> int:
+        return await self.author_repository.count_books_by_author_id(author_id)
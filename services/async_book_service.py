@@ -0,0 +1,55 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.book import Book
+from repositories.loading import SELECTIN
+from repositories.pagination import Page
+from repositories.async_book_repository import AsyncBookRepository
+from schemas.book_schema import BookCreate, BookUpdate
+
+class AsyncBookService:
+    def __init__(self, db: AsyncSession, load_strategy: str = SELECTIN):
+        self.book_repository = AsyncBookRepository(db, load_strategy)
+    
+    async def find_all(self) -> List[Book]:
+        return await self.book_repository.find_all()
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return await self.book_repository.find_page(limit, cursor, offset)
+    
+    async def find_by_id(self, book_id: int) -> Optional[Book]:
+        return await self.book_repository.find_by_id(book_id)
+    
+    async def save(self, book_create: BookCreate) -> Book:
+        book = Book(**book_create.model_dump())
+        return await self.book_repository.save(book)
+    
+    async def delete_by_id(self, book_id: int) -> bool:
+        return await self.book_repository.delete_by_id(book_id)
+    
+    async def update(self, book_id: int, book_update: BookUpdate) -> Optional[Book]:
+        update_data = {k: v for k, v in book_update.model_dump().items() if v is not None}
+        return await self.book_repository.update(book_id, update_data)
+    
+    async def find_by_title_containing(self, title: str) -> List[Book]:
+        return await self.book_repository.find_by_title_containing(title)
+    
+    async def search_by_title(self, text: str, limit: int = 50) -> List[Book]:
+        return await self.book_repository.search_by_title(text, limit)
+    
+    async def find_by_author_id(self, author_id: int) -> List[Book]:
+        return await self.book_repository.find_by_author_id(author_id)
+    
+    async def find_by_isbn(self, isbn: str) -> Optional[Book]:
+        return await self.book_repository.find_by_isbn(isbn)
+    
+    async def find_available_books(self) -> List[Book]:
+        return await self.book_repository.find_available_books()
+    
+    async def find_by_title_and_author_lastname(self, title: str, author_lastname: str) -> List[Book]:
+        return await self.book_repository.find_by_title_and_author_lastname(title, author_lastname)
+    
+    async def find_overdue_books(self) -> List[Book]:
+        return await self.book_repository.find_overdue_books()
+    
+    async def find_overdue_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return await self.book_repository.find_overdue_page(limit, cursor, offset)
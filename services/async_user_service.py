@@ -0,0 +1,42 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.user import User
+from repositories.pagination import Page
+from repositories.async_user_repository import AsyncUserRepository
+from schemas.user_schema import UserCreate, UserUpdate
+
+class AsyncUserService:
+    def __init__(self, db: AsyncSession):
+        self.user_repository = AsyncUserRepository(db)
+    
+    async def find_all(self) -> List[User]:
+        return await self.user_repository.find_all()
+    
+    async def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[User]:
+        return await self.user_repository.find_page(limit, cursor, offset)
+    
+    async def find_by_id(self, user_id: int) -> Optional[User]:
+        return await self.user_repository.find_by_id(user_id)
+    
+    async def save(self, user_create: UserCreate) -> User:
+        user = User(**user_create.model_dump())
+        return await self.user_repository.save(user)
+    
+    async def delete_by_id(self, user_id: int) -> bool:
+        return await self.user_repository.delete_by_id(user_id)
+    
+    async def find_by_email(self, email: str) -> Optional[User]:
+        return await self.user_repository.find_by_email(email)
+    
+    async def update(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
+        update_data = {k: v for k, v in user_update.model_dump().items() if v is not None}
+        return await self.user_repository.update(user_id, update_data)
+    
+    async def search_by_name(self, search_term: str) -> List[User]:
+        return await self.user_repository.search_by_name(search_term)
+    
+    async def exists_by_email(self, email: str) -> bool:
+        return await self.user_repository.exists_by_email(email)
+    
+    async def find_users_with_active_loans(self) -> List[User]:
+        return await self.user_repository.find_users_with_active_loans()
@@ -1,44 +1,57 @@
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
-import hashlib
 
 from models.user import User
 from schemas.auth_schema import TokenData
 from config.security import SECRET_KEY, ALGORITHM
+from config.passwords import get_password_hasher
 from .user_service import UserService
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 class AuthService:
     def __init__(self, db: Session):
         self.db = db
-        self.user_service = UserService(db) 
-    
-    def simple_hash_password(self, password: str) -> str:
-        salt = "library_salt_"
-        return hashlib.sha256(f"{salt}{password}".encode()).hexdigest()
+        self.user_service = UserService(db)
+        self.password_hasher = get_password_hasher()
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return self.simple_hash_password(plain_password) == hashed_password
+        return self.password_hasher.verify(plain_password, hashed_password)
     
     def get_password_hash(self, password: str) -> str:
-        return self.simple_hash_password(password)
+        return self.password_hasher.hash(password)
     
     def authenticate_user(self, email: str, password: str) -> Optional[User]:
-        user = self.user_service.find_by_email(email)
+        user = self.user_service.find_credentials_by_email(email)
         
         if not user:
             return None
-        if not self.verify_password(password, user.password):
+        verified, new_hash = self.password_hasher.verify_and_update(password, user.password)
+        if not verified:
             return None
+        if new_hash:
+            # Хеш устаревшей схемы или стоимости заменяется, пока пароль известен
+            user = self.user_service.rehash_password(user, new_hash)
         
         return user
     
+    def create_user_token(self, user: User, expires_delta: Optional[timedelta] = None) -> str:
+        """Токен с профилем пользователя; auth_time точнее iat и сравнивается с моментом отзыва"""
+        return self.create_access_token(
+            data={
+                "sub": user.email,
+                "user_id": user.id,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "created_at": user.created_at.isoformat() if user.created_at else None,
+                "auth_time": time.time(),
+            },
+            expires_delta=expires_delta
+        )
+    
     def create_access_token(self, data: dict, expires_delta: Optional[timedelta] = None):
         to_encode = data.copy()
         if expires_delta:
@@ -62,6 +75,13 @@ class AuthService:
             user_id: int = payload.get("user_id")
             if email is None or user_id is None:
                 raise credentials_exception
-            return TokenData(email=email, user_id=user_id)
+            return TokenData(
+                email=email,
+                user_id=user_id,
+                first_name=payload.get("first_name"),
+                last_name=payload.get("last_name"),
+                created_at=payload.get("created_at"),
+                issued_at=payload.get("auth_time", payload.get("iat")),
+            )
         except JWTError:
             raise credentials_exception
\ No newline at end of file
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from models.author import Author
+from repositories.pagination import Page
 from repositories.author_repository import AuthorRepository
 from schemas.author_schema import AuthorCreate, AuthorUpdate
 
@@ -11,6 +12,12 @@ class AuthorService:
     def find_all(self) -> List[Author]:
         return self.author_repository.find_all()
     
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Author]:
+        return self.author_repository.find_page(limit, cursor, offset)
+    
+    def find_stats_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page:
+        return self.author_repository.find_stats_page(limit, cursor, offset)
+    
     def find_by_id(self, author_id: int) -> Optional[Author]:
         return self.author_repository.find_by_id(author_id)
     
@@ -0,0 +1,205 @@
+from typing import Any, Dict, List
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.category_repository import CategoryRepository
+from repositories.loading import JOINED
+from schemas.book_batch_schema import BatchWriteReport, BookBatchGetResponse, BookBatchUpdateItem
+from schemas.book_schema import BookCreate
+from services.import_service import validation_messages
+
+CREATED = "created"
+UPDATED = "updated"
+
+
+class BookBatchService:
+    """Пакетные операции с книгами: чтение одним IN-запросом, запись одной транзакцией.
+
+    Каждый элемент проверяется отдельно, а существование авторов, категорий
+    и ISBN — одним запросом на пакет. Прошедшие проверку элементы пишутся
+    вместе одним flush; коммитит их маршрут (UnitOfWorkRoute). Если БД
+    отвергает запись, транзакция запроса откатывается и ошибка приписывается
+    каждому из этих элементов.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.book_repository = BookRepository(db)
+        self.author_repository = AuthorRepository(db)
+        self.category_repository = CategoryRepository(db)
+    
+    def get_many(self, book_ids: List[int], isbns: List[str]) -> BookBatchGetResponse:
+        book_ids = list(dict.fromkeys(book_ids))
+        isbns = list(dict.fromkeys(isbns))
+        # Автор и категория присоединяются в том же запросе
+        books = BookRepository(self.db, JOINED).find_by_ids_or_isbns(book_ids, isbns)
+        by_id = {book.id: book for book in books}
+        by_isbn = {book.isbn: book for book in books}
+        
+        items, seen = [], set()
+        for book in [by_id.get(book_id) for book_id in book_ids] + [by_isbn.get(isbn) for isbn in isbns]:
+            if book is not None and book.id not in seen:
+                seen.add(book.id)
+                items.append(book)
+        return BookBatchGetResponse(
+            items=items,
+            missing_ids=[book_id for book_id in book_ids if book_id not in by_id],
+            missing_isbns=[isbn for isbn in isbns if isbn not in by_isbn],
+        )
+    
+    def create_many(self, items: List[Dict[str, Any]]) -> BatchWriteReport:
+        report = BatchWriteReport()
+        candidates, seen_isbns = [], set()
+        for index, data in enumerate(items):
+            book = self._validate(BookCreate, index, data, report)
+            if book is None:
+                continue
+            if book.isbn in seen_isbns:
+                report.add_error(index, f"Duplicate ISBN {book.isbn} in batch")
+                continue
+            seen_isbns.add(book.isbn)
+            candidates.append((index, book))
+        
+        existing_isbns = self.book_repository.find_ids_by_isbns([book.isbn for _, book in candidates])
+        author_ids, category_ids = self._existing_references([book for _, book in candidates])
+        valid = []
+        for index, book in candidates:
+            errors = self._reference_errors(book, author_ids, category_ids)
+            if book.isbn in existing_isbns:
+                errors.append(f"A book with ISBN {book.isbn} already exists")
+            if errors:
+                report.add_error(index, *errors)
+            else:
+                valid.append((index, book))
+        
+        if valid:
+            try:
+                created = self.book_repository.bulk_insert([book.model_dump() for _, book in valid])
+            except SQLAlchemyError as exc:
+                self._reject(valid, exc, report)
+            else:
+                for index, book in valid:
+                    report.add_result(index, CREATED, created[book.isbn])
+        report.results.sort(key=lambda result: result.index)
+        return report
+    
+    def update_many(self, items: List[Dict[str, Any]]) -> BatchWriteReport:
+        report = BatchWriteReport()
+        candidates, seen_ids, seen_isbns = [], set(), set()
+        for index, data in enumerate(items):
+            item = self._validate(BookBatchUpdateItem, index, data, report)
+            if item is None:
+                continue
+            if item.id in seen_ids:
+                report.add_error(index, f"Duplicate book ID {item.id} in batch", book_id=item.id)
+                continue
+            if item.isbn and item.isbn in seen_isbns:
+                report.add_error(index, f"Duplicate ISBN {item.isbn} in batch", book_id=item.id)
+                continue
+            seen_ids.add(item.id)
+            if item.isbn:
+                seen_isbns.add(item.isbn)
+            candidates.append((index, item))
+        
+        books = {book.id: book for book in self.book_repository.find_by_ids([item.id for _, item in candidates])}
+        isbn_owners = self.book_repository.find_ids_by_isbns([item.isbn for _, item in candidates if item.isbn])
+        author_ids, category_ids = self._existing_references([item for _, item in candidates])
+        
+        found = []
+        for index, item in candidates:
+            if item.id in books:
+                found.append((index, item))
+            else:
+                report.add_error(index, f"Book with ID {item.id} not found", book_id=item.id)
+        
+        valid = []
+        taken = self._taken_isbns(found, books, isbn_owners)
+        for index, item in found:
+            errors = self._reference_errors(item, author_ids, category_ids)
+            if item.id in taken:
+                errors.append(f"A book with ISBN {item.isbn} already exists")
+            if errors:
+                report.add_error(index, *errors, book_id=item.id)
+            else:
+                valid.append((index, item))
+        # Отклонённый элемент не освобождает свой ISBN: проверяем заново, пока отказы не кончатся
+        taken = self._taken_isbns(valid, books, isbn_owners)
+        while taken:
+            for index, item in valid:
+                if item.id in taken:
+                    report.add_error(index, f"A book with ISBN {item.isbn} already exists", book_id=item.id)
+            valid = [(index, item) for index, item in valid if item.id not in taken]
+            taken = self._taken_isbns(valid, books, isbn_owners)
+        
+        if valid:
+            try:
+                self._apply_updates([item for _, item in valid], books)
+            except SQLAlchemyError as exc:
+                self._reject(valid, exc, report)
+            else:
+                for index, item in valid:
+                    report.add_result(index, UPDATED, item.id)
+        report.results.sort(key=lambda result: result.index)
+        return report
+    
+    def _taken_isbns(self, items: list, books: dict, isbn_owners: dict) -> set:
+        """id элементов, чей новый ISBN в итоговом состоянии пакета останется у другой книги.
+
+        ISBN свободен, если у него нет владельца или владелец сам меняет ISBN в
+        этом же пакете, — так обмен ISBN между двумя книгами проходит проверку.
+        """
+        moving = {item.id for _, item in items if item.isbn and item.isbn != books[item.id].isbn}
+        return {
+            item.id for _, item in items
+            if item.isbn and isbn_owners.get(item.isbn, item.id) not in (item.id, *moving)
+        }
+    
+    def _apply_updates(self, items: list, books: dict):
+        current = {books[item.id].isbn for item in items}
+        moving = [item for item in items if item.isbn and item.isbn != books[item.id].isbn]
+        if any(item.isbn in current for item in moving):
+            # ISBN переходит к другой книге пакета: сначала освобождаем его временным
+            # значением, иначе промежуточный UPDATE нарушит уникальность
+            for item in moving:
+                books[item.id].isbn = f"~{item.id}"
+            self.db.flush()
+        for item in items:
+            for key, value in item.model_dump(exclude={"id"}).items():
+                if value is not None:
+                    setattr(books[item.id], key, value)
+        # Один flush: UPDATE с одинаковым набором столбцов уходят одним executemany
+        self.db.flush()
+    
+    def _validate(self, schema, index: int, data: Any, report: BatchWriteReport):
+        if not isinstance(data, dict):
+            report.add_error(index, "Item must be a JSON object")
+            return None
+        try:
+            return schema(**data)
+        except ValidationError as exc:
+            report.add_error(index, *validation_messages(exc), book_id=data.get("id") if schema is BookBatchUpdateItem else None)
+            return None
+    
+    def _existing_references(self, books) -> tuple:
+        author_ids = self.author_repository.find_existing_ids({book.author_id for book in books if book.author_id})
+        category_ids = self.category_repository.find_existing_ids({book.category_id for book in books if book.category_id})
+        return author_ids, category_ids
+    
+    def _reference_errors(self, book, author_ids: set, category_ids: set) -> List[str]:
+        errors = []
+        if book.author_id and book.author_id not in author_ids:
+            errors.append(f"The author with ID {book.author_id} does not exist.")
+        if book.category_id and book.category_id not in category_ids:
+            errors.append(f"Category with ID {book.category_id} does not exist")
+        return errors
+    
+    def _reject(self, valid: list, exc: SQLAlchemyError, report: BatchWriteReport):
+        # В транзакции запроса только этот пакет — откатываем её целиком
+        self.db.rollback()
+        message = f"Batch rejected by database: {exc.__class__.__name__}"
+        for index, item in valid:
+            report.add_error(index, message, book_id=getattr(item, "id", None))
@@ -1,16 +1,26 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from models.book import Book
+from repositories.pagination import Page
 from repositories.book_repository import BookRepository
+from repositories.book_rows import BookRow
+from repositories.book_search import AVAILABILITY, AUTHOR, CATEGORY, DECADE, TOTAL, BookSearchCriteria
 from schemas.book_schema import BookCreate, BookUpdate
+from schemas.book_search_schema import BookSearchResponse
 
 class BookService:
-    def __init__(self, db: Session):
-        self.book_repository = BookRepository(db)
+    def __init__(self, db: Session, load_strategy: Optional[str] = None):
+        self.book_repository = BookRepository(db, load_strategy)
     
     def find_all(self) -> List[Book]:
         return self.book_repository.find_all()
     
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return self.book_repository.find_page(limit, cursor, offset)
+    
+    def find_rows_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[BookRow]:
+        return self.book_repository.find_rows_page(limit, cursor, offset)
+    
     def find_by_id(self, book_id: int) -> Optional[Book]:
         return self.book_repository.find_by_id(book_id)
     
@@ -29,17 +39,56 @@ class BookService:
     def find_by_title_containing(self, title: str) -> List[Book]:
         return self.book_repository.find_by_title_containing(title)
     
+    def search(self, criteria: BookSearchCriteria, sort: str = "id", skip: int = 0, limit: int = 20,
+               facet_size: int = 20) -> BookSearchResponse:
+        """Страница книг по фильтрам и фасеты к ней: два запроса независимо от числа фасетов."""
+        facets = self.book_repository.search_facets(criteria, facet_size)
+        total = facets[TOTAL][0]["count"] if facets[TOTAL] else 0
+        items = self.book_repository.search(criteria, sort, skip, limit) if total > skip else []
+        availability = {bucket["value"]: bucket["count"] for bucket in facets[AVAILABILITY]}
+        return BookSearchResponse(
+            items=items,
+            total=total,
+            skip=skip,
+            limit=limit,
+            facets={
+                "categories": facets[CATEGORY],
+                "authors": facets[AUTHOR],
+                "available": availability.get(1, 0),
+                "unavailable": availability.get(0, 0),
+                "decades": facets[DECADE],
+            },
+        )
+    
+    def search_by_title(self, text: str, limit: int = 50) -> List[Book]:
+        return self.book_repository.search_by_title(text, limit)
+    
+    def rebuild_title_index(self) -> int:
+        return self.book_repository.rebuild_title_index()
+    
     def find_by_author_id(self, author_id: int) -> List[Book]:
         return self.book_repository.find_by_author_id(author_id)
     
+    def find_rows_by_author_id(self, author_id: int) -> List[BookRow]:
+        return self.book_repository.find_rows_by_author_id(author_id)
+    
     def find_by_isbn(self, isbn: str) -> Optional[Book]:
         return self.book_repository.find_by_isbn(isbn)
     
     def find_available_books(self) -> List[Book]:
         return self.book_repository.find_available_books()
     
+    def find_available_rows(self) -> List[BookRow]:
+        return self.book_repository.find_available_rows()
+    
     def find_by_title_and_author_lastname(self, title: str, author_lastname: str) -> List[Book]:
         return self.book_repository.find_by_title_and_author_lastname(title, author_lastname)
     
     def find_overdue_books(self) -> List[Book]:
-        return self.book_repository.find_overdue_books()
\ No newline at end of file
+        return self.book_repository.find_overdue_books()
+    
+    def find_overdue_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[Book]:
+        return self.book_repository.find_overdue_page(limit, cursor, offset)
+    
+    def find_overdue_rows_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[BookRow]:
+        return self.book_repository.find_overdue_rows_page(limit, cursor, offset)
\ No newline at end of file
@@ -2,6 +2,7 @@ from typing import List, Optional
 from sqlalchemy.orm import Session
 from models.category import Category
 from repositories.category_repository import CategoryRepository
+from schemas.category_schema import CategoryCreate, CategoryUpdate
 
 class CategoryService:
     def __init__(self, db: Session):
@@ -13,5 +14,22 @@ class CategoryService:
     def find_by_id(self, category_id: int) -> Optional[Category]:
         return self.category_repository.find_by_id(category_id)
     
+    def exists_by_id(self, category_id: int) -> bool:
+        return self.category_repository.exists_by_id(category_id)
+    
     def find_by_name(self, name: str) -> Optional[Category]:
-        return self.category_repository.find_by_name(name)
\ No newline at end of file
+        return self.category_repository.find_by_name(name)
+    
+    def exists_by_name(self, name: str) -> bool:
+        return self.category_repository.exists_by_name(name)
+    
+    def save(self, category_create: CategoryCreate) -> Category:
+        category = Category(**category_create.dict())
+        return self.category_repository.save(category)
+    
+    def update(self, category_id: int, category_update: CategoryUpdate) -> Optional[Category]:
+        update_data = {k: v for k, v in category_update.dict().items() if v is not None}
+        return self.category_repository.update(category_id, update_data)
+    
+    def delete_by_id(self, category_id: int) -> bool:
+        return self.category_repository.delete_by_id(category_id)
@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Iterable, Iterator
+
+from sqlalchemy.orm import Session
+
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.user_repository import UserRepository
+
+NDJSON = "ndjson"
+CSV = "csv"
+FORMATS = (NDJSON, CSV)
+
+MEDIA_TYPES = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv; charset=utf-8",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _ndjson(batches: Iterable[list]) -> Iterator[str]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(row), ensure_ascii=False, default=_json_default) + "\n" for row in batch
+        )
+
+
+def _csv(batches: Iterable[list]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = None
+    for batch in batches:
+        for row in batch:
+            if writer is None:
+                writer = csv.DictWriter(buffer, fieldnames=list(row.keys()))
+                writer.writeheader()
+            writer.writerow({key: (value.isoformat() if isinstance(value, (date, datetime)) else value)
+                             for key, value in row.items()})
+        # Каждую пачку отдаём клиенту сразу, буфер не растёт
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+class ExportService:
+    def __init__(self, db: Session, batch_size: int = 1000):
+        self.db = db
+        self.batch_size = batch_size
+    
+    def export_books(self, fmt: str) -> Iterator[str]:
+        return self._encode(BookRepository(self.db).iter_export_batches(self.batch_size), fmt)
+    
+    def export_authors(self, fmt: str) -> Iterator[str]:
+        return self._encode(AuthorRepository(self.db).iter_export_batches(self.batch_size), fmt)
+    
+    def export_users(self, fmt: str) -> Iterator[str]:
+        return self._encode(UserRepository(self.db).iter_export_batches(self.batch_size), fmt)
+    
+    def _encode(self, batches: Iterable[list], fmt: str) -> Iterator[str]:
+        if fmt == NDJSON:
+            return _ndjson(batches)
+        if fmt == CSV:
+            return _csv(batches)
+        raise ValueError(f"Unsupported export format: {fmt}")
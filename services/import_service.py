@@ -0,0 +1,153 @@
+import csv
+import json
+from itertools import islice
+from typing import IO, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from config.unit_of_work import unit_of_work
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.category_repository import CategoryRepository
+from schemas.author_schema import AuthorCreate
+from schemas.book_schema import BookCreate
+from schemas.import_schema import ImportReport
+
+CSV = "csv"
+JSONL = "jsonl"
+FORMATS = (CSV, JSONL)
+
+# (номер строки, данные, ошибка разбора)
+RawRow = Tuple[int, Optional[dict], Optional[str]]
+
+
+def detect_format(filename: Optional[str], default: str = CSV) -> str:
+    if filename and filename.lower().endswith((".jsonl", ".ndjson")):
+        return JSONL
+    return default
+
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[RawRow]:
+    """Построчно читает CSV (с заголовком) или JSONL, не загружая файл целиком."""
+    if fmt == CSV:
+        for number, record in enumerate(csv.DictReader(stream), start=1):
+            # Пустая ячейка CSV означает отсутствие значения
+            yield number, {key: (value if value != "" else None) for key, value in record.items()}, None
+    elif fmt == JSONL:
+        number = 0
+        for line in stream:
+            if not line.strip():
+                continue
+            number += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield number, None, f"Invalid JSON: {exc.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield number, None, "Row must be a JSON object"
+                continue
+            yield number, record, None
+    else:
+        raise ValueError(f"Unsupported import format: {fmt}")
+
+
+def _chunks(rows: Iterable[RawRow], size: int) -> Iterator[List[RawRow]]:
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validation_messages(exc: ValidationError) -> List[str]:
+    return [f"{' -> '.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in exc.errors()]
+
+
+class ImportService:
+    def __init__(self, db: Session, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.book_repository = BookRepository(db)
+        self.author_repository = AuthorRepository(db)
+        self.category_repository = CategoryRepository(db)
+    
+    def import_books(self, rows: Iterable[RawRow]) -> ImportReport:
+        report = ImportReport()
+        seen_isbns = set()
+        for chunk in _chunks(rows, self.chunk_size):
+            self._import_book_chunk(chunk, report, seen_isbns)
+        report.errors.sort(key=lambda error: error.row)
+        return report
+    
+    def import_authors(self, rows: Iterable[RawRow]) -> ImportReport:
+        report = ImportReport()
+        for chunk in _chunks(rows, self.chunk_size):
+            valid = []
+            for number, data, error in chunk:
+                author = self._validate(AuthorCreate, number, data, error, report)
+                if author is not None:
+                    valid.append((number, author.model_dump()))
+            self._write_chunk(valid, self.author_repository.bulk_insert, report)
+        report.errors.sort(key=lambda error: error.row)
+        return report
+    
+    def _import_book_chunk(self, chunk: List[RawRow], report: ImportReport, seen_isbns: set):
+        candidates = []
+        for number, data, error in chunk:
+            book = self._validate(BookCreate, number, data, error, report)
+            if book is None:
+                continue
+            if book.isbn in seen_isbns:
+                report.add_error(number, f"Duplicate ISBN {book.isbn} in import file")
+                continue
+            seen_isbns.add(book.isbn)
+            candidates.append((number, book))
+        
+        # Одна выборка на чанк вместо трёх запросов на каждую книгу
+        author_ids = self.author_repository.find_existing_ids({book.author_id for _, book in candidates})
+        category_ids = self.category_repository.find_existing_ids(
+            {book.category_id for _, book in candidates if book.category_id}
+        )
+        existing_isbns = self.book_repository.find_existing_isbns([book.isbn for _, book in candidates])
+        
+        valid = []
+        for number, book in candidates:
+            errors = []
+            if book.author_id not in author_ids:
+                errors.append(f"The author with ID {book.author_id} does not exist.")
+            if book.category_id and book.category_id not in category_ids:
+                errors.append(f"Category with ID {book.category_id} does not exist")
+            if book.isbn in existing_isbns:
+                errors.append(f"A book with ISBN {book.isbn} already exists")
+            if errors:
+                report.add_error(number, *errors)
+            else:
+                valid.append((number, book.model_dump()))
+        self._write_chunk(valid, self.book_repository.bulk_insert, report)
+    
+    def _validate(self, schema, number: int, data: Optional[dict], error: Optional[str], report: ImportReport):
+        if error:
+            report.add_error(number, error)
+            return None
+        try:
+            return schema(**data)
+        except ValidationError as exc:
+            report.add_error(number, *validation_messages(exc))
+            return None
+    
+    def _write_chunk(self, valid: list, bulk_insert, report: ImportReport):
+        if not valid:
+            return
+        try:
+            with unit_of_work(self.db):
+                bulk_insert([row for _, row in valid])
+        except SQLAlchemyError as exc:
+            message = f"Batch rejected by database: {exc.__class__.__name__}"
+            for number, _ in valid:
+                report.add_error(number, message)
+            return
+        report.imported += len(valid)
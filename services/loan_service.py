@@ -0,0 +1,39 @@
+from typing import List, Optional
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from config.unit_of_work import unit_of_work
+from models.loan import Loan
+from repositories.loan_repository import LoanRepository
+
+class LoanService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.loan_repository = LoanRepository(db)
+    
+    def find_by_id(self, loan_id: int) -> Optional[Loan]:
+        return self.loan_repository.find_by_id(loan_id)
+    
+    def find_open_by_user_id(self, user_id: int) -> List[Loan]:
+        return self.loan_repository.find_open_by_user_id(user_id)
+    
+    def sweep_overdue(self, batch_size: int = 1000, max_batches: Optional[int] = None) -> int:
+        """Пакетами переводит просроченные займы в OVERDUE; возвращает их число."""
+        now = datetime.utcnow()
+        total = 0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            # Каждый пакет — своя транзакция: блокировки не копятся на весь проход
+            with unit_of_work(self.db):
+                updated = self.loan_repository.mark_overdue_batch(now, batch_size)
+            total += updated
+            batches += 1
+            if updated < batch_size:
+                break
+        return total
+    
+    def checkout(self, book_id: int, user_id: int, days: int = 14) -> Optional[Loan]:
+        loan_date = datetime.utcnow()
+        return self.loan_repository.checkout(book_id, user_id, loan_date, loan_date + timedelta(days=days))
+    
+    def return_loan(self, loan: Loan) -> bool:
+        return self.loan_repository.close(loan, datetime.utcnow())
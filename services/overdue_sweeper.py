@@ -0,0 +1,34 @@
+import asyncio
+import logging
+import os
+
+from config.database import SessionLocal
+from services.loan_service import LoanService
+
+OVERDUE_SWEEP_INTERVAL_SECONDS = float(os.getenv("OVERDUE_SWEEP_INTERVAL_SECONDS", "300"))
+OVERDUE_SWEEP_BATCH_SIZE = int(os.getenv("OVERDUE_SWEEP_BATCH_SIZE", "1000"))
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_overdue(batch_size: int = OVERDUE_SWEEP_BATCH_SIZE) -> int:
+    """Один проход: все просроченные ACTIVE-займы становятся OVERDUE пакетами по batch_size."""
+    db = SessionLocal()
+    try:
+        return LoanService(db).sweep_overdue(batch_size)
+    finally:
+        db.close()
+
+
+async def run_overdue_sweeper(interval: float = OVERDUE_SWEEP_INTERVAL_SECONDS,
+                              batch_size: int = OVERDUE_SWEEP_BATCH_SIZE) -> None:
+    """Периодический проход в фоне; синхронная работа с БД уходит в пул потоков."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            updated = await asyncio.to_thread(sweep_overdue, batch_size)
+        except Exception:
+            logger.exception("Overdue sweep failed")
+            continue
+        if updated:
+            logger.info("Marked %d loans as overdue", updated)
@@ -1,6 +1,8 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from config.passwords import hash_password
 from models.user import User
+from repositories.pagination import Page
 from repositories.user_repository import UserRepository
 from schemas.user_schema import UserCreate, UserUpdate
 
@@ -11,6 +13,9 @@ class UserService:
     def find_all(self) -> List[User]:
         return self.user_repository.find_all()
     
+    def find_page(self, limit: int = 100, cursor: Optional[str] = None, offset: Optional[int] = None) -> Page[User]:
+        return self.user_repository.find_page(limit, cursor, offset)
+    
     def find_by_id(self, user_id: int) -> Optional[User]:
         return self.user_repository.find_by_id(user_id)
     
@@ -25,6 +30,9 @@ class UserService:
     def find_by_email(self, email: str) -> Optional[User]:
         return self.user_repository.find_by_email(email)
     
+    def find_credentials_by_email(self, email: str) -> Optional[User]:
+        return self.user_repository.find_credentials_by_email(email)
+    
     def update(self, user_id: int, user_update: UserUpdate) -> Optional[User]:
         update_data = {k: v for k, v in user_update.model_dump().items() if v is not None}
         return self.user_repository.update(user_id, update_data)
@@ -38,12 +46,12 @@ class UserService:
     def find_users_with_active_loans(self) -> List[User]:
         return self.user_repository.find_users_with_active_loans()
     
+    def rehash_password(self, user: User, hashed_password: str) -> User:
+        return self.user_repository.update_password_hash(user, hashed_password)
+    
     def create_user_with_hashed_password(self, user_create: UserCreate) -> User:
-        from services.auth_service import AuthService
-        auth_service = AuthService(self.db)
-        
-        hashed_password = auth_service.get_password_hash(user_create.password)
-        user_data = user_create.dict()
+        hashed_password = hash_password(user_create.password)
+        user_data = user_create.model_dump()
         user_data['password'] = hashed_password
         
         user = User(**user_data)
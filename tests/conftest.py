@@ -2,11 +2,33 @@ import pytest
 import sys
 import os
 import time
+import uuid
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# По умолчанию тесты идут на in-memory SQLite; для MySQL задайте DATABASE_URL
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+# Тесты идут в одном процессе, а их БД не всегда общая с движком приложения —
+# версии сущностей держим в памяти; DatabaseVersionStore проверяется отдельно
+os.environ.setdefault("ENTITY_VERSION_STORE", "memory")
+# У in-memory базы нет миграций: схему создаёт create_all, тестовые данные грузятся при старте
+os.environ.setdefault("STARTUP_SCHEMA_MODE", "create")
+os.environ.setdefault("STARTUP_SEED_DATA", "true")
+# Минимальная стоимость bcrypt: тесты проверяют логику, а не стойкость хеша
+os.environ.setdefault("PASSWORD_BCRYPT_ROUNDS", "4")
 
 from main import app
+from config.cache import get_entity_cache
+from config.revocation import get_revocation_list
+
+
+@pytest.fixture(autouse=True)
+def clear_entity_cache():
+    """Кэш сущностей общий для процесса, а тестовые БД у каждого теста свои"""
+    get_entity_cache().clear()
+    # Отзывы из тестовых БД других тестов не должны задевать пользователей с теми же id
+    get_revocation_list().clear()
+    yield
 
 
 @pytest.fixture(scope="function")
@@ -18,7 +40,7 @@ def client():
 
 @pytest.fixture
 def auth_headers(client):
-    unique_email = f"test_{int(time.time())}@library.com"
+    unique_email = f"test_{uuid.uuid4().hex}@library.com"
     
     user_data = {
         "email": unique_email,
@@ -0,0 +1,117 @@
+import threading
+import uuid
+
+import pytest
+from aiosqlite.core import _connection_worker_thread
+from fastapi.testclient import TestClient
+
+from config import database
+from config.database import Base, configure_async_engine, create_db_engine
+from main import app
+
+
+def _aiosqlite_threads():
+    return [thread for thread in threading.enumerate()
+            if getattr(thread, "_target", None) is _connection_worker_thread and thread.is_alive()]
+
+
+@pytest.fixture
+def async_client(tmp_path, monkeypatch):
+    """Клиент для /api/async: асинхронный движок на файловой SQLite со своей схемой."""
+    path = tmp_path / "async.db"
+    engine = create_db_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    monkeypatch.setattr(database, "_async_engine", None)
+    monkeypatch.setattr(database, "_AsyncSessionLocal", None)
+    configure_async_engine(f"sqlite+aiosqlite:///{path}")
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def async_auth_headers(async_client):
+    # Токен выдаёт синхронный стек; асинхронные маршруты проверяют его без БД
+    email = f"async_{uuid.uuid4().hex}@library.com"
+    async_client.post("/api/auth/register", json={"email": email, "password": "password123",
+                                                  "first_name": "Async", "last_name": "User"})
+    token = async_client.post("/api/auth/login", json={"email": email, "password": "password123"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestAsyncControllers:
+    def test_author_crud(self, async_client):
+        created = async_client.post("/api/async/authors/", json={"first_name": "Лев", "last_name": "Толстой"})
+        assert created.status_code == 201, created.text
+        author_id = created.json()["id"]
+
+        assert async_client.get(f"/api/async/authors/{author_id}").json()["last_name"] == "Толстой"
+        updated = async_client.put(f"/api/async/authors/{author_id}", json={"last_name": "Толстой-мл."})
+        assert updated.status_code == 200 and updated.json()["last_name"] == "Толстой-мл."
+        assert [author["id"] for author in async_client.get("/api/async/authors/").json()] == [author_id]
+
+        assert async_client.delete(f"/api/async/authors/{author_id}").status_code == 204
+        assert async_client.get(f"/api/async/authors/{author_id}").status_code == 404
+        assert async_client.delete(f"/api/async/authors/{author_id}").status_code == 404
+
+    def test_book_crud_and_queries(self, async_client, async_auth_headers):
+        author_id = async_client.post("/api/async/authors/", json={"first_name": "Антон", "last_name": "Чехов"}).json()["id"]
+        book = {"title": "Чайка", "isbn": "978-5-17-000001-1", "publication_date": "1896-01-01",
+                "available_copies": 2, "author_id": author_id}
+
+        assert async_client.post("/api/async/books/", json=book).status_code in (401, 403)
+        created = async_client.post("/api/async/books/", json=book, headers=async_auth_headers)
+        assert created.status_code == 201, created.text
+        book_id = created.json()["id"]
+        assert async_client.post("/api/async/books/", json=book, headers=async_auth_headers).status_code == 400
+        missing_author = {**book, "isbn": "978-5-17-000002-8", "author_id": author_id + 1}
+        assert async_client.post("/api/async/books/", json=missing_author, headers=async_auth_headers).status_code == 400
+
+        fetched = async_client.get(f"/api/async/books/{book_id}", headers=async_auth_headers)
+        assert fetched.status_code == 200 and fetched.json()["author"]["last_name"] == "Чехов"
+        assert async_client.get(f"/api/async/books/isbn/{book['isbn']}").json()["id"] == book_id
+        assert [b["id"] for b in async_client.get(f"/api/async/books/author/{author_id}").json()] == [book_id]
+        assert [b["id"] for b in async_client.get("/api/async/books/search/title/Чай").json()] == [book_id]
+        assert [b["id"] for b in async_client.get("/api/async/books/available/").json()] == [book_id]
+        assert [b["id"] for b in async_client.get("/api/async/books/public/").json()] == [book_id]
+        assert async_client.get("/api/async/books/overdue/").json() == []
+
+        updated = async_client.put(f"/api/async/books/{book_id}", json={"available_copies": 0})
+        assert updated.status_code == 200 and updated.json()["available_copies"] == 0
+        assert async_client.get("/api/async/books/available/").json() == []
+
+        assert async_client.delete(f"/api/async/books/{book_id}").status_code == 204
+        assert async_client.get(f"/api/async/books/isbn/{book['isbn']}").status_code == 404
+
+    def test_user_crud(self, async_client):
+        user = {"email": "async.reader@library.com", "password": "password123",
+                "first_name": "Анна", "last_name": "Каренина"}
+        created = async_client.post("/api/async/users/", json=user)
+        assert created.status_code == 201, created.text
+        assert "password" not in created.json()
+        user_id = created.json()["id"]
+        assert async_client.post("/api/async/users/", json=user).status_code == 400
+
+        assert async_client.get(f"/api/async/users/email/{user['email']}").json()["id"] == user_id
+        assert [found["id"] for found in async_client.get("/api/async/users/search/Анна").json()] == [user_id]
+        updated = async_client.put(f"/api/async/users/{user_id}", json={"first_name": "Анна Аркадьевна"})
+        assert updated.status_code == 200 and updated.json()["first_name"] == "Анна Аркадьевна"
+
+        assert async_client.delete(f"/api/async/users/{user_id}").status_code == 204
+        assert async_client.get(f"/api/async/users/{user_id}").status_code == 404
+
+    def test_shutdown_should_close_async_connections(self, tmp_path, monkeypatch):
+        path = tmp_path / "shutdown.db"
+        engine = create_db_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        monkeypatch.setattr(database, "_async_engine", None)
+        monkeypatch.setattr(database, "_AsyncSessionLocal", None)
+        configure_async_engine(f"sqlite+aiosqlite:///{path}")
+
+        with TestClient(app) as client:
+            assert client.get("/api/async/authors/").status_code == 200
+            assert _aiosqlite_threads()
+        # Живой поток aiosqlite не дал бы интерпретатору завершиться
+        assert _aiosqlite_threads() == []
+        assert database._async_engine is None
@@ -1,5 +1,6 @@
 import pytest
 import time
+import uuid
 
 
 class TestAuthController:
@@ -94,4 +95,75 @@ class TestAuthController:
         assert response.status_code == 200
         data = response.json()
         assert data["email"] == unique_email
-        assert "password" not in data
\ No newline at end of file
+        assert "password" not in data    
+    def _login(self, client, first_name="Stateless"):
+        unique_email = f"stateless_{uuid.uuid4().hex}@library.com"
+        user_data = {"email": unique_email, "password": "password123", "first_name": first_name, "last_name": "User"}
+        user = client.post("/api/auth/register", json=user_data).json()
+        token = client.post("/api/auth/login", json={"email": unique_email, "password": "password123"}).json()["access_token"]
+        return user, {"Authorization": f"Bearer {token}"}
+    
+    def test_authenticated_request_should_not_query_users(self, client):
+        from sqlalchemy import event
+        from config.database import engine
+        user, headers = self._login(client)
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = client.get("/api/auth/me", headers=headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert response.status_code == 200
+        assert response.json() == user
+        assert statements == []
+    
+    def test_token_of_deleted_user_should_be_rejected(self, client):
+        user, headers = self._login(client)
+        assert client.delete(f"/api/users/{user['id']}").status_code == 204
+        
+        response = client.get("/api/auth/me", headers=headers)
+        assert response.status_code == 401
+    
+    def test_token_issued_after_delete_should_be_rejected(self, client):
+        from types import SimpleNamespace
+        from services.auth_service import AuthService
+        user, _ = self._login(client)
+        assert client.delete(f"/api/users/{user['id']}").status_code == 204
+        
+        # Вход, успевший прочитать пользователя до удаления, выдал бы токен уже после него
+        token = AuthService(None).create_user_token(SimpleNamespace(
+            id=user["id"], email=user["email"], first_name=user["first_name"],
+            last_name=user["last_name"], created_at=None,
+        ))
+        response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 401
+    
+    def test_token_issued_before_profile_change_should_be_rejected(self, client):
+        user, headers = self._login(client)
+        assert client.put(f"/api/users/{user['id']}", json={"first_name": "Renamed"}).status_code == 200
+        assert client.get("/api/auth/me", headers=headers).status_code == 401
+        
+        token = client.post("/api/auth/login", json={"email": user["email"], "password": "password123"}).json()["access_token"]
+        response = client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+        assert response.json()["first_name"] == "Renamed"
+    
+    def test_login_should_not_accept_cached_credentials_of_user_deleted_elsewhere(self, client):
+        from sqlalchemy import delete
+        from config.database import SessionLocal, engine
+        from models.user import User
+        from repositories.user_repository import UserRepository
+        user, _ = self._login(client)
+        session = SessionLocal()
+        UserRepository(session).find_by_email(user["email"])
+        session.close()
+        
+        # Так удаление из другого воркера выглядит для этого: кэш не сброшен
+        with engine.begin() as connection:
+            connection.execute(delete(User).where(User.id == user["id"]))
+        response = client.post("/api/auth/login", json={"email": user["email"], "password": "password123"})
+        assert response.status_code == 401
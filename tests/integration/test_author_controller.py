@@ -0,0 +1,19 @@
+from controllers.pagination import NEXT_CURSOR_HEADER
+
+
+class TestAuthorController:
+    def test_get_authors_should_return_ok(self, client):
+        response = client.get("/api/authors/")
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+    
+    def test_get_author_stats_should_page_by_cursor(self, client):
+        first = client.get("/api/authors/stats", params={"limit": 1})
+        assert first.status_code == 200, first.text
+        [row] = first.json()
+        assert set(row) == {"id", "first_name", "last_name", "book_count", "available_copies", "active_loans"}
+        assert row["book_count"] >= 1 and row["active_loans"] >= 0
+        
+        second = client.get("/api/authors/stats", params={"limit": 1, "cursor": first.headers[NEXT_CURSOR_HEADER]})
+        assert second.status_code == 200
+        assert second.json()[0]["id"] > row["id"]
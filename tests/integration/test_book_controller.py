@@ -1,5 +1,6 @@
 import pytest
 import time
+import uuid
 
 
 class TestBookController:
@@ -36,4 +37,56 @@ class TestBookController:
         headers = {"Authorization": f"Bearer {token}"}
         response = client.get("/api/books/", headers=headers)
         assert response.status_code == 200
-        assert isinstance(response.json(), list)
\ No newline at end of file
+        assert isinstance(response.json(), list)    
+    def test_get_public_books_with_matching_etag_should_return_not_modified(self, client):
+        response = client.get("/api/books/public/")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "public, no-cache"
+        
+        cached = client.get("/api/books/public/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+        assert cached.content == b""
+    
+    def test_author_write_should_change_book_etag(self, client):
+        etag = client.get("/api/books/public/").headers["ETag"]
+        
+        response = client.post("/api/authors/", json={"first_name": "Антон", "last_name": "Чехов"})
+        assert response.status_code == 201
+        
+        refreshed = client.get("/api/books/public/", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.headers["ETag"] != etag
+    
+    def test_batch_endpoints_should_report_per_item_results(self, client, auth_headers):
+        author = client.post("/api/authors/", json={"first_name": "Фёдор", "last_name": "Достоевский"}).json()
+        isbn = f"978-5-{uuid.uuid4().int % 10**8:08d}-1"
+        created = client.post("/api/books/batch-create", headers=auth_headers, json={"items": [
+            {"title": "Идиот", "isbn": isbn, "available_copies": 2, "author_id": author["id"]},
+            {"title": "Бесы", "isbn": isbn, "available_copies": 1, "author_id": author["id"]},
+        ]})
+        assert created.status_code == 200, created.text
+        assert created.json()["succeeded"] == 1
+        book_id = created.json()["results"][0]["id"]
+        
+        updated = client.post("/api/books/batch-update", headers=auth_headers, json={"items": [
+            {"id": book_id, "available_copies": 5},
+        ]})
+        assert updated.json()["results"] == [{"index": 0, "status": "updated", "id": book_id, "errors": []}]
+        
+        fetched = client.post("/api/books/batch-get", headers=auth_headers, json={"ids": [book_id], "isbns": ["missing-isbn"]})
+        assert [book["available_copies"] for book in fetched.json()["items"]] == [5]
+        assert fetched.json()["missing_isbns"] == ["missing-isbn"]
+    
+    def test_search_should_return_page_with_facets(self, client, auth_headers):
+        response = client.get("/api/books/search", headers=auth_headers,
+                              params={"q": "мир", "year_from": 1860, "year_to": 1869, "sort": "-year", "limit": 5})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["total"] == len(body["items"]) >= 1
+        assert all("мир" in b["title"].lower() for b in body["items"])
+        assert {"value": 1860, "label": None, "count": body["total"]} in body["facets"]["decades"]
+        assert body["facets"]["available"] + body["facets"]["unavailable"] == body["total"]
+        
+        invalid = client.get("/api/books/search", headers=auth_headers, params={"year_from": 1900, "year_to": 1800})
+        assert invalid.status_code == 400
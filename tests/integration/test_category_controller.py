@@ -0,0 +1,37 @@
+class TestCategoryController:
+    def test_category_crud_should_be_visible_to_books(self, client, auth_headers):
+        created = client.post("/api/categories/", json={"name": "Драматургия", "description": "Пьесы"})
+        assert created.status_code == 201, created.text
+        category = created.json()
+        assert client.post("/api/categories/", json={"name": "Драматургия"}).status_code == 400
+        assert category in client.get("/api/categories/").json()
+        
+        author = client.post("/api/authors/", json={"first_name": "Антон", "last_name": "Чехов"}).json()
+        book = client.post("/api/books/", headers=auth_headers, json={
+            "title": "Вишнёвый сад",
+            "isbn": f"978-5-01-{category['id']:06d}-1",
+            "available_copies": 1,
+            "author_id": author["id"],
+            "category_id": category["id"],
+        })
+        assert book.status_code == 201, book.text
+        assert book.json()["category_name"] == "Драматургия"
+        
+        renamed = client.put(f"/api/categories/{category['id']}", json={"name": "Пьесы"})
+        assert renamed.status_code == 200
+        fetched = client.get(f"/api/books/{book.json()['id']}", headers=auth_headers)
+        assert fetched.json()["category_name"] == "Пьесы"
+        
+        assert client.delete(f"/api/categories/{category['id']}").status_code == 204
+        assert client.get(f"/api/categories/{category['id']}").status_code == 404
+    
+    def test_create_book_with_unknown_category_should_return_bad_request(self, client, auth_headers):
+        author = client.post("/api/authors/", json={"first_name": "Иван", "last_name": "Бунин"}).json()
+        response = client.post("/api/books/", headers=auth_headers, json={
+            "title": "Тёмные аллеи",
+            "isbn": f"978-5-02-{author['id']:06d}-3",
+            "available_copies": 1,
+            "author_id": author["id"],
+            "category_id": 999999,
+        })
+        assert response.status_code == 400
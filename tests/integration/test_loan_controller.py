@@ -0,0 +1,62 @@
+import pytest
+
+from repositories.author_stats import counters_enabled
+
+
+class TestLoanController:
+    @pytest.fixture
+    def book_id(self, client, auth_headers):
+        author = client.post("/api/authors/", json={"first_name": "Антон", "last_name": "Чехов"}).json()
+        response = client.post("/api/books/", headers=auth_headers, json={
+            "title": "Каштанка",
+            "isbn": f"978-5-00-{author['id']:06d}-9",
+            "available_copies": 1,
+            "author_id": author["id"]
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+    
+    def test_checkout_and_return_should_track_available_copies(self, client, auth_headers, book_id):
+        response = client.post("/api/loans/checkout", json={"book_id": book_id}, headers=auth_headers)
+        assert response.status_code == 201, response.text
+        loan = response.json()
+        assert loan["status"] == "ACTIVE"
+        
+        second = client.post("/api/loans/checkout", json={"book_id": book_id}, headers=auth_headers)
+        assert second.status_code == 409
+        assert [item["id"] for item in client.get("/api/loans/me", headers=auth_headers).json()] == [loan["id"]]
+        
+        returned = client.post(f"/api/loans/{loan['id']}/return", headers=auth_headers)
+        assert returned.status_code == 200
+        assert returned.json()["status"] == "RETURNED"
+        assert client.post(f"/api/loans/{loan['id']}/return", headers=auth_headers).status_code == 409
+        assert client.get(f"/api/books/{book_id}", headers=auth_headers).json()["available_copies"] == 1
+    
+    def test_checkout_unknown_book_should_return_not_found(self, client, auth_headers):
+        response = client.post("/api/loans/checkout", json={"book_id": 999999}, headers=auth_headers)
+        assert response.status_code == 404
+    
+    def test_write_request_should_commit_once_without_reload(self, client, auth_headers, book_id):
+        from sqlalchemy import event
+        from config.database import engine
+        
+        statements, commits = [], []
+        record_statement = lambda *args: statements.append(args[2])
+        record_commit = lambda *args: commits.append(True)
+        event.listen(engine, "before_cursor_execute", record_statement)
+        event.listen(engine, "commit", record_commit)
+        try:
+            response = client.post("/api/loans/checkout", json={"book_id": book_id}, headers=auth_headers)
+            checkout_statements = [statement.split()[0] for statement in statements]
+            rejected = client.post("/api/loans/checkout", json={"book_id": book_id}, headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+            event.remove(engine, "commit", record_commit)
+        
+        assert response.status_code == 201
+        assert rejected.status_code == 409
+        # UPDATE остатка и INSERT займа без перечитывания; 409 откатывается, а не коммитится.
+        # Со счётчиками авторов к ним добавляется UPDATE строки автора
+        counter_updates = ["UPDATE"] if counters_enabled() else []
+        assert checkout_statements == ["UPDATE"] + counter_updates + ["INSERT"]
+        assert len(commits) == 1
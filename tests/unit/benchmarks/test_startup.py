@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from benchmarks.startup import run_startup
+
+
+class TestStartupTime:
+    # Настоящий замер (uvicorn в отдельном процессе) — `python cli.py startup-time`
+    def _run(self, first_response, budget, progress=None):
+        env = {"DATABASE_URL": "sqlite://"}
+        with patch("benchmarks.startup.measure_import", side_effect=[0.2, 0.4, 0.3]) as measure_import, \
+                patch("benchmarks.startup.measure_first_response", side_effect=first_response) as measure_first:
+            report = run_startup(runs=3, budget=budget, env=env, progress=progress)
+        assert [call.args for call in measure_import.call_args_list] == [(env,)] * 3
+        assert [call.args for call in measure_first.call_args_list] == [(env,)] * 3
+        return report
+    
+    def test_report_should_summarize_runs(self):
+        messages = []
+        report = self._run([1.0, 3.0, 2.0], budget=5, progress=messages.append)
+        
+        assert report == {
+            "runs": 3,
+            "import_median_s": 0.3,
+            "first_response_median_s": 2.0,
+            "first_response_max_s": 3.0,
+            "budget_s": 5,
+            "within_budget": True,
+        }
+        assert messages[1] == "run 2: import 0.400s, first response 3.000s"
+    
+    def test_worst_run_should_decide_budget(self):
+        assert self._run([1.0, 2.0, 2.0], budget=2)["within_budget"] is True
+        assert self._run([1.0, 5.1, 1.0], budget=5)["within_budget"] is False
@@ -0,0 +1,65 @@
+import copy
+import sqlite3
+
+import pytest
+
+from benchmarks.dataset import DatasetSpec, build_dataset
+from benchmarks.suite import compare, run_suite
+
+
+class TestBenchmarkSuite:
+    @pytest.fixture(scope="class")
+    def report(self, tmp_path_factory):
+        return run_suite(sizes=[200], repeat=1, patterns=["overdue", "search_by_name", "serialize"],
+                         data_dir=str(tmp_path_factory.mktemp("data")))
+    
+    def _dump(self, path):
+        connection = sqlite3.connect(path)
+        try:
+            return {table: connection.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall()
+                    for table in ("authors", "books", "users", "loans", "book_title_trigrams")}
+        finally:
+            connection.close()
+    
+    def test_same_seed_should_build_identical_dataset(self, tmp_path):
+        first = self._dump(build_dataset(DatasetSpec(books=200, seed=7), str(tmp_path / "a")))
+        second = self._dump(build_dataset(DatasetSpec(books=200, seed=7), str(tmp_path / "b")))
+        other = self._dump(build_dataset(DatasetSpec(books=200, seed=8), str(tmp_path / "c")))
+        
+        assert first == second
+        assert first["books"] != other["books"]
+        assert len(first["books"]) == 200
+        assert first["book_title_trigrams"]
+    
+    def test_report_should_record_time_statements_and_rows(self, report):
+        results = report["results"]["200"]
+        assert set(results) >= {"book_repository.find_overdue_books", "user_repository.search_by_name"}
+        overdue = results["book_repository.find_overdue_books"]
+        assert overdue["statements"] == 1
+        assert overdue["rows"] > 0
+        assert overdue["min_ms"] <= overdue["median_ms"] <= overdue["max_ms"]
+        assert report["datasets"]["200"]["rows"]["books"] == 200
+    
+    def test_serialize_cases_should_report_per_row_cost(self, report):
+        results = report["results"]["200"]
+        orm, rows = results["serialize.book_page[orm,json]"], results["serialize.book_page[rows,orjson]"]
+        assert orm["rows"] == rows["rows"] == 200
+        # Проекция — один SELECT с JOIN автора; категории берутся из справочника
+        assert rows["statements"] == 1
+        assert orm["per_row_us"] > 0 and rows["per_row_us"] > 0
+    
+    def test_compare_should_flag_extra_statements_and_slowdowns(self, report):
+        assert compare(report, report) == []
+        
+        slower = copy.deepcopy(report)
+        case = slower["results"]["200"]["book_repository.find_overdue_books"]
+        case["statements"] += 1
+        case["median_ms"] = case["median_ms"] * 2 + 10
+        regressions = compare(slower, report)
+        assert {(regression.case, regression.metric) for regression in regressions} == {
+            ("book_repository.find_overdue_books", "statements"),
+            ("book_repository.find_overdue_books", "median_ms"),
+        }
+        
+        missing = {"results": {"200": {}}}
+        assert compare(slower, missing) == []
@@ -0,0 +1,116 @@
+import time
+import pytest
+from datetime import date
+from unittest.mock import patch
+from sqlalchemy import event, update
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from config.categories import CategoryDirectory, get_category_directory, set_category_directory
+from config.database import Base, create_db_engine
+from models.author import Author
+from models.book import Book
+from models.category import Category
+from repositories.book_repository import BookRepository
+from repositories.category_repository import CategoryRepository
+from schemas.book_schema import BookResponse
+
+
+class TestCategoryDirectory:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'categories.db'}")
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+    
+    @pytest.fixture
+    def directory(self, engine):
+        previous = get_category_directory()
+        directory = CategoryDirectory(engine)
+        set_category_directory(directory)
+        yield directory
+        set_category_directory(previous)
+    
+    @pytest.fixture
+    def statements(self, engine):
+        executed = []
+    
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+        event.listen(engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(engine, "before_cursor_execute", record)
+    
+    def _library(self, engine):
+        session = sessionmaker(bind=engine, expire_on_commit=False)()
+        author = Author(first_name="Лев", last_name="Толстой")
+        poetry = Category(name="Поэзия")
+        session.add_all([author, poetry])
+        session.flush()
+        session.add(Book(title="Война и мир", isbn="978-5-17-123456-7", publication_date=date(1869, 1, 1),
+                         available_copies=5, author_id=author.id, category_id=poetry.id))
+        session.commit()
+        session.close()
+        return poetry
+    
+    def test_serialization_and_validation_should_not_query_categories(self, engine, directory, statements):
+        poetry = self._library(engine)
+        directory.load()
+        session = sessionmaker(bind=engine)()
+        book = session.query(Book).options(joinedload(Book.author)).one()
+        statements.clear()
+    
+        assert BookResponse.model_validate(book).category_name == "Поэзия"
+        assert CategoryRepository(session).find_existing_ids({poetry.id}) == {poetry.id}
+        assert statements == []
+    
+        # Неизвестный справочнику id проверяется по таблице
+        assert CategoryRepository(session).exists_by_id(poetry.id + 1) is False
+        assert len(statements) == 1
+        session.close()
+    
+    def test_book_rows_should_take_category_names_from_snapshot(self, engine, directory, statements):
+        self._library(engine)
+        directory.load()
+        session = sessionmaker(bind=engine)()
+        statements.clear()
+        
+        [row] = BookRepository(session).find_rows_page(limit=10).items
+        assert row.category_name == "Поэзия" and row.author.last_name == "Толстой"
+        assert len(statements) == 1 and "categories" not in statements[0]
+        session.close()
+    
+    def test_commit_should_refresh_snapshot(self, engine, directory):
+        poetry = self._library(engine)
+        directory.load()
+        session = sessionmaker(bind=engine)()
+        CategoryRepository(session).update(poetry.id, {"name": "Стихи"})
+        drama = CategoryRepository(session).save(Category(name="Драма"))
+        assert directory.current().by_id[poetry.id].name == "Поэзия"
+    
+        session.commit()
+        snapshot = directory.current()
+        assert snapshot.by_id[poetry.id].name == "Стихи"
+        assert snapshot.by_name["Драма"].id == drama.id
+        session.close()
+    
+    def test_other_database_should_not_be_served(self, engine, directory, tmp_path):
+        self._library(engine)
+        directory.load()
+        other = create_db_engine(f"sqlite:///{tmp_path / 'other.db'}")
+        session = sessionmaker(bind=other)()
+        assert directory.for_session(session) is None
+        assert directory.for_session(sessionmaker(bind=engine)()) is not None
+        session.close()
+        other.dispose()
+    
+    def test_expired_snapshot_should_reload_writes_that_skipped_versions(self, engine, directory):
+        poetry = self._library(engine)
+        directory.load()
+        # Правка мимо ORM и хранилища версий: версия categories не меняется
+        with engine.begin() as connection:
+            connection.execute(update(Category.__table__).values(name="Стихи"))
+        assert directory.current().by_id[poetry.id].name == "Поэзия"
+        
+        with patch("config.categories.time.monotonic", return_value=time.monotonic() + directory.ttl):
+            assert directory.current().by_id[poetry.id].name == "Стихи"
@@ -0,0 +1,122 @@
+import sqlite3
+from collections import Counter
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from config.data_generator import GenerationSpec, book_copies
+from config.data_loader import DataLoader
+from config.database import Base
+from models.loan import LoanStatus
+
+TABLES = ("categories", "authors", "books", "users", "loans", "book_title_trigrams")
+
+
+class _Interrupted(Exception):
+    pass
+
+
+class TestDataGenerator:
+    @pytest.fixture
+    def make_db(self, tmp_path):
+        engines = []
+        
+        def make_db(name):
+            engine = create_engine(f"sqlite:///{tmp_path / name}")
+            engines.append(engine)
+            Base.metadata.create_all(bind=engine)
+            return sessionmaker(bind=engine)(), str(tmp_path / name)
+        
+        yield make_db
+        for engine in engines:
+            engine.dispose()
+    
+    def _dump(self, path):
+        connection = sqlite3.connect(path)
+        try:
+            return {table: connection.execute(f"SELECT * FROM {table} ORDER BY 1, 2").fetchall() for table in TABLES}
+        finally:
+            connection.close()
+    
+    def test_interrupted_run_should_resume_to_identical_data(self, make_db):
+        spec = GenerationSpec(books=2500, seed=3)
+        full, full_path = make_db("full.db")
+        DataLoader(full).generate(spec, chunk_size=700)
+        
+        def interrupt(table, done, total):
+            if table == "books" and done >= 1400:
+                raise _Interrupted()
+        
+        resumed, resumed_path = make_db("resumed.db")
+        with pytest.raises(_Interrupted):
+            DataLoader(resumed).generate(spec, chunk_size=700, progress=interrupt)
+        inserted = DataLoader(resumed).generate(spec, chunk_size=300)
+        
+        assert inserted["books"] == 1100 and inserted["authors"] == 0
+        assert self._dump(resumed_path) == self._dump(full_path)
+    
+    def test_other_seed_should_not_touch_existing_data(self, make_db):
+        db, path = make_db("other.db")
+        DataLoader(db).generate(GenerationSpec(books=300, seed=1))
+        before = self._dump(path)
+        
+        with pytest.raises(ValueError, match="another seed"):
+            DataLoader(db).generate(GenerationSpec(books=600, seed=2))
+        with pytest.raises(ValueError, match="not empty"):
+            DataLoader(db).generate(GenerationSpec(books=300, seed=1), resume=False)
+        assert self._dump(path) == before
+    
+    def test_resume_with_other_loan_volume_should_be_rejected(self, make_db):
+        spec = GenerationSpec(books=2000, loans=600, seed=4)
+        
+        def interrupt(table, done, total):
+            if table == "users":
+                raise _Interrupted()
+        
+        db, path = make_db("volume.db")
+        with pytest.raises(_Interrupted):
+            DataLoader(db).generate(spec, chunk_size=500, progress=interrupt)
+        before = self._dump(path)
+        
+        # Книги уже записаны с available_copies под 600 займов
+        with pytest.raises(ValueError, match="another seed or volume"):
+            DataLoader(db).generate(GenerationSpec(books=2000, loans=900, seed=4), chunk_size=500)
+        assert self._dump(path) == before
+        DataLoader(db).generate(spec, chunk_size=500)
+    
+    def test_loans_should_follow_realistic_distributions(self, make_db):
+        spec = GenerationSpec(books=5000, loans=10000, seed=5)
+        db, path = make_db("loans.db")
+        DataLoader(db).generate(spec)
+        
+        from models.loan import Loan
+        loans = db.query(Loan).all()
+        statuses = Counter(loan.status for loan in loans)
+        assert statuses[LoanStatus.RETURNED] > 0.9 * len(loans)
+        assert statuses[LoanStatus.ACTIVE] > 0 and statuses[LoanStatus.OVERDUE] > 0
+        for loan in loans:
+            if loan.status is LoanStatus.RETURNED:
+                assert loan.loan_date < loan.return_date <= spec.as_of
+            else:
+                assert loan.return_date is None
+                assert (loan.due_date < spec.as_of) == (loan.status is LoanStatus.OVERDUE)
+        
+        # Спрос перекошен: на 1% самых популярных книг приходится заметная доля выдач
+        per_book = Counter(loan.book_id for loan in loans)
+        top = sum(count for _, count in per_book.most_common(spec.books // 100))
+        assert top > 0.15 * len(loans)
+    
+    def test_open_loans_should_hold_copies_of_their_books(self, make_db):
+        # Мало книг на много займов: популярные книги разобраны, выдачи уходят к соседним
+        spec = GenerationSpec(books=200, loans=3000, seed=9)
+        db, path = make_db("copies.db")
+        DataLoader(db).generate(spec, chunk_size=500)
+        
+        from models.book import Book
+        from models.loan import Loan
+        open_loans = Counter(book_id for (book_id,) in db.query(Loan.book_id).filter(Loan.return_date.is_(None)))
+        assert open_loans and any(book.available_copies == 0 for book in db.query(Book))
+        for book in db.query(Book):
+            assert book.available_copies >= 0
+            assert book.available_copies + open_loans[book.id] == book_copies(spec, book.id)
@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+from config import database
+from config.database import configure_async_engine, create_db_engine, get_pool_status
+from config.pool import InstrumentedQueuePool
+
+
+class TestEngineFactory:
+    @pytest.fixture
+    def file_engine(self, tmp_path):
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'library.db'}", pool_size=1, max_overflow=0, pool_timeout=0.05)
+        yield engine
+        engine.dispose()
+    
+    def test_memory_sqlite_should_share_single_connection(self):
+        engine = create_db_engine("sqlite://")
+        assert isinstance(engine.pool, StaticPool)
+        assert engine.echo is False
+    
+    def test_sqlite_pragmas_should_be_applied_on_connect(self, file_engine):
+        with file_engine.connect() as connection:
+            assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    
+    def test_pool_status_should_report_saturation_and_timeouts(self, file_engine):
+        assert isinstance(file_engine.pool, InstrumentedQueuePool)
+        
+        connection = file_engine.connect()
+        status = get_pool_status(file_engine)
+        assert status["checked_out"] == 1
+        assert status["saturation"] == 1.0
+        
+        with pytest.raises(PoolTimeoutError):
+            file_engine.connect()
+        connection.close()
+        
+        status = get_pool_status(file_engine)
+        assert status["checked_out"] == 0
+        assert status["checkouts"] == 1
+        assert status["timeouts"] == 1
+        assert status["wait_seconds_max"] >= 0.05
+    
+    @pytest.mark.asyncio
+    async def test_async_file_sqlite_should_use_queue_pool(self, tmp_path, monkeypatch):
+        # configure_async_engine подменяет глобальный движок — вернём прежний после теста
+        monkeypatch.setattr(database, "_async_engine", database._async_engine)
+        monkeypatch.setattr(database, "_AsyncSessionLocal", database._AsyncSessionLocal)
+        engine = configure_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'library.db'}", pool_size=2, max_overflow=0)
+        try:
+            assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+            assert engine.pool.size() == 2
+            async with engine.connect() as connection:
+                assert (await connection.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        finally:
+            await engine.dispose()
+    
+    def test_async_url_should_follow_database_url(self, monkeypatch):
+        monkeypatch.setattr(database, "ASYNC_DATABASE_URL", "")
+        monkeypatch.setattr(database, "DATABASE_URL", "mysql+pymysql://root:secret@db:3306/library_db?charset=utf8mb4")
+        url = database.async_database_url()
+        assert url.drivername == "mysql+aiomysql"
+        assert (url.host, url.database, url.query["charset"]) == ("db", "library_db", "utf8mb4")
+        
+        monkeypatch.setattr(database, "DATABASE_URL", "sqlite://")
+        with pytest.raises(RuntimeError, match="In-memory SQLite"):
+            database.async_database_url()
+        monkeypatch.setattr(database, "ASYNC_DATABASE_URL", "sqlite+aiosqlite:///library.db")
+        assert database.async_database_url().database == "library.db"
@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from config.metrics import HttpMetrics, render
+from config.readiness import check_database
+
+
+class _HangingEngine:
+    def connect(self):
+        time.sleep(0.5)
+        raise ConnectionError("unreachable")
+
+
+class TestHttpMetrics:
+    def test_histogram_should_count_cumulative_buckets(self):
+        metrics = HttpMetrics(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.5, 5.0):
+            metrics.started()
+            metrics.finished("GET", "/api/books/{book_id}", 200, seconds)
+
+        text = render(metrics.families())
+        labels = 'method="GET",route="/api/books/{book_id}"'
+        assert f'http_requests_total{{{labels},status="200"}} 3' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in text
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"http_request_duration_seconds_count{{{labels}}} 3" in text
+        assert "http_requests_in_flight 0" in text
+        assert "# TYPE http_request_duration_seconds histogram" in text
+
+    def test_metrics_endpoint_should_label_requests_by_route_template(self, client, auth_headers):
+        client.get("/api/books/1", headers=auth_headers)
+        client.get("/api/books/2", headers=auth_headers)
+
+        response = client.get("/metrics")
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'route="/api/books/{book_id}"' in response.text
+        assert 'route="/api/books/1"' not in response.text
+        assert "db_pool_checked_out" in response.text
+        assert 'cache_hit_ratio{cache="entity"}' in response.text
+
+
+class TestReadiness:
+    def test_should_report_reachable_database(self, client):
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["checks"]["database"]["status"] == "UP"
+
+    def test_should_time_out_and_not_pile_up_probes(self):
+        async def probe_twice():
+            first = await check_database(_HangingEngine(), timeout=0.05)
+            second = await check_database(_HangingEngine(), timeout=0.05)
+            return first, second
+
+        first, second = asyncio.run(probe_twice())
+        assert first == {"status": "DOWN", "error": "timed out after 0.05s"}
+        assert second["error"] == "previous check is still running"
+
+        time.sleep(0.6)
+        engine = create_engine("sqlite://")
+        assert asyncio.run(check_database(engine))["status"] == "UP"
@@ -0,0 +1,56 @@
+import pytest
+
+from config.passwords import PasswordHasher, HasherBusyError, context_settings, library_sha256
+
+
+class TestPasswordHasher:
+    @pytest.fixture
+    def hasher(self):
+        hasher = PasswordHasher(context_settings(bcrypt_rounds=4), workers=2, queue_size=4, queue_timeout=1)
+        yield hasher
+        hasher.shutdown()
+    
+    def test_hash_and_verify_should_run_in_worker_processes(self, hasher):
+        hashed = hasher.hash("secret")
+        assert hashed.startswith("$2b$04$")
+        assert hasher.verify("secret", hashed) is True
+        assert hasher.verify("wrong", hashed) is False
+        assert hasher._executor is not None
+    
+    def test_inline_mode_should_not_start_a_pool(self):
+        hasher = PasswordHasher(context_settings(bcrypt_rounds=4), workers=0)
+        assert hasher.verify("secret", hasher.hash("secret")) is True
+        assert hasher._executor is None
+    
+    @pytest.mark.parametrize("scheme", ["pbkdf2_sha256", "scrypt"])
+    def test_configured_scheme_should_be_used_for_new_hashes(self, scheme):
+        hasher = PasswordHasher(context_settings(scheme, pbkdf2_rounds=1000, scrypt_rounds=4), workers=0)
+        hashed = hasher.hash("secret")
+        assert hasher.context.identify(hashed) == scheme
+        assert hasher.verify("secret", hashed) is True
+    
+    def test_verify_and_update_should_rehash_old_scheme_and_cost(self, hasher):
+        cheap = PasswordHasher(context_settings(bcrypt_rounds=5), workers=0)
+        for old_hash in (library_sha256.hash("secret"), cheap.hash("secret")):
+            verified, new_hash = hasher.verify_and_update("secret", old_hash)
+            assert verified is True
+            assert new_hash.startswith("$2b$04$")
+            assert hasher.needs_update(new_hash) is False
+        
+        assert hasher.verify_and_update("wrong", library_sha256.hash("secret")) == (False, None)
+    
+    def test_full_queue_should_reject_with_busy_error(self, hasher):
+        hasher.queue_timeout = 0.01
+        for _ in range(hasher.queue_size):
+            hasher._slots.acquire()
+        try:
+            with pytest.raises(HasherBusyError):
+                hasher.hash("secret")
+            assert hasher.rejected == 1
+        finally:
+            for _ in range(hasher.queue_size):
+                hasher._slots.release()
+    
+    def test_unknown_scheme_should_raise_value_error(self):
+        with pytest.raises(ValueError):
+            context_settings("md5")
@@ -0,0 +1,159 @@
+import asyncio
+import time
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from config.database import Base, create_db_engine
+from config.revocation import RevocationList, run_revocation_refresher, set_revocation_list, get_revocation_list
+from models.user import User
+from models.user_revocation import UserRevocation
+
+
+class TestRevocationList:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'revocations.db'}")
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        engine.dispose()
+    
+    @pytest.fixture
+    def local(self, engine):
+        # Список «этого» воркера: в него попадают собственные коммиты
+        previous = get_revocation_list()
+        revocation_list = RevocationList(engine, ttl=60)
+        set_revocation_list(revocation_list)
+        yield revocation_list
+        set_revocation_list(previous)
+    
+    def _user(self, session, user_id):
+        user = User(id=user_id, email=f"user{user_id}@library.com", password="x", first_name="A", last_name="B")
+        session.add(user)
+        session.commit()
+        return user
+    
+    def test_commit_should_revoke_locally_and_reach_other_workers_on_refresh(self, engine, local):
+        other = RevocationList(engine, ttl=60)
+        other.refresh()
+        session = sessionmaker(bind=engine)()
+        user = self._user(session, 1)
+        issued_at = time.time()
+        
+        user.last_name = "C"
+        session.commit()
+        assert local.is_revoked(1, issued_at) is True
+        assert local.is_revoked(1, time.time()) is False
+        assert other.is_revoked(1, issued_at) is False
+        
+        other.refresh()
+        assert other.is_revoked(1, issued_at) is True
+        session.close()
+    
+    def test_rollback_and_unrelated_changes_should_not_revoke(self, engine, local):
+        session = sessionmaker(bind=engine)()
+        user = self._user(session, 2)
+        issued_at = time.time()
+        
+        user.first_name = "Changed"
+        session.flush()
+        session.rollback()
+        session.get(User, 2).created_at = None
+        session.commit()
+        
+        assert local.is_revoked(2, issued_at) is False
+        assert len(local) == 0
+        session.close()
+    
+    def test_deleted_user_should_be_revoked_for_tokens_issued_after_delete(self, engine, local):
+        session = sessionmaker(bind=engine)()
+        user = self._user(session, 3)
+        session.delete(user)
+        session.commit()
+        
+        # Токен мог выдать вход, прочитавший пользователя до удаления
+        issued_after = time.time() + 1
+        assert local.is_revoked(3, issued_after) is True
+        other = RevocationList(engine, ttl=60)
+        other.refresh()
+        assert other.is_revoked(3, issued_after) is True
+        session.close()
+    
+    def test_id_of_deleted_user_should_not_be_reused(self, engine, local):
+        session = sessionmaker(bind=engine)()
+        user = User(email="last@library.com", password="x", first_name="A", last_name="B")
+        session.add(user)
+        session.commit()
+        deleted_id = user.id
+        session.delete(user)
+        session.commit()
+        
+        user = User(email="next@library.com", password="x", first_name="A", last_name="B")
+        session.add(user)
+        session.commit()
+        assert user.id > deleted_id
+        assert local.is_revoked(user.id, time.time()) is False
+        session.close()
+    
+    def test_deleted_user_should_outlive_token_lifetime_cutoff(self, engine):
+        revocation_list = RevocationList(engine, ttl=60, token_lifetime=100)
+        now = time.time()
+        with engine.begin() as connection:
+            connection.execute(insert(UserRevocation.__table__), [
+                {"user_id": 1, "revoked_at": now - 150, "deleted": True},
+                {"user_id": 2, "revoked_at": now - 150, "deleted": False},
+                {"user_id": 3, "revoked_at": now - 250, "deleted": True},
+            ])
+        revocation_list.refresh()
+        
+        assert revocation_list.is_revoked(1, now) is True
+        assert revocation_list.is_revoked(2, now - 200) is False
+        assert revocation_list.is_revoked(3, now) is False
+    
+    def test_refresh_should_pick_up_rows_committed_out_of_order(self, engine):
+        revocation_list = RevocationList(engine, ttl=60, lookback=30)
+        now = time.time()
+        with engine.begin() as connection:
+            connection.execute(insert(UserRevocation.__table__).values(id=2, user_id=1, revoked_at=now))
+        revocation_list.refresh()
+        
+        # Меньший id и более ранний revoked_at: долгая транзакция закоммитилась позже
+        with engine.begin() as connection:
+            connection.execute(insert(UserRevocation.__table__).values(id=1, user_id=2, revoked_at=now - 10))
+        revocation_list.refresh()
+        assert revocation_list.is_revoked(2, now - 20) is True
+        assert revocation_list.is_revoked(1, now - 20) is True
+    
+    def test_is_revoked_should_not_query_database(self, engine):
+        revocation_list = RevocationList(engine, ttl=0)
+        revocation_list.add(1, time.time())
+        statements = []
+        record = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            assert revocation_list.is_revoked(1, time.time() - 60) is True
+            assert revocation_list.is_revoked(2, time.time() - 60) is False
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert statements == []
+    
+    @pytest.mark.asyncio
+    async def test_refresher_should_keep_last_snapshot_when_database_fails(self, engine, tmp_path):
+        broken = create_db_engine(f"sqlite:///{tmp_path / 'missing' / 'revocations.db'}")
+        revocation_list = RevocationList(broken, ttl=0.01)
+        issued_at = time.time() - 60
+        revocation_list.add(1, time.time())
+        
+        refresher = asyncio.create_task(run_revocation_refresher(revocation_list))
+        await asyncio.sleep(0.1)
+        assert not refresher.done()
+        assert revocation_list.is_revoked(1, issued_at) is True
+        
+        # БД вернулась — следующий проход дочитывает журнал
+        with engine.begin() as connection:
+            connection.execute(insert(UserRevocation.__table__).values(user_id=2, revoked_at=time.time()))
+        revocation_list._engine = engine
+        await asyncio.sleep(0.1)
+        refresher.cancel()
+        assert revocation_list.is_revoked(2, issued_at) is True
+        broken.dispose()
@@ -0,0 +1,109 @@
+import pytest
+from datetime import date
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models.author import Author
+from models.book import Book
+from config.database import Base
+from config.sql_timing import _after_cursor_execute, add_sql_timing, uninstall
+from repositories.book_repository import BookRepository
+
+
+class TestSqlTiming:
+    @pytest.fixture
+    def session_factory(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        db = factory()
+        db.add_all([Author(first_name="Лев", last_name="Толстой"), Author(first_name="Антон", last_name="Чехов")])
+        db.commit()
+        db.close()
+        yield factory
+        Base.metadata.drop_all(bind=engine)
+
+    def _app(self, session_factory, **options) -> FastAPI:
+        app = FastAPI()
+
+        def get_session():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        @app.get("/authors")
+        def list_authors(db=Depends(get_session)):
+            return [author.last_name for author in db.query(Author).order_by(Author.id)]
+
+        @app.get("/books")
+        def list_books(db=Depends(get_session)):
+            return [row.title for row in BookRepository(db).find_rows_page(limit=10).items]
+
+        @app.post("/authors")
+        def create_author(db=Depends(get_session)):
+            db.add(Author(first_name="Иван", last_name="Бунин"))
+            db.commit()
+            return {"created": True}
+
+        add_sql_timing(app, Base, **options)
+        return app
+
+    @pytest.fixture
+    def instrumented(self, session_factory):
+        app = self._app(session_factory, enabled=True, debug=False)
+        yield app
+        uninstall(Base)
+
+    def test_response_should_carry_statements_time_and_rows(self, instrumented):
+        response = TestClient(instrumented).get("/authors")
+
+        assert response.json() == ["Толстой", "Чехов"]
+        timing = response.headers["server-timing"]
+        assert 'desc="1 statements"' in timing
+        assert 'db-rows;desc="2"' in timing
+        assert "app;dur=" in timing
+
+    def test_projection_rows_should_be_counted(self, session_factory, instrumented):
+        db = session_factory()
+        db.add_all([Book(title=f"Книга {i}", isbn=f"isbn-{i}", publication_date=date(1900, 1, 1),
+                         available_copies=1, author_id=1) for i in range(3)])
+        db.commit()
+        db.close()
+
+        response = TestClient(instrumented).get("/books")
+        assert len(response.json()) == 3
+        assert 'db-rows;desc="3"' in response.headers["server-timing"]
+
+    def test_debug_payload_should_list_statements(self, session_factory):
+        app = self._app(session_factory, enabled=True, debug=True)
+        try:
+            response = TestClient(app).post("/authors", headers={"X-Debug-SQL": "1"})
+        finally:
+            uninstall(Base)
+
+        body = response.json()
+        assert body["data"] == {"created": True}
+        sql = body["debug"]["sql"]
+        assert sql["statements"] == 1
+        assert sql["affected"] == 1
+        assert sql["log"][0]["sql"].startswith("INSERT INTO authors")
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    def test_debug_payload_should_require_opt_in(self, instrumented):
+        response = TestClient(instrumented).get("/authors", headers={"X-Debug-SQL": "1"})
+        assert response.json() == ["Толстой", "Чехов"]
+        assert "server-timing" in response.headers
+
+    def test_disabled_should_not_hook_engines(self, session_factory):
+        app = self._app(session_factory, enabled=False)
+
+        response = TestClient(app).get("/authors")
+        assert "server-timing" not in response.headers
+        assert app.user_middleware == []
+        assert not event.contains(Engine, "after_cursor_execute", _after_cursor_execute)
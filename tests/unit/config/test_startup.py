@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from config.database import Base
+from config.migrations import SCHEMA_REVISION, downgrade, head_revision, upgrade
+from config.startup import SchemaVersionError, check_schema_version, prepare_database
+from models.book import Book
+
+
+class TestStartup:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'startup.db'}")
+        yield engine
+        engine.dispose()
+    
+    def test_schema_revision_should_match_migration_head(self):
+        assert SCHEMA_REVISION == head_revision()
+    
+    def test_check_should_accept_only_current_revision(self, engine):
+        with pytest.raises(SchemaVersionError, match="not migrated"):
+            check_schema_version(engine)
+        
+        upgrade(engine)
+        assert check_schema_version(engine) == SCHEMA_REVISION
+        
+        downgrade(engine, "0003")
+        with pytest.raises(SchemaVersionError, match="revision 0003"):
+            check_schema_version(engine)
+    
+    def test_check_mode_should_not_touch_schema(self, engine):
+        with pytest.raises(SchemaVersionError):
+            prepare_database(engine, Base.metadata, sessionmaker(bind=engine), mode="check", seed=False)
+        assert inspect(engine).get_table_names() == []
+    
+    def test_seed_should_commit_once_and_only_into_empty_database(self, engine):
+        session_factory = sessionmaker(bind=engine)
+        prepare_database(engine, Base.metadata, session_factory, mode="create", seed=False)
+        commits = []
+        event.listen(engine, "commit", lambda connection: commits.append(connection))
+        
+        timings = prepare_database(engine, Base.metadata, session_factory, mode="off", seed=True)
+        prepare_database(engine, Base.metadata, session_factory, mode="off", seed=True)
+        
+        assert set(timings) == {"schema", "seed"}
+        assert len(commits) == 1
+        with session_factory() as db:
+            assert db.query(Book).count() == 2
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.user import User
+from repositories.author_repository import AuthorRepository
+from repositories.user_repository import UserRepository
+from config.database import Base
+from config.unit_of_work import begin_request, end_request, track_request_session, unit_of_work
+
+
+class TestUnitOfWork:
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        Base.metadata.drop_all(bind=engine)
+
+    @pytest.fixture
+    def session_factory(self, engine):
+        return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+    def _record(self, engine):
+        statements, commits = [], []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        event.listen(engine, "commit", lambda *args: commits.append(True))
+        return statements, commits
+
+    def test_block_should_commit_all_writes_once(self, engine, session_factory):
+        statements, commits = self._record(engine)
+        session = session_factory()
+        with unit_of_work(session):
+            repository = AuthorRepository(session)
+            first = repository.save(Author(first_name="Лев", last_name="Толстой"))
+            repository.save(Author(first_name="Антон", last_name="Чехов"))
+            first.last_name = "Толстой-мл."
+
+        assert len(commits) == 1
+        assert [statement.split()[0] for statement in statements] == ["INSERT", "INSERT", "UPDATE"]
+        assert session_factory().get(Author, first.id).last_name == "Толстой-мл."
+
+    def test_exception_should_roll_back_block(self, session_factory):
+        session = session_factory()
+        with pytest.raises(RuntimeError):
+            with unit_of_work(session):
+                AuthorRepository(session).save(Author(first_name="Лев", last_name="Толстой"))
+                raise RuntimeError("boom")
+        assert session_factory().query(Author).count() == 0
+
+    def test_server_default_should_come_back_without_select(self, engine, session_factory):
+        statements, _ = self._record(engine)
+        session = session_factory()
+        with unit_of_work(session):
+            user = UserRepository(session).save(User(
+                email="reader@library.com", password="x", first_name="Test", last_name="User"
+            ))
+
+        assert user.created_at is not None
+        assert len(statements) == 1
+        assert "RETURNING" in statements[0]
+
+    def test_request_should_collect_its_sessions(self, session_factory):
+        assert track_request_session(session_factory()) is False
+        token = begin_request()
+        session = session_factory()
+        assert track_request_session(session) is True
+        assert end_request(token) == [session]
+        assert track_request_session(session_factory()) is False
@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from config.database import Base
+from config.versions import MemoryVersionStore, DatabaseVersionStore, mark_changed
+
+
+class TestEntityVersions:
+    @pytest.fixture
+    def engine(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        Base.metadata.drop_all(bind=engine)
+    
+    @pytest.fixture
+    def store(self):
+        store = MemoryVersionStore()
+        with patch("config.versions.get_version_store", return_value=store):
+            yield store
+    
+    def test_commit_should_bump_version_of_written_entity(self, engine, store):
+        session = sessionmaker(bind=engine)()
+        before = store.get("authors")
+        
+        session.add(Author(first_name="Лев", last_name="Толстой"))
+        session.flush()
+        assert store.get("authors") == before
+        
+        session.commit()
+        assert store.get("authors") != before
+        assert store.get("books") == f"{store.epoch}.0"
+    
+    def test_rollback_should_not_bump_version(self, engine, store):
+        session = sessionmaker(bind=engine)()
+        session.add(Author(first_name="Лев", last_name="Толстой"))
+        session.flush()
+        session.rollback()
+        assert store.get("authors") == f"{store.epoch}.0"
+    
+    def test_mark_changed_should_bump_on_commit(self, engine, store):
+        session = sessionmaker(bind=engine)()
+        mark_changed(session, "books")
+        session.commit()
+        assert store.get("books") == f"{store.epoch}.1"
+    
+    def test_database_store_should_share_versions_between_instances(self, engine):
+        writer = DatabaseVersionStore(engine, ttl=0)
+        reader = DatabaseVersionStore(engine, ttl=0)
+        assert reader.get("books") == "0"
+        writer.bump("books")
+        writer.bump("books")
+        assert reader.get("books") == "2"
+    
+    def test_database_store_should_ignore_writes_to_other_databases(self, engine):
+        store = DatabaseVersionStore(engine, ttl=0)
+        other = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=other)
+        with patch("config.versions.get_version_store", return_value=store):
+            session = sessionmaker(bind=other)()
+            session.add(Author(first_name="Лев", last_name="Толстой"))
+            session.commit()
+            assert store.get("authors") == "0"
+            
+            session = sessionmaker(bind=engine)()
+            session.add(Author(first_name="Антон", last_name="Чехов"))
+            session.commit()
+            assert store.get("authors") == "1"
+        other.dispose()
@@ -0,0 +1,83 @@
+import pytest
+import pytest_asyncio
+from datetime import date
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from models.book import Book
+from models.author import Author
+from models.category import Category
+from repositories.async_book_repository import AsyncBookRepository
+from repositories.async_author_repository import AsyncAuthorRepository
+from schemas.book_schema import BookResponse
+from config.database import Base
+
+
+class TestAsyncBookRepository:
+    @pytest_asyncio.fixture
+    async def db_session(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        
+        TestingSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        async with TestingSessionLocal() as session:
+            yield session
+        await engine.dispose()
+    
+    @pytest_asyncio.fixture
+    async def sample_data(self, db_session):
+        author = Author(first_name="Лев", last_name="Толстой")
+        category = Category(name="Художественная литература")
+        db_session.add_all([author, category])
+        await db_session.flush()
+        
+        book = Book(
+            title="Война и мир",
+            isbn="978-5-17-123456-7",
+            publication_date=date(1869, 1, 1),
+            available_copies=5,
+            author_id=author.id,
+            category_id=category.id
+        )
+        db_session.add(book)
+        await db_session.commit()
+        db_session.expunge_all()
+        return {"author_id": author.id, "category_id": category.id, "book_id": book.id}
+    
+    @pytest.mark.asyncio
+    async def test_find_page_should_return_serializable_books(self, db_session, sample_data):
+        page = await AsyncBookRepository(db_session).find_page(limit=10)
+        assert page.next_cursor is None
+        response = BookResponse.model_validate(page.items[0])
+        assert response.author.last_name == "Толстой"
+        assert response.category_name == "Художественная литература"
+    
+    @pytest.mark.asyncio
+    async def test_find_by_title_containing_should_return_matching_books(self, db_session, sample_data):
+        books = await AsyncBookRepository(db_session).find_by_title_containing("ойна")
+        assert [book.title for book in books] == ["Война и мир"]
+    
+    @pytest.mark.asyncio
+    async def test_save_and_update_should_return_loaded_book(self, db_session, sample_data):
+        repository = AsyncBookRepository(db_session)
+        book = await repository.save(Book(
+            title="Анна Каренина",
+            isbn="978-5-17-123458-1",
+            available_copies=2,
+            author_id=sample_data["author_id"]
+        ))
+        assert book.id is not None
+        assert book.author.last_name == "Толстой"
+        
+        updated = await repository.update(book.id, {"available_copies": 7, "category_id": sample_data["category_id"]})
+        assert updated.available_copies == 7
+        assert updated.category_name == "Художественная литература"
+    
+    @pytest.mark.asyncio
+    async def test_delete_author_should_cascade_to_books(self, db_session, sample_data):
+        assert await AsyncAuthorRepository(db_session).delete_by_id(sample_data["author_id"]) is True
+        assert await AsyncBookRepository(db_session).find_by_id(sample_data["book_id"]) is None
+    
+    def test_lazy_strategy_should_be_rejected(self):
+        with pytest.raises(ValueError):
+            AsyncBookRepository(None, None)
@@ -0,0 +1,95 @@
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from config.database import Base
+from models.author import Author
+from models.book import Book
+from models.user import User
+from repositories import author_stats
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.loan_repository import LoanRepository
+from repositories.user_repository import UserRepository
+
+NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def counters():
+    author_stats.install()
+    yield
+    author_stats.uninstall()
+
+
+def _library(db):
+    authors = [Author(first_name="Лев", last_name="Толстой"), Author(first_name="Антон", last_name="Чехов"),
+               Author(first_name="Иван", last_name="Бунин")]
+    db.add_all(authors)
+    db.flush()
+    books = [
+        Book(title="Война и мир", isbn="isbn-1", publication_date=date(1869, 1, 1), available_copies=3, author_id=authors[0].id),
+        Book(title="Анна Каренина", isbn="isbn-2", publication_date=date(1877, 1, 1), available_copies=1, author_id=authors[0].id),
+        Book(title="Чайка", isbn="isbn-3", publication_date=date(1896, 1, 1), available_copies=2, author_id=authors[1].id),
+    ]
+    user = User(email="reader@library.test", password="!", first_name="Читатель", last_name="Первый")
+    db.add_all(books + [user])
+    db.flush()
+    return authors, books, user
+
+
+def _stats(db):
+    return {row.id: (row.book_count, row.available_copies, row.active_loans)
+            for row in AuthorRepository(db).find_stats_page(100).items}
+
+
+def _counters(db):
+    rows = db.execute(select(Author.id, Author.book_count, Author.available_copies, Author.open_loan_count)).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def test_find_stats_page_should_group_books_and_open_loans_per_author(db_session):
+    authors, books, user = _library(db_session)
+    loans = LoanRepository(db_session)
+    loans.checkout(books[0].id, user.id, NOW, NOW + timedelta(days=14))
+    returned = loans.checkout(books[2].id, user.id, NOW, NOW + timedelta(days=14))
+    loans.close(returned, NOW + timedelta(days=3))
+
+    assert _stats(db_session) == {authors[0].id: (2, 3, 1), authors[1].id: (1, 2, 0), authors[2].id: (0, 0, 0)}
+
+    first = AuthorRepository(db_session).find_stats_page(2)
+    assert [row.id for row in first.items] == [authors[0].id, authors[1].id]
+    second = AuthorRepository(db_session).find_stats_page(2, first.next_cursor)
+    assert [row.id for row in second.items] == [authors[2].id] and second.next_cursor is None
+
+
+def test_counters_should_follow_book_and_loan_writes(db_session, counters):
+    authors, books, user = _library(db_session)
+    book_repository, loans = BookRepository(db_session), LoanRepository(db_session)
+
+    book_repository.update(books[1].id, {"author_id": authors[2].id, "available_copies": 4})
+    book_repository.bulk_insert([{"title": "Вишнёвый сад", "isbn": "isbn-4", "publication_date": date(1904, 1, 1),
+                                  "available_copies": 5, "author_id": authors[1].id, "category_id": None}])
+    loan = loans.checkout(books[0].id, user.id, NOW, NOW + timedelta(days=14))
+    loans.checkout(books[2].id, user.id, NOW, NOW + timedelta(days=14))
+    loans.close(loan, NOW + timedelta(days=2))
+    book_repository.delete_by_id(books[1].id)
+    UserRepository(db_session).delete_by_id(user.id)
+    db_session.expire_all()
+
+    maintained = _counters(db_session)
+    assert maintained == {authors[0].id: (1, 3, 0), authors[1].id: (2, 6, 0), authors[2].id: (0, 0, 0)}
+    assert AuthorRepository(db_session).rebuild_stats() == 3
+    assert _counters(db_session) == maintained
+    assert _stats(db_session) == maintained
@@ -1,12 +1,14 @@
 import pytest
 from datetime import date
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from models.book import Book
 from models.author import Author
 from models.category import Category
 from repositories.book_repository import BookRepository
+from repositories.loading import SELECTIN, JOINED
+from schemas.book_schema import BookResponse
 from config.database import Base
 
 
@@ -80,4 +82,186 @@ class TestBookRepository:
         books = book_repository.find_by_title_containing("Несуществующая книга")
         
         # Then
-        assert len(books) == 0
\ No newline at end of file
+        assert len(books) == 0
+    
+    def test_find_page_should_return_next_cursor_until_last_page(self, book_repository, sample_data, db_session):
+        for i in range(4):
+            db_session.add(Book(
+                title=f"Том {i}",
+                isbn=f"978-5-17-00000{i}-0",
+                available_copies=1,
+                author_id=sample_data["author"].id
+            ))
+        db_session.commit()
+        
+        first = book_repository.find_page(limit=2)
+        assert [b.id for b in first.items] == sorted(b.id for b in first.items)
+        assert len(first.items) == 2
+        assert first.next_cursor is not None
+        
+        second = book_repository.find_page(limit=2, cursor=first.next_cursor)
+        third = book_repository.find_page(limit=2, cursor=second.next_cursor)
+        assert len(third.items) == 1
+        assert third.next_cursor is None
+        
+        ids = [b.id for b in first.items + second.items + third.items]
+        assert ids == sorted(set(ids))
+        assert len(ids) == 5
+    
+    def test_find_page_with_offset_should_skip_rows(self, book_repository, sample_data):
+        page = book_repository.find_page(limit=10, offset=1)
+        assert page.items == []
+        assert page.next_cursor is None
+    
+    def test_find_page_with_invalid_cursor_should_raise_value_error(self, book_repository, sample_data):
+        with pytest.raises(ValueError):
+            book_repository.find_page(limit=10, cursor="not-a-cursor")
+
+    
+    def _add_books(self, db_session, count, start=0):
+        for i in range(start, start + count):
+            author = Author(first_name="Автор", last_name=f"Номер {i}")
+            category = Category(name=f"Категория {i}")
+            db_session.add_all([author, category])
+            db_session.flush()
+            db_session.add(Book(
+                title=f"Книга {i}",
+                isbn=f"978-5-00-{i:06d}-1",
+                available_copies=1,
+                author_id=author.id,
+                category_id=category.id
+            ))
+        db_session.commit()
+        db_session.expunge_all()
+    
+    def _count_list_statements(self, db_session, strategy):
+        statements = []
+        engine = db_session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            books = BookRepository(db_session, strategy).find_page(limit=100).items
+            [BookResponse.model_validate(book) for book in books]
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        return len(statements)
+    
+    @pytest.mark.parametrize("strategy, expected", [(SELECTIN, 3), (JOINED, 1)])
+    def test_list_serialization_statement_count_should_not_depend_on_rows(self, db_session, strategy, expected):
+        self._add_books(db_session, 2)
+        assert self._count_list_statements(db_session, strategy) == expected
+        
+        self._add_books(db_session, 20, start=2)
+        assert self._count_list_statements(db_session, strategy) == expected
+    
+    def test_lazy_loading_should_issue_query_per_relationship(self, db_session):
+        self._add_books(db_session, 3)
+        assert self._count_list_statements(db_session, None) == 1 + 2 * 3
+    
+    def test_find_rows_page_should_serialize_like_orm_books_in_one_statement(self, db_session):
+        self._add_books(db_session, 3)
+        db_session.add(Book(title="Без категории", isbn="978-5-00-999999-1", available_copies=0, author_id=1))
+        db_session.commit()
+        expected = [BookResponse.model_validate(book).model_dump()
+                    for book in BookRepository(db_session, JOINED).find_page(limit=100).items]
+        db_session.expunge_all()
+        
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+        try:
+            first = BookRepository(db_session).find_rows_page(limit=2)
+            second = BookRepository(db_session).find_rows_page(limit=2, cursor=first.next_cursor)
+            rows = [BookResponse.model_validate(row).model_dump() for row in first.items + second.items]
+        finally:
+            event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+        
+        assert rows == expected
+        assert second.next_cursor is None
+        assert len(statements) == 2
+        assert db_session.identity_map.keys() == set()
+    
+    def test_unknown_loading_strategy_should_raise_value_error(self, db_session):
+        with pytest.raises(ValueError):
+            BookRepository(db_session, "eager")
+    
+    def test_search_by_title_should_rank_exact_word_matches_first(self, book_repository, sample_data, db_session):
+        for title, isbn in [("Война миров", "978-5-17-000001-1"), ("Повесть о войне", "978-5-17-000002-2"), ("Мир", "978-5-17-000003-3")]:
+            db_session.add(Book(title=title, isbn=isbn, available_copies=1, author_id=sample_data["author"].id))
+        db_session.commit()
+        
+        titles = [b.title for b in book_repository.search_by_title("война")]
+        assert titles == ["Война и мир", "Война миров", "Повесть о войне"]
+        assert len(book_repository.search_by_title("война", limit=1)) == 1
+    
+    def test_search_by_title_should_ignore_case_and_yo(self, book_repository, sample_data, db_session):
+        db_session.add(Book(title="Ёжик в тумане", isbn="978-5-17-000004-4", available_copies=1, author_id=sample_data["author"].id))
+        db_session.commit()
+        assert [b.title for b in book_repository.search_by_title("ежик")] == ["Ёжик в тумане"]
+    
+    def test_search_index_should_follow_title_updates_and_deletes(self, book_repository, sample_data):
+        book_id = sample_data["book"].id
+        book_repository.update(book_id, {"title": "Анна Каренина"})
+        assert book_repository.search_by_title("война") == []
+        assert [b.id for b in book_repository.search_by_title("каренина")] == [book_id]
+        
+        book_repository.delete_by_id(book_id)
+        assert book_repository.search_by_title("каренина") == []
+    
+    def test_rebuild_title_index_should_restore_missing_entries(self, book_repository, sample_data, db_session):
+        from models.book_title_trigram import BookTitleTrigram
+        db_session.query(BookTitleTrigram).delete()
+        db_session.commit()
+        assert book_repository.search_by_title("война") == []
+        
+        assert book_repository.rebuild_title_index() == 1
+        assert len(book_repository.search_by_title("война")) == 1
+    
+    def test_find_overdue_page_should_return_each_book_once(self, book_repository, sample_data, db_session):
+        from datetime import datetime, timedelta
+        from models.loan import Loan, LoanStatus
+        from models.user import User
+        book = sample_data["book"]
+        other = Book(title="Анна Каренина", isbn="978-5-17-000000-1", available_copies=1,
+                     author_id=sample_data["author"].id)
+        user = User(email="reader@library.com", password="x", first_name="Reader", last_name="One")
+        db_session.add_all([other, user])
+        db_session.commit()
+        now = datetime.utcnow()
+        db_session.add_all([
+            Loan(book_id=book.id, user_id=user.id, loan_date=now, due_date=now - timedelta(days=2), status=LoanStatus.OVERDUE),
+            Loan(book_id=book.id, user_id=user.id, loan_date=now, due_date=now - timedelta(days=1), status=LoanStatus.ACTIVE),
+            Loan(book_id=other.id, user_id=user.id, loan_date=now, due_date=now + timedelta(days=7), status=LoanStatus.ACTIVE),
+        ])
+        db_session.commit()
+        
+        page = book_repository.find_overdue_page(limit=10)
+        assert [b.id for b in page.items] == [book.id]
+        assert page.next_cursor is None
+    
+    def test_search_facets_should_ignore_own_filter_and_keep_others(self, book_repository, sample_data, db_session):
+        from repositories.book_search import BookSearchCriteria
+        author = sample_data["author"]
+        poetry = Category(name="Поэзия")
+        db_session.add(poetry)
+        db_session.commit()
+        db_session.add_all([
+            Book(title="Анна Каренина", isbn="978-5-17-000000-1", publication_date=date(1877, 1, 1),
+                 available_copies=0, author_id=author.id, category_id=sample_data["category"].id),
+            Book(title="Хаджи-Мурат", isbn="978-5-17-000000-2", publication_date=date(1912, 1, 1),
+                 available_copies=2, author_id=author.id, category_id=sample_data["category"].id),
+            Book(title="Стихотворения", isbn="978-5-17-000000-3", publication_date=date(1850, 1, 1),
+                 available_copies=2, author_id=author.id, category_id=poetry.id),
+        ])
+        db_session.commit()
+        criteria = BookSearchCriteria(category_ids=[sample_data["category"].id], year_to=1899)
+        
+        books = book_repository.search(criteria, sort="-year")
+        facets = book_repository.search_facets(criteria)
+        
+        assert [b.title for b in books] == ["Анна Каренина", "Война и мир"]
+        assert facets["total"][0]["count"] == 2
+        assert [(f["label"], f["count"]) for f in facets["category"]] == [("Художественная литература", 2), ("Поэзия", 1)]
+        assert [(f["value"], f["count"]) for f in facets["decade"]] == [(1860, 1), (1870, 1), (1910, 1)]
+        assert [(f["value"], f["count"]) for f in facets["availability"]] == [(0, 1), (1, 1)]
+        assert facets["author"] == [{"value": author.id, "label": "Лев Толстой", "count": 2}]
@@ -0,0 +1,201 @@
+import pytest
+import pytest_asyncio
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.user import User
+from repositories.async_author_repository import AsyncAuthorRepository
+from repositories.async_user_repository import AsyncUserRepository
+from repositories.author_repository import AuthorRepository
+from repositories.user_repository import UserRepository
+from config.cache import LRUCache
+from config.database import Base
+from config.unit_of_work import unit_of_work
+
+
+class TestLRUCache:
+    def test_should_evict_least_recently_used_entry(self):
+        cache = LRUCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+    
+    def test_should_expire_entries_after_ttl(self):
+        cache = LRUCache(maxsize=10, ttl=5)
+        with patch("config.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("config.cache.time.monotonic", return_value=106.0):
+            assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 1
+
+
+class TestRepositoryEntityCache:
+    @pytest.fixture
+    def cache(self):
+        cache = LRUCache(maxsize=100, ttl=60)
+        with patch("repositories.entity_cache.get_entity_cache", return_value=cache):
+            yield cache
+    
+    @pytest.fixture(scope="function")
+    def session_factory(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        yield sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+        Base.metadata.drop_all(bind=engine)
+    
+    def _count_statements(self, session, action):
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(session.get_bind(), "before_cursor_execute", listener)
+        try:
+            result = action()
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", listener)
+        return result, len(statements)
+    
+    def _write(self, session_factory, repository, action):
+        session = session_factory()
+        with unit_of_work(session):
+            return action(repository(session))
+    
+    def test_find_by_id_hit_should_not_query_database(self, cache, session_factory):
+        author_id = self._write(session_factory, AuthorRepository,
+                                lambda repository: repository.save(Author(first_name="Лев", last_name="Толстой"))).id
+        AuthorRepository(session_factory()).find_by_id(author_id)
+        
+        session = session_factory()
+        author, statements = self._count_statements(session, lambda: AuthorRepository(session).find_by_id(author_id))
+        assert statements == 0
+        assert author.last_name == "Толстой"
+        assert cache.stats()["hits"] == 1
+    
+    def test_update_should_invalidate_cached_entry(self, cache, session_factory):
+        author_id = self._write(session_factory, AuthorRepository,
+                                lambda repository: repository.save(Author(first_name="Лев", last_name="Толстой"))).id
+        AuthorRepository(session_factory()).find_by_id(author_id)
+        self._write(session_factory, AuthorRepository, lambda repository: repository.update(author_id, {"last_name": "Толстой-мл."}))
+        
+        author = AuthorRepository(session_factory()).find_by_id(author_id)
+        assert author.last_name == "Толстой-мл."
+    
+    def test_user_email_change_should_invalidate_both_keys(self, cache, session_factory):
+        user = self._write(session_factory, UserRepository, lambda repository: repository.save(User(
+            email="old@library.com", password="x", first_name="Test", last_name="User"
+        )))
+        UserRepository(session_factory()).find_by_email("old@library.com")
+        self._write(session_factory, UserRepository, lambda repository: repository.update(user.id, {"email": "new@library.com"}))
+        
+        assert UserRepository(session_factory()).find_by_email("old@library.com") is None
+        assert UserRepository(session_factory()).find_by_id(user.id).email == "new@library.com"
+    
+    def test_delete_should_invalidate_cached_entry(self, cache, session_factory):
+        author_id = self._write(session_factory, AuthorRepository,
+                                lambda repository: repository.save(Author(first_name="Лев", last_name="Толстой"))).id
+        AuthorRepository(session_factory()).find_by_id(author_id)
+        assert self._write(session_factory, AuthorRepository, lambda repository: repository.delete_by_id(author_id)) is True
+        assert AuthorRepository(session_factory()).find_by_id(author_id) is None
+    
+    def test_commit_should_drop_entry_cached_before_it(self, cache, session_factory):
+        author_id = self._write(session_factory, AuthorRepository,
+                                lambda repository: repository.save(Author(first_name="Лев", last_name="Толстой"))).id
+        writer = session_factory()
+        AuthorRepository(writer).update(author_id, {"last_name": "Толстой-мл."})
+        # Пока транзакция не закоммичена, другой запрос успевает закэшировать старую строку
+        cache.set(("Author", "id", author_id), {"id": author_id, "first_name": "Лев", "last_name": "Толстой"})
+        writer.commit()
+        
+        assert AuthorRepository(session_factory()).find_by_id(author_id).last_name == "Толстой-мл."
+
+    
+    def test_password_hash_should_not_be_cached(self, cache, session_factory):
+        user = self._write(session_factory, UserRepository, lambda repository: repository.save(User(
+            email="reader@library.com", password="hash", first_name="Test", last_name="User"
+        )))
+        UserRepository(session_factory()).find_by_email("reader@library.com")
+        assert "password" not in cache.get(("User", "email", "reader@library.com"))
+        
+        # Восстановленный из кэша экземпляр дочитывает хеш из БД
+        session = session_factory()
+        cached, statements = self._count_statements(session, lambda: UserRepository(session).find_by_id(user.id))
+        assert statements == 0
+        assert cached.password == "hash"
+    
+    def test_rollback_should_drop_entry_cached_during_transaction(self, cache, session_factory):
+        author_id = self._write(session_factory, AuthorRepository,
+                                lambda repository: repository.save(Author(first_name="Лев", last_name="Толстой"))).id
+        writer = session_factory()
+        AuthorRepository(writer).update(author_id, {"last_name": "Толстой-мл."})
+        # Чтение внутри той же транзакции кэширует незакоммиченное значение
+        cache.set(("Author", "id", author_id), {"id": author_id, "first_name": "Лев", "last_name": "Толстой-мл."})
+        writer.rollback()
+        
+        assert cache.get(("Author", "id", author_id)) is None
+        assert AuthorRepository(session_factory()).find_by_id(author_id).last_name == "Толстой"
+
+class TestAsyncRepositoryEntityCache:
+    @pytest.fixture
+    def cache(self):
+        cache = LRUCache(maxsize=100, ttl=60)
+        with patch("repositories.entity_cache.get_entity_cache", return_value=cache):
+            yield cache
+    
+    @pytest_asyncio.fixture
+    async def engines(self, tmp_path):
+        # Одна файловая БД: асинхронные записи и синхронные чтения, как в приложении
+        path = tmp_path / "library.db"
+        sync_engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=sync_engine)
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        yield sessionmaker(bind=sync_engine, expire_on_commit=False), async_sessionmaker(async_engine, expire_on_commit=False)
+        await async_engine.dispose()
+        sync_engine.dispose()
+    
+    @pytest.mark.asyncio
+    async def test_async_user_writes_should_invalidate_sync_lookups(self, cache, engines):
+        session_factory, async_session_factory = engines
+        user = self._save_user(session_factory)
+        UserRepository(session_factory()).find_by_email("old@library.com")
+        
+        async with async_session_factory() as db:
+            await AsyncUserRepository(db).update(user.id, {"email": "new@library.com"})
+            await db.commit()
+        assert UserRepository(session_factory()).find_by_email("old@library.com") is None
+        assert UserRepository(session_factory()).find_by_id(user.id).email == "new@library.com"
+        
+        async with async_session_factory() as db:
+            assert await AsyncUserRepository(db).delete_by_id(user.id) is True
+            await db.commit()
+        assert UserRepository(session_factory()).find_by_id(user.id) is None
+        assert UserRepository(session_factory()).find_by_email("new@library.com") is None
+    
+    @pytest.mark.asyncio
+    async def test_async_author_writes_should_invalidate_sync_lookups(self, cache, engines):
+        session_factory, async_session_factory = engines
+        session = session_factory()
+        with unit_of_work(session):
+            author_id = AuthorRepository(session).save(Author(first_name="Лев", last_name="Толстой")).id
+        AuthorRepository(session_factory()).find_by_id(author_id)
+        
+        async with async_session_factory() as db:
+            await AsyncAuthorRepository(db).update(author_id, {"last_name": "Толстой-мл."})
+            await db.commit()
+        assert AuthorRepository(session_factory()).find_by_id(author_id).last_name == "Толстой-мл."
+        
+        async with async_session_factory() as db:
+            assert await AsyncAuthorRepository(db).delete_by_id(author_id) is True
+            await db.commit()
+        assert AuthorRepository(session_factory()).find_by_id(author_id) is None
+    
+    def _save_user(self, session_factory):
+        session = session_factory()
+        with unit_of_work(session):
+            return UserRepository(session).save(User(email="old@library.com", password="x", first_name="Test", last_name="User"))
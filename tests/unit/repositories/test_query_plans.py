@@ -0,0 +1,130 @@
+import re
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from config.database import Base, create_db_engine
+from config.migrations import upgrade
+from models.author import Author
+from models.book import Book
+from models.category import Category
+from models.loan import Loan, LoanStatus
+from models.user import User
+from repositories.author_repository import AuthorRepository
+from repositories.book_repository import BookRepository
+from repositories.category_repository import CategoryRepository
+from repositories.loading import SELECTIN, JOINED
+from repositories.loan_repository import LoanRepository
+from repositories.pagination import encode_cursor
+from repositories.user_repository import UserRepository
+
+_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+# Каждый запрос, который репозитории выполняют на горячем пути, должен идти
+# по индексу. Сознательно не проверяются: find_all и выгрузки (читают всё),
+# поиск подстроки через ILIKE '%...%' (B-tree индекс тут не поможет — для
+# названий есть search_by_title) и find_authors_with_books.
+CASES = {
+    "book.find_by_id": lambda db: BookRepository(db, JOINED).find_by_id(1),
+    "book.find_by_isbn": lambda db: BookRepository(db, JOINED).find_by_isbn("978-0-00-000001-0"),
+    "book.find_by_author_id": lambda db: BookRepository(db, SELECTIN).find_by_author_id(1),
+    "book.find_by_category_id": lambda db: BookRepository(db, SELECTIN).find_by_category_id(1),
+    "book.find_available_books": lambda db: BookRepository(db, SELECTIN).find_available_books(),
+    "book.find_page": lambda db: BookRepository(db, SELECTIN).find_page(10, encode_cursor(5)),
+    "book.find_overdue_page": lambda db: BookRepository(db, SELECTIN).find_overdue_page(10, encode_cursor(1)),
+    "book.find_rows_page": lambda db: BookRepository(db).find_rows_page(10, encode_cursor(5)),
+    "book.find_rows_by_author_id": lambda db: BookRepository(db).find_rows_by_author_id(1),
+    "book.find_overdue_rows_page": lambda db: BookRepository(db).find_overdue_rows_page(10, encode_cursor(1)),
+    "book.search_by_title": lambda db: BookRepository(db).search_by_title("книга"),
+    "book.find_by_ids_or_isbns": lambda db: BookRepository(db, JOINED).find_by_ids_or_isbns([1, 2], ["978-0-00-000003-0"]),
+    "book.find_existing_isbns": lambda db: BookRepository(db).find_existing_isbns(["978-0-00-000001-0"]),
+    "book.delete_by_id": lambda db: BookRepository(db).delete_by_id(20),
+    "author.find_by_id": lambda db: AuthorRepository(db).find_by_id(1),
+    "author.find_page": lambda db: AuthorRepository(db).find_page(10, encode_cursor(1)),
+    "author.find_existing_ids": lambda db: AuthorRepository(db).find_existing_ids([1, 2]),
+    "author.count_books_by_author_id": lambda db: AuthorRepository(db).count_books_by_author_id(1),
+    "author.find_stats_page": lambda db: AuthorRepository(db).find_stats_page(10, encode_cursor(1)),
+    "user.find_by_id": lambda db: UserRepository(db).find_by_id(1),
+    "user.find_by_email": lambda db: UserRepository(db).find_by_email("reader1@library.com"),
+    "user.find_page": lambda db: UserRepository(db).find_page(10, encode_cursor(1)),
+    "user.find_users_with_active_loans": lambda db: UserRepository(db).find_users_with_active_loans(),
+    "category.find_by_id": lambda db: CategoryRepository(db).find_by_id(1),
+    "category.find_by_name": lambda db: CategoryRepository(db).find_by_name("Категория 1"),
+    "loan.find_by_id": lambda db: LoanRepository(db).find_by_id(1),
+    "loan.find_open_by_user_id": lambda db: LoanRepository(db).find_open_by_user_id(1),
+    "loan.mark_overdue_batch": lambda db: LoanRepository(db).mark_overdue_batch(datetime.utcnow(), 10),
+    "loan.checkout": lambda db: LoanRepository(db).checkout(2, 2, datetime.utcnow(), datetime.utcnow()),
+}
+
+
+class TestQueryPlans:
+    @pytest.fixture
+    def engine(self):
+        # Схема строится миграциями, а не create_all: проверяются именно их индексы
+        engine = create_db_engine("sqlite://")
+        upgrade(engine)
+        session = sessionmaker(bind=engine)()
+        now = datetime.utcnow()
+        session.add_all([Author(id=i, first_name="Имя", last_name=f"Фамилия {i}") for i in range(1, 4)])
+        session.add_all([Category(id=i, name=f"Категория {i}") for i in range(1, 4)])
+        session.add_all([
+            Book(id=i, title=f"Книга {i}", isbn=f"978-0-00-{i:06d}-0", publication_date=date(2000, 1, 1),
+                 available_copies=i % 3, author_id=i % 3 + 1, category_id=i % 3 + 1)
+            for i in range(1, 21)
+        ])
+        session.add_all([User(id=i, email=f"reader{i}@library.com", password="x", first_name="Reader",
+                              last_name=str(i)) for i in range(1, 4)])
+        session.add_all([
+            Loan(book_id=1, user_id=1, loan_date=now, due_date=now - timedelta(days=1), status=LoanStatus.ACTIVE),
+            Loan(book_id=2, user_id=2, loan_date=now, due_date=now + timedelta(days=1), status=LoanStatus.ACTIVE),
+            Loan(book_id=3, user_id=1, loan_date=now, due_date=now - timedelta(days=3), status=LoanStatus.OVERDUE),
+        ])
+        session.commit()
+        session.close()
+        yield engine
+        engine.dispose()
+    
+    def _capture(self, engine, action) -> list:
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH", "UPDATE", "DELETE")):
+                statements.append((statement, parameters))
+        
+        event.listen(engine, "before_cursor_execute", record)
+        session = sessionmaker(bind=engine, autoflush=False)()
+        try:
+            action(session)
+        finally:
+            session.close()
+            event.remove(engine, "before_cursor_execute", record)
+        return statements
+    
+    def _full_scans(self, engine, statement, parameters) -> list:
+        tables = set(Base.metadata.tables)
+        with engine.connect() as connection:
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        scans = []
+        for row in plan:
+            match = _SCAN.match(row[-1])
+            # Псевдонимы SQLAlchemy вида books_1 относятся к той же таблице
+            if match and re.sub(r"_\d+$", "", match.group(1)) in tables:
+                scans.append(row[-1])
+        return scans
+    
+    @pytest.mark.parametrize("name", sorted(CASES))
+    def test_repository_query_should_not_scan_whole_table(self, engine, name):
+        statements = self._capture(engine, CASES[name])
+        assert statements, f"{name} issued no SQL"
+        
+        for statement, parameters in statements:
+            scans = self._full_scans(engine, statement, parameters)
+            assert not scans, f"{name}: {scans} in\n{statement}"
+    
+    def test_migrations_should_match_models(self, engine):
+        from alembic.autogenerate import compare_metadata
+        from alembic.migration import MigrationContext
+        with engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+        assert diff == []
@@ -44,11 +44,11 @@ class TestAuthService:
             first_name="Test",
             last_name="User"
         )
-        mock_user_service.find_by_email.return_value = sample_user
+        mock_user_service.find_credentials_by_email.return_value = sample_user
         auth_service.user_service = mock_user_service
         result = auth_service.authenticate_user("test@library.com", "password123")
         assert result == sample_user
-        mock_user_service.find_by_email.assert_called_once_with("test@library.com")
+        mock_user_service.find_credentials_by_email.assert_called_once_with("test@library.com")
     
     def test_authenticate_user_with_incorrect_password_should_return_none(self, auth_service):
 
@@ -59,7 +59,7 @@ class TestAuthService:
             first_name="Test",
             last_name="User"
         )
-        mock_user_service.find_by_email.return_value = sample_user
+        mock_user_service.find_credentials_by_email.return_value = sample_user
         auth_service.user_service = mock_user_service
         
         result = auth_service.authenticate_user("test@library.com", "wrongpassword")
@@ -68,7 +68,7 @@ class TestAuthService:
     
     def test_authenticate_user_with_nonexistent_email_should_return_none(self, auth_service):
         mock_user_service = Mock()
-        mock_user_service.find_by_email.return_value = None
+        mock_user_service.find_credentials_by_email.return_value = None
         auth_service.user_service = mock_user_service
         result = auth_service.authenticate_user("nonexistent@library.com", "password123")
         assert result is None
@@ -84,4 +84,39 @@ class TestAuthService:
         token = auth_service.create_access_token(data)
         token_data = auth_service.verify_token(token)
         assert token_data.email == "test@library.com"
-        assert token_data.user_id == 1
\ No newline at end of file
+        assert token_data.user_id == 1    
+    def test_authenticate_user_with_legacy_hash_should_upgrade_it(self, auth_service):
+        from config.passwords import library_sha256
+        mock_user_service = Mock()
+        sample_user = User(
+            email="test@library.com",
+            password=library_sha256.hash("password123"),
+            first_name="Test",
+            last_name="User"
+        )
+        sample_user.id = 1
+        mock_user_service.find_credentials_by_email.return_value = sample_user
+        mock_user_service.rehash_password.return_value = sample_user
+        auth_service.user_service = mock_user_service
+        
+        assert auth_service.authenticate_user("test@library.com", "password123") == sample_user
+        user, new_hash = mock_user_service.rehash_password.call_args.args
+        assert user is sample_user
+        assert new_hash.startswith("$2b$")
+        assert auth_service.verify_password("password123", new_hash) is True
+    
+    def test_authenticate_user_with_current_hash_should_not_rewrite_it(self, auth_service):
+        mock_user_service = Mock()
+        mock_user_service.find_credentials_by_email.return_value = User(
+            email="test@library.com",
+            password=auth_service.get_password_hash("password123"),
+            first_name="Test",
+            last_name="User"
+        )
+        auth_service.user_service = mock_user_service
+        
+        assert auth_service.authenticate_user("test@library.com", "password123") is not None
+        mock_user_service.rehash_password.assert_not_called()
+    
+    def test_verify_password_with_unknown_hash_format_should_return_false(self, auth_service, sample_user):
+        assert auth_service.verify_password("password", sample_user.password) is False
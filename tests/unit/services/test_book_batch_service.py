@@ -0,0 +1,141 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.book import Book
+from models.category import Category
+from repositories.book_repository import BookRepository
+from services.book_batch_service import BookBatchService
+from config.database import Base
+
+
+class TestBookBatchService:
+    @pytest.fixture(scope="function")
+    def engine(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        yield engine
+        Base.metadata.drop_all(bind=engine)
+    
+    @pytest.fixture(scope="function")
+    def db_session(self, engine):
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        session.add_all([
+            Author(id=1, first_name="Лев", last_name="Толстой"),
+            Category(id=1, name="Художественная литература"),
+            Book(id=1, title="Война и мир", isbn="978-5-17-123456-7", available_copies=5, author_id=1, category_id=1),
+            Book(id=2, title="Анна Каренина", isbn="978-5-17-000001-1", available_copies=1, author_id=1),
+        ])
+        session.commit()
+        yield session
+        session.close()
+    
+    def test_get_many_should_resolve_ids_and_isbns_in_request_order(self, engine, db_session):
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", record)
+        result = BookBatchService(db_session).get_many([2, 99, 2], ["978-5-17-123456-7", "978-0-00-000000-0"])
+        event.remove(engine, "before_cursor_execute", record)
+        
+        assert [book.id for book in result.items] == [2, 1]
+        assert result.items[1].author.last_name == "Толстой"
+        assert result.missing_ids == [99]
+        assert result.missing_isbns == ["978-0-00-000000-0"]
+        assert len(statements) == 1
+    
+    def test_create_many_should_write_valid_items_and_report_the_rest(self, db_session):
+        report = BookBatchService(db_session).create_many([
+            {"title": "Воскресение", "isbn": "978-5-17-000002-2", "available_copies": 2, "author_id": 1},
+            {"title": "Дубликат", "isbn": "978-5-17-000002-2", "available_copies": 2, "author_id": 1},
+            {"title": "Существующая", "isbn": "978-5-17-123456-7", "available_copies": 1, "author_id": 1},
+            {"title": "Без автора", "isbn": "978-5-17-000003-3", "available_copies": 1, "author_id": 99},
+            {"title": "", "isbn": "978-5-17-000004-4", "available_copies": 1, "author_id": 1},
+            "not an object",
+        ])
+        
+        assert (report.succeeded, report.failed) == (1, 5)
+        assert [result.status for result in report.results] == ["created"] + ["error"] * 5
+        created = db_session.get(Book, report.results[0].id)
+        assert created.title == "Воскресение"
+        assert "Duplicate ISBN" in report.results[1].errors[0]
+        assert "already exists" in report.results[2].errors[0]
+        assert "author with ID 99" in report.results[3].errors[0]
+        assert [b.id for b in BookRepository(db_session).search_by_title("воскресение")] == [created.id]
+    
+    def test_update_many_should_apply_changes_in_one_transaction(self, db_session):
+        report = BookBatchService(db_session).update_many([
+            {"id": 1, "available_copies": 7},
+            {"id": 2, "title": "Анна Каренина (2-е изд.)", "category_id": 1},
+            {"id": 1, "available_copies": 3},
+            {"id": 99, "available_copies": 1},
+            {"id": 2, "isbn": "978-5-17-123456-7"},
+            {"available_copies": 1},
+        ])
+        
+        assert (report.succeeded, report.failed) == (2, 4)
+        assert [result.status for result in report.results[:2]] == ["updated", "updated"]
+        assert "Duplicate book ID 1" in report.results[2].errors[0]
+        assert "not found" in report.results[3].errors[0]
+        db_session.expire_all()
+        assert db_session.get(Book, 1).available_copies == 7
+        assert db_session.get(Book, 2).category_id == 1
+        assert "Duplicate book ID 2" in report.results[4].errors[0]
+        assert [b.id for b in BookRepository(db_session).search_by_title("изд")] == [2]
+    
+    def test_update_many_should_reject_isbn_owned_by_another_book(self, db_session):
+        report = BookBatchService(db_session).update_many([{"id": 2, "isbn": "978-5-17-123456-7"}])
+        assert report.failed == 1
+        assert "already exists" in report.results[0].errors[0]
+        assert report.results[0].id == 2
+    
+    def test_update_many_should_allow_isbn_swap_within_batch(self, db_session):
+        report = BookBatchService(db_session).update_many([
+            {"id": 1, "isbn": "978-5-17-000001-1"},
+            {"id": 2, "isbn": "978-5-17-123456-7"},
+        ])
+        
+        assert (report.succeeded, report.failed) == (2, 0)
+        db_session.expire_all()
+        assert db_session.get(Book, 1).isbn == "978-5-17-000001-1"
+        assert db_session.get(Book, 2).isbn == "978-5-17-123456-7"
+    
+    def test_update_many_should_keep_isbn_taken_when_its_owner_is_rejected(self, db_session):
+        report = BookBatchService(db_session).update_many([
+            {"id": 1, "isbn": "978-5-17-000001-1"},
+            {"id": 2, "isbn": "978-5-17-123456-7", "author_id": 99},
+        ])
+        
+        assert (report.succeeded, report.failed) == (0, 2)
+        assert "already exists" in report.results[0].errors[0]
+        assert "author with ID 99" in report.results[1].errors[0]
+        db_session.expire_all()
+        assert db_session.get(Book, 1).isbn == "978-5-17-123456-7"
+    
+    def test_rejected_batch_should_roll_back_and_report_every_item(self, db_session, monkeypatch):
+        def reject(self, rows):
+            raise IntegrityError("INSERT INTO books", {}, Exception("constraint failed"))
+        
+        monkeypatch.setattr(BookRepository, "bulk_insert", reject)
+        report = BookBatchService(db_session).create_many([
+            {"title": "Воскресение", "isbn": "978-5-17-000002-2", "available_copies": 2, "author_id": 1},
+            {"title": "Хаджи-Мурат", "isbn": "978-5-17-000003-3", "available_copies": 1, "author_id": 1},
+        ])
+        
+        assert (report.succeeded, report.failed) == (0, 2)
+        assert all("Batch rejected by database: IntegrityError" in result.errors[0] for result in report.results)
+        assert db_session.get(Book, 1).title == "Война и мир"
+    
+    def test_batch_writes_should_leave_commit_to_caller(self, db_session):
+        service = BookBatchService(db_session)
+        service.create_many([{"title": "Воскресение", "isbn": "978-5-17-000002-2", "available_copies": 2, "author_id": 1}])
+        service.update_many([{"id": 1, "available_copies": 9}])
+        
+        # Коммитит маршрут: откат вызывающего убирает обе записи
+        db_session.rollback()
+        assert db_session.get(Book, 1).available_copies == 5
+        assert BookRepository(db_session).find_by_isbn("978-5-17-000002-2") is None
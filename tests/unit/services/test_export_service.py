@@ -0,0 +1,59 @@
+import csv
+import io
+import json
+import pytest
+from datetime import date
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.book import Book
+from models.category import Category
+from models.user import User
+from services.export_service import ExportService, NDJSON, CSV
+from config.database import Base
+
+
+class TestExportService:
+    @pytest.fixture(scope="function")
+    def db_session(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        session.add_all([
+            Author(id=1, first_name="Лев", last_name="Толстой"),
+            Category(id=1, name="Художественная литература"),
+            Book(title="Война и мир", isbn="978-5-17-123456-7", publication_date=date(1869, 1, 1),
+                 available_copies=5, author_id=1, category_id=1),
+            Book(title="Анна Каренина", isbn="978-5-17-123458-1", available_copies=2, author_id=1),
+            User(email="test@library.com", password="secret-hash", first_name="Test", last_name="User"),
+        ])
+        session.commit()
+        yield session
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+    
+    def test_export_books_ndjson_should_stream_one_chunk_per_batch(self, db_session):
+        chunks = list(ExportService(db_session, batch_size=1).export_books(NDJSON))
+        assert len(chunks) == 2
+        
+        rows = [json.loads(line) for line in "".join(chunks).splitlines()]
+        assert rows[0]["author_last_name"] == "Толстой"
+        assert rows[0]["category_name"] == "Художественная литература"
+        assert rows[0]["publication_date"] == "1869-01-01"
+        assert rows[1]["category_name"] is None
+    
+    def test_export_books_csv_should_write_header_once(self, db_session):
+        content = "".join(ExportService(db_session, batch_size=1).export_books(CSV))
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert [row["title"] for row in rows] == ["Война и мир", "Анна Каренина"]
+    
+    def test_export_users_should_not_include_password(self, db_session):
+        content = "".join(ExportService(db_session).export_users(NDJSON))
+        row = json.loads(content)
+        assert row["email"] == "test@library.com"
+        assert "password" not in row
+    
+    def test_unknown_format_should_raise_value_error(self, db_session):
+        with pytest.raises(ValueError):
+            ExportService(db_session).export_authors("xml")
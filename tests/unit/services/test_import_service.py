@@ -0,0 +1,63 @@
+import io
+import json
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.book import Book
+from models.category import Category
+from repositories.book_repository import BookRepository
+from services.import_service import ImportService, read_rows, CSV, JSONL
+from config.database import Base
+
+
+class TestImportService:
+    @pytest.fixture(scope="function")
+    def db_session(self):
+        engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        session.add_all([
+            Author(id=1, first_name="Лев", last_name="Толстой"),
+            Category(id=1, name="Художественная литература"),
+            Book(title="Война и мир", isbn="978-5-17-123456-7", available_copies=5, author_id=1, category_id=1),
+        ])
+        session.commit()
+        yield session
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+    
+    def test_import_books_from_csv_should_insert_valid_rows_and_report_errors(self, db_session):
+        csv_data = (
+            "title,isbn,publication_date,available_copies,author_id,category_id\n"
+            "Анна Каренина,978-5-17-000001-1,1877-01-01,3,1,1\n"
+            "Воскресение,978-5-17-000002-2,,2,1,\n"
+            "Дубликат,978-5-17-000002-2,,2,1,\n"
+            "Существующая,978-5-17-123456-7,,1,1,\n"
+            "Без автора,978-5-17-000003-3,,1,99,\n"
+            ",978-5-17-000004-4,,1,1,\n"
+        )
+        report = ImportService(db_session, chunk_size=2).import_books(read_rows(io.StringIO(csv_data), CSV))
+        
+        assert report.imported == 2
+        assert report.failed == 4
+        assert [error.row for error in report.errors] == [3, 4, 5, 6]
+        assert "already exists" in report.errors[1].errors[0]
+        assert "author" in report.errors[2].errors[0]
+        assert db_session.query(Book).count() == 3
+    
+    def test_imported_books_should_be_searchable(self, db_session):
+        rows = json.dumps({"title": "Анна Каренина", "isbn": "978-5-17-000001-1", "available_copies": 1, "author_id": 1})
+        ImportService(db_session).import_books(read_rows(io.StringIO(rows + "\n"), JSONL))
+        
+        books = BookRepository(db_session).search_by_title("каренина")
+        assert [book.title for book in books] == ["Анна Каренина"]
+    
+    def test_import_authors_from_jsonl_should_report_malformed_lines(self, db_session):
+        jsonl = '{"first_name": "Фёдор", "last_name": "Достоевский"}\n\nnot json\n{"first_name": " "}\n'
+        report = ImportService(db_session).import_authors(read_rows(io.StringIO(jsonl), JSONL))
+        
+        assert report.imported == 1
+        assert [error.row for error in report.errors] == [2, 3]
+        assert db_session.query(Author).count() == 2
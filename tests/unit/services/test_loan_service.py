@@ -0,0 +1,149 @@
+import re
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import Barrier
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from models.author import Author
+from models.book import Book
+from models.loan import Loan, LoanStatus
+from models.user import User
+from services.loan_service import LoanService
+from config.database import Base, create_db_engine
+from config.unit_of_work import unit_of_work
+
+WRITE_TARGET = re.compile(r"^\s*(?:UPDATE|INSERT INTO|DELETE FROM)\s+(\w+)", re.IGNORECASE)
+
+
+class TestLoanService:
+    COPIES = 5
+    THREADS = 24
+    
+    @pytest.fixture
+    def session_factory(self, tmp_path):
+        # Файловая SQLite с WAL и busy_timeout: у каждого потока своё соединение
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'loans.db'}", pool_size=self.THREADS, max_overflow=0)
+        Base.metadata.create_all(bind=engine)
+        factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        
+        session = factory()
+        session.add_all([
+            Author(id=1, first_name="Лев", last_name="Толстой"),
+            Book(id=1, title="Война и мир", isbn="978-5-17-123456-7", available_copies=self.COPIES, author_id=1),
+        ])
+        session.add_all([
+            User(id=i, email=f"reader{i}@library.com", password="x", first_name="Reader", last_name=str(i))
+            for i in range(1, self.THREADS + 1)
+        ])
+        session.commit()
+        session.close()
+        yield factory
+        engine.dispose()
+    
+    def _checkout(self, factory, barrier, user_id):
+        session = factory()
+        try:
+            barrier.wait()
+            with unit_of_work(session):
+                loan = LoanService(session).checkout(book_id=1, user_id=user_id)
+            return loan.id if loan else None
+        finally:
+            session.close()
+    
+    def test_concurrent_checkouts_should_never_oversell(self, session_factory):
+        # SQLite пускает одного писателя за раз: тест проверяет только отсутствие
+        # перепродажи, порядок блокировок проверяется отдельно ниже
+        barrier = Barrier(self.THREADS)
+        with ThreadPoolExecutor(max_workers=self.THREADS) as executor:
+            results = list(executor.map(
+                lambda user_id: self._checkout(session_factory, barrier, user_id),
+                range(1, self.THREADS + 1)
+            ))
+        
+        session = session_factory()
+        assert sum(1 for loan_id in results if loan_id) == self.COPIES
+        assert session.get(Book, 1).available_copies == 0
+        assert session.query(Loan).filter(Loan.status == LoanStatus.ACTIVE).count() == self.COPIES
+        session.close()
+    
+    def _write_order(self, session, action):
+        """Таблицы, в которые пишет action, в порядке выполнения запросов."""
+        tables = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            match = WRITE_TARGET.match(statement)
+            if match:
+                tables.append(match.group(1))
+        
+        engine = session.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            action()
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        return tables
+    
+    def test_checkout_and_return_should_lock_rows_in_one_order(self, session_factory):
+        # Без строковых блокировок в SQLite взаимоблокировку не воспроизвести; вместо этого
+        # проверяем, что общие строки (книга, затем её автор) захватываются в одном порядке
+        session = session_factory()
+        loan_service = LoanService(session)
+        with unit_of_work(session):
+            checkout = self._write_order(session, lambda: loan_service.checkout(book_id=1, user_id=1))
+        loan = session.query(Loan).one()
+        with unit_of_work(session):
+            returned = self._write_order(session, lambda: loan_service.return_loan(loan))
+        
+        # Выдача сначала списывает экземпляр и лишь потом создаёт займ
+        assert checkout[0] == "books" and checkout[-1] == "loans"
+        # Возврат захватывает строку займа, затем книгу
+        assert returned[:2] == ["loans", "books"]
+        shared = [table for table in checkout if table in ("books", "authors")]
+        assert [table for table in returned if table in ("books", "authors")] == shared
+        session.close()
+    
+    def test_return_should_restore_copy_only_once(self, session_factory):
+        session = session_factory()
+        loan_service = LoanService(session)
+        loan = loan_service.checkout(book_id=1, user_id=1)
+        assert session.get(Book, 1).available_copies == self.COPIES - 1
+        
+        assert loan_service.return_loan(loan) is True
+        assert loan.status == LoanStatus.RETURNED
+        assert loan.return_date is not None
+        assert loan_service.return_loan(loan) is False
+        
+        session.expire_all()
+        assert session.get(Book, 1).available_copies == self.COPIES
+        session.close()
+    
+    def test_checkout_without_copies_should_return_none(self, session_factory):
+        session = session_factory()
+        session.get(Book, 1).available_copies = 0
+        session.commit()
+        assert LoanService(session).checkout(book_id=1, user_id=1) is None
+        assert session.query(Loan).count() == 0
+        session.close()
+    
+    def test_sweep_overdue_should_mark_expired_loans_in_batches(self, session_factory):
+        session = session_factory()
+        now = datetime.utcnow()
+        session.add_all([
+            Loan(book_id=1, user_id=user_id, loan_date=now - timedelta(days=30),
+                 due_date=now - timedelta(days=user_id), status=LoanStatus.ACTIVE)
+            for user_id in range(1, 6)
+        ] + [
+            Loan(book_id=1, user_id=6, loan_date=now, due_date=now + timedelta(days=14), status=LoanStatus.ACTIVE),
+            Loan(book_id=1, user_id=7, loan_date=now - timedelta(days=30), due_date=now - timedelta(days=1),
+                 return_date=now, status=LoanStatus.RETURNED),
+        ])
+        session.commit()
+        
+        assert LoanService(session).sweep_overdue(batch_size=2) == 5
+        assert session.query(Loan).filter(Loan.status == LoanStatus.OVERDUE).count() == 5
+        assert session.query(Loan).filter(Loan.status == LoanStatus.ACTIVE).count() == 1
+        assert session.query(Loan).filter(Loan.status == LoanStatus.RETURNED).count() == 1
+        assert LoanService(session).sweep_overdue(batch_size=2) == 0
+        session.close()